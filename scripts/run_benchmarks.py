@@ -0,0 +1,59 @@
+import argparse
+import sys
+
+from stockscope.benchmark import (
+    BENCHMARKS,
+    DEFAULT_SCALES,
+    compare,
+    format_results,
+    load_results,
+    run_benchmarks,
+    save_results,
+)
+
+
+def parse_scale(text):
+    tickers, bars = text.lower().split("x")
+    return int(tickers), int(bars)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time and memory-profile stockscope on synthetic universes.")
+    parser.add_argument("--scale", action="append", type=parse_scale, metavar="TICKERSxBARS",
+                        help="universe size, e.g. 500x2520 (repeatable; default: %s)"
+                        % ", ".join(f"{t}x{b}" for t, b in DEFAULT_SCALES))
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), help="run only these benchmarks")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--nan-density", type=float, default=0.01)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc run")
+    parser.add_argument("--output", help="write results to this JSON file")
+    parser.add_argument("--baseline", help="JSON results to compare against; regressions exit with status 1")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown vs baseline (0.25 = 25%%)")
+    parser.add_argument("--memory-tolerance", type=float, default=0.25)
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(
+        scales=args.scale or DEFAULT_SCALES,
+        names=args.only,
+        repeat=args.repeat,
+        nan_density=args.nan_density,
+        seed=args.seed,
+        memory=not args.no_memory,
+    )
+    comparisons = None
+    if args.baseline:
+        comparisons = compare(results, load_results(args.baseline), args.tolerance, args.memory_tolerance)
+    print(format_results(results, comparisons))
+    if args.output:
+        save_results(results, args.output, meta={"repeat": args.repeat, "nan_density": args.nan_density, "seed": args.seed})
+
+    regressed = [c.key for c in comparisons or [] if c.regressed]
+    if regressed:
+        print(f"\n{len(regressed)} regression(s) vs baseline: {', '.join(regressed)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
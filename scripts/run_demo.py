@@ -1,24 +1,29 @@
 from stockscope.fetch import get_prices
+from stockscope.frame import PriceFrame
 from stockscope.indicators import daily_returns, sma, rsi
-from stockscope.risk import volatility, max_drawdown, value_at_risk
+from stockscope.risk import volatility, max_drawdown, value_at_risk, drawdown_stats
 from stockscope.portfolio import normalize_weights, buy_and_hold_value, portfolio_returns
 from stockscope.plotting import plot_price_with_sma, plot_drawdown
 
 def main():
     tickers = ["AAPL", "MSFT", "GOOGL"]
-    prices = get_prices(tickers, start="2024-01-01", end="2024-12-31", interval="1d")
+    # Validated once; returns and other derived results are computed once and reused
+    prices = PriceFrame(get_prices(tickers, start="2024-01-01", end="2024-12-31", interval="1d"))
 
     # Indicators
     rets = daily_returns(prices)
     print("\nAnnualized volatility (252 trading days):")
     print(volatility(rets, annualize=True))
 
+    print("\nWorst drawdown per ticker:")
+    print(drawdown_stats(prices))
+
     # Risk + plotting for one ticker
     aapl = prices["AAPL"].dropna()
     dd = max_drawdown(aapl)
     print("\nAAPL worst drawdown:", float(dd.min()))
 
-    aapl_rets = daily_returns(aapl).dropna()
+    aapl_rets = rets["AAPL"].dropna()
     print("AAPL historical VaR(5%):", value_at_risk(aapl_rets, level=0.05))
 
     plot_price_with_sma(aapl, window=20, title="AAPL Price + 20D SMA")
@@ -31,6 +36,7 @@ def main():
 
     print("\nPortfolio final value:", float(port_val.iloc[-1]))
     print("Portfolio annualized volatility:", float(volatility(port_rets, annualize=True)))
+    print("\nDerived-result cache:", prices.cache_info())
 
 if __name__ == "__main__":
     main()
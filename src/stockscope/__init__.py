@@ -0,0 +1,73 @@
+"""
+stockscope: stock price data, indicators, risk and portfolio analysis.
+
+The names below are available directly on the package
+(`stockscope.get_prices`, `stockscope.volatility`, ...). Submodules and
+their dependencies are imported on first use, so `import stockscope` is
+cheap; pandas loads with the first function that needs it, yfinance only
+when the yfinance provider downloads and matplotlib only when plotting.
+"""
+from __future__ import annotations
+
+import importlib
+from typing import Any, Dict, List
+
+from .exceptions import DataDownloadError, EmptyDataError, InvalidInputError, StockScopeError
+
+__version__ = "0.1.0"
+
+_EXPORTS: Dict[str, List[str]] = {
+    "fetch": ["get_prices", "get_prices_batch", "get_ohlcv", "get_prices_async", "AsyncPriceFetcher", "BatchResult"],
+    "providers": ["PriceProvider", "YFinanceProvider", "LocalFileProvider", "SyntheticProvider"],
+    "cache": ["PriceCache"],
+    "panel": ["OHLCVPanel"],
+    "frame": ["PriceFrame"],
+    "store": ["PriceStore"],
+    "options": ["get_option", "set_option", "reset_option", "option_context"],
+    "indicators": ["daily_returns", "log_returns", "sma", "ema", "rsi", "compute_indicators"],
+    "risk": ["volatility", "max_drawdown", "value_at_risk", "drawdown_stats", "drawdown_episodes"],
+    "rolling": ["rolling_volatility", "rolling_value_at_risk", "rolling_drawdown", "rolling_max_drawdown"],
+    "tailrisk": ["parametric_var", "expected_shortfall", "monte_carlo_var"],
+    "portfolio": [
+        "normalize_weights",
+        "portfolio_returns",
+        "buy_and_hold_value",
+        "normalize_weight_matrix",
+        "evaluate_portfolios",
+        "portfolio_volatility",
+    ],
+    # `covariance()` and `backtest()` share their submodule's name, which wins once the
+    # submodule is imported: use stockscope.covariance.covariance / stockscope.backtest.backtest
+    "covariance": ["correlation", "ledoit_wolf", "CovarianceTracker"],
+    "optimize": ["min_variance", "max_sharpe", "risk_parity", "efficient_frontier"],
+    "backtest": ["BacktestResult"],
+    "incremental": ["IncrementalMetrics"],
+    "pipeline": ["Pipeline"],
+    "plotting": ["plot_price", "plot_price_with_sma", "plot_drawdown", "render_charts"],
+}
+
+_SUBMODULES = [
+    "backtest", "benchmark", "cache", "covariance", "exceptions", "fetch", "frame", "incremental", "indicators",
+    "kernels", "online", "optimize", "options", "panel", "pipeline", "plotting", "portfolio", "providers",
+    "resample", "risk", "rolling", "store", "streaming", "synthetic", "tailrisk", "utils",
+]
+
+_LOCATION = {name: module for module, names in _EXPORTS.items() for name in names}
+
+__all__ = ["StockScopeError", "InvalidInputError", "DataDownloadError", "EmptyDataError"] + list(_LOCATION)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LOCATION:
+        value = getattr(importlib.import_module(f".{_LOCATION[name]}", __name__), name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__) | set(_SUBMODULES))
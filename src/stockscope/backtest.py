@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from .exceptions import InvalidInputError
+from .frame import accepts_price_frame
+from .portfolio import normalize_weight_matrix, normalize_weights
+
+
+Weights = Union[Dict[str, float], pd.DataFrame]
+
+_CALENDAR_RULES = {"W": "W", "M": "M", "Q": "Q", "Y": "Y"}
+
+# Rows scanned per step when searching for the next threshold breach
+_THRESHOLD_BLOCK = 256
+
+
+@dataclass
+class BacktestResult:
+    value: pd.Series
+    turnover: pd.Series
+    costs: pd.Series
+    holdings: pd.DataFrame
+
+    @property
+    def total_turnover(self) -> float:
+        return float(self.turnover.sum())
+
+
+def _normalize_weight_frame(weights: pd.DataFrame) -> pd.DataFrame:
+    w = normalize_weight_matrix(weights)
+    w.index = pd.to_datetime(weights.index)
+    return w.sort_index()
+
+
+def _calendar_rows(index: pd.DatetimeIndex, rule: str) -> np.ndarray:
+    idx = index.tz_localize(None) if index.tz is not None else index
+    periods = idx.to_period(_CALENDAR_RULES[rule]).asi8
+    # First bar of every new period; row 0 is the initial allocation
+    return np.flatnonzero(np.r_[True, periods[1:] != periods[:-1]])
+
+
+def _threshold_rows(p: np.ndarray, w: np.ndarray, threshold: float) -> np.ndarray:
+    rows = [0]
+    start = 0
+    n = len(p)
+    while True:
+        nxt = None
+        lo = start + 1
+        while lo < n and nxt is None:
+            hi = min(n, lo + _THRESHOLD_BLOCK)
+            drift = w * (p[lo:hi] / p[start])
+            drift /= drift.sum(axis=1, keepdims=True)
+            breach = np.flatnonzero(np.abs(drift - w).max(axis=1) > threshold)
+            if len(breach):
+                nxt = lo + int(breach[0])
+            lo = hi
+        if nxt is None:
+            return np.asarray(rows)
+        rows.append(nxt)
+        start = nxt
+
+
+def _prepare(prices: pd.DataFrame, tickers: List[str]) -> pd.DataFrame:
+    missing = [t for t in tickers if t not in prices.columns]
+    if missing:
+        raise InvalidInputError(f"Missing tickers in price data: {missing}")
+    p = prices[tickers].dropna(how="all").ffill()
+    if p.empty:
+        raise InvalidInputError("prices are empty after dropping NaNs.")
+    if p.iloc[0].isna().any():
+        raise InvalidInputError("Cannot backtest: initial prices contain NaNs.")
+    return p
+
+
+@accepts_price_frame
+def backtest(
+    prices: pd.DataFrame,
+    weights: Weights,
+    rebalance: Optional[str] = "M",
+    threshold: float = 0.05,
+    cost_bps: float = 0.0,
+    initial_value: float = 10_000.0,
+) -> BacktestResult:
+    """
+    Vectorized rebalancing backtest.
+
+    weights: a dict of fixed target weights, or a DataFrame of target weights
+      (rows = dates); with a DataFrame the portfolio is rebalanced on each of
+      its dates (at the first price bar on or after it) and `rebalance` is ignored.
+    rebalance: None (buy and hold), "W", "M", "Q", "Y" (first bar of each
+      period) or "threshold" (whenever any weight drifts more than `threshold`
+      from its target).
+    cost_bps: proportional transaction cost in basis points of traded value,
+      including the initial allocation.
+
+    Between rebalances holdings are constant, so every bar is computed with
+    array operations; only the rebalance values are chained.
+    """
+    if not isinstance(prices, pd.DataFrame) or prices.empty:
+        raise InvalidInputError("prices must be a non-empty pandas DataFrame.")
+    try:
+        initial_value = float(initial_value)
+        cost = float(cost_bps) / 10_000.0
+    except Exception:
+        raise InvalidInputError("initial_value and cost_bps must be numeric.")
+    if initial_value <= 0:
+        raise InvalidInputError("initial_value must be > 0.")
+    if not (0 <= cost < 1):
+        raise InvalidInputError("cost_bps must be between 0 and 10000.")
+
+    if isinstance(weights, pd.DataFrame):
+        w_frame = _normalize_weight_frame(weights)
+        tickers = list(w_frame.columns)
+        p = _prepare(prices, tickers)
+        pos = np.minimum(p.index.searchsorted(w_frame.index), len(p) - 1)
+        # Later weights win when several dates map to the same bar
+        keep = np.r_[pos[1:] != pos[:-1], True]
+        rows, targets = pos[keep], w_frame.to_numpy()[keep]
+        if rows[0] != 0:
+            p = p.iloc[rows[0]:]
+            rows = rows - rows[0]
+    elif isinstance(weights, dict):
+        w = normalize_weights(weights)
+        tickers = list(w)
+        p = _prepare(prices, tickers)
+        w_vec = np.array([w[t] for t in tickers], dtype=float)
+        if rebalance is None:
+            rows = np.array([0])
+        elif rebalance == "threshold":
+            if not (0 < threshold < 1):
+                raise InvalidInputError("threshold must be between 0 and 1.")
+            rows = _threshold_rows(p.to_numpy(dtype=float), w_vec, threshold)
+        elif rebalance in _CALENDAR_RULES:
+            rows = _calendar_rows(p.index, rebalance)
+        else:
+            raise InvalidInputError(f"rebalance must be None, 'threshold' or one of {sorted(_CALENDAR_RULES)}.")
+        targets = np.broadcast_to(w_vec, (len(rows), len(w_vec)))
+    else:
+        raise InvalidInputError("weights must be a dict or a DataFrame of target weights.")
+
+    values, turnover, costs, shares = _simulate(p.to_numpy(dtype=float), rows, targets, initial_value, cost)
+    dates = p.index[rows]
+    return BacktestResult(
+        value=pd.Series(values, index=p.index, name="portfolio_value"),
+        turnover=pd.Series(turnover, index=dates, name="turnover"),
+        costs=pd.Series(costs, index=dates, name="costs"),
+        holdings=pd.DataFrame(shares, index=p.index, columns=tickers),
+    )
+
+
+def _simulate(
+    p: np.ndarray, rows: np.ndarray, targets: np.ndarray, initial_value: float, cost: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    n_rows = len(p)
+    seg = np.searchsorted(rows, np.arange(n_rows), side="right") - 1
+    base = p[rows]
+
+    # Growth of one unit invested at each rebalance, measured at the next rebalance
+    rel_next = p[rows[1:]] / base[:-1]
+    growth_pre = np.einsum("kn,kn->k", targets[:-1], rel_next)
+    drifted = targets[:-1] * rel_next / growth_pre[:, None]
+
+    turnover = np.empty(len(rows))
+    turnover[0] = targets[0].sum()
+    turnover[1:] = np.abs(targets[1:] - drifted).sum(axis=1)
+    keep = 1.0 - cost * turnover
+
+    # Portfolio value right after each rebalance (net of costs)
+    after = initial_value * np.cumprod(keep * np.r_[1.0, growth_pre])
+    before = np.r_[initial_value, after[:-1] * growth_pre]
+    costs = before * cost * turnover
+
+    shares = after[seg, None] * targets[seg] / base[seg]
+    values = np.einsum("tn,tn->t", shares, p)
+    return values, turnover, costs, shares
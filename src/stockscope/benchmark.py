@@ -0,0 +1,253 @@
+from __future__ import annotations
+
+import json
+import os
+import platform
+import statistics
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .exceptions import InvalidInputError
+from .fetch import get_prices
+from .indicators import compute_indicators, daily_returns, ema, rsi, sma
+from .portfolio import buy_and_hold_value, portfolio_returns
+from .providers import FieldFrames, PriceProvider
+from .risk import drawdown_stats, max_drawdown, value_at_risk, volatility
+from .synthetic import synthetic_ohlcv
+
+
+_FORMAT_VERSION = 1
+
+# (tickers, bars): a year of daily bars for a small watchlist, ten years for a mid-size universe
+DEFAULT_SCALES: Tuple[Tuple[int, int], ...] = ((50, 252), (500, 2520))
+
+
+def make_universe(
+    n_tickers: int,
+    n_bars: int,
+    nan_density: float = 0.01,
+    max_gap: int = 3,
+    seed: int = 0,
+    field: str = "Adj Close",
+) -> pd.DataFrame:
+    """Deterministic synthetic prices (business days x tickers T0000, T0001, ...) with gaps."""
+    if not isinstance(n_tickers, int) or n_tickers <= 0 or not isinstance(n_bars, int) or n_bars <= 1:
+        raise InvalidInputError("n_tickers must be >= 1 and n_bars >= 2.")
+    index = pd.bdate_range("2000-01-03", periods=n_bars)
+    tickers = [f"T{i:04d}" for i in range(n_tickers)]
+    frames = synthetic_ohlcv(tickers, index, seed=seed, fields=[field], nan_density=nan_density, max_gap=max_gap)
+    return frames[field]
+
+
+class _FrameProvider(PriceProvider):
+    """Serves pre-built frames so the fetch benchmark measures only the normalization in `get_prices`."""
+
+    name = "benchmark"
+
+    def __init__(self, prices: pd.DataFrame, field: str = "Adj Close") -> None:
+        # Raw provider output is unsorted with string dates, as it often comes from a download
+        raw = prices.iloc[::-1]
+        self._frames = {field: raw.set_axis(raw.index.strftime("%Y-%m-%d"), axis=0)}
+
+    def fetch(self, tickers, start, end, interval, fields) -> FieldFrames:
+        return {f: df for f, df in self._frames.items() if f in fields}
+
+
+@dataclass
+class BenchmarkCase:
+    """Everything a benchmark may need, built once per scale."""
+
+    prices: pd.DataFrame
+    returns: pd.DataFrame
+    weights: Dict[str, float]
+    port_returns: pd.Series
+    provider: PriceProvider
+
+    @classmethod
+    def build(cls, n_tickers: int, n_bars: int, nan_density: float = 0.01, seed: int = 0) -> "BenchmarkCase":
+        prices = make_universe(n_tickers, n_bars, nan_density=nan_density, seed=seed)
+        returns = daily_returns(prices)
+        weights = {t: 1.0 / n_tickers for t in prices.columns}
+        port = portfolio_returns(returns.fillna(0.0), weights)
+        return cls(prices, returns, weights, port, _FrameProvider(prices))
+
+
+# name -> function of a BenchmarkCase; each call is one timed run
+BENCHMARKS: Dict[str, Callable[[BenchmarkCase], Any]] = {
+    "daily_returns": lambda c: daily_returns(c.prices),
+    "sma": lambda c: sma(c.prices, 20),
+    "ema": lambda c: ema(c.prices, 20),
+    "rsi": lambda c: rsi(c.prices, 14),
+    "compute_indicators": lambda c: compute_indicators(c.prices, {"sma": [20, 50], "ema": [12], "rsi": [14]}),
+    "volatility": lambda c: volatility(c.returns),
+    "max_drawdown": lambda c: max_drawdown(c.prices),
+    "drawdown_stats": lambda c: drawdown_stats(c.prices),
+    "value_at_risk": lambda c: value_at_risk(c.port_returns),
+    "portfolio_returns": lambda c: portfolio_returns(c.returns, c.weights),
+    "buy_and_hold_value": lambda c: buy_and_hold_value(c.prices, c.weights),
+    "fetch_normalize": lambda c: get_prices(list(c.prices.columns), provider=c.provider),
+}
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    n_tickers: int
+    n_bars: int
+    repeat: int
+    best_seconds: float
+    median_seconds: float
+    peak_memory_bytes: Optional[int] = None
+
+    @property
+    def key(self) -> str:
+        return f"{self.name}[{self.n_tickers}x{self.n_bars}]"
+
+    def as_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def _measure(func: Callable[[], Any], repeat: int, memory: bool) -> Tuple[List[float], Optional[int]]:
+    func()  # warm-up: imports, caches, first-touch allocations
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - t0)
+    peak = None
+    if memory:
+        # Separate run: tracing allocations slows the code down too much to time it
+        tracemalloc.start()
+        try:
+            func()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return times, peak
+
+
+def run_benchmarks(
+    scales: Iterable[Tuple[int, int]] = DEFAULT_SCALES,
+    names: Optional[Sequence[str]] = None,
+    repeat: int = 5,
+    nan_density: float = 0.01,
+    seed: int = 0,
+    memory: bool = True,
+) -> List[BenchmarkResult]:
+    """
+    Time each benchmark (best and median of `repeat` runs after a warm-up)
+    and record its peak traced allocation, at every (tickers, bars) scale.
+    """
+    if not isinstance(repeat, int) or repeat <= 0:
+        raise InvalidInputError("repeat must be a positive integer.")
+    selected = list(BENCHMARKS) if names is None else list(names)
+    unknown = [n for n in selected if n not in BENCHMARKS]
+    if unknown:
+        raise InvalidInputError(f"Unknown benchmarks: {unknown}. Available: {sorted(BENCHMARKS)}")
+
+    results = []
+    for n_tickers, n_bars in scales:
+        case = BenchmarkCase.build(n_tickers, n_bars, nan_density=nan_density, seed=seed)
+        for name in selected:
+            times, peak = _measure(lambda: BENCHMARKS[name](case), repeat, memory)
+            results.append(
+                BenchmarkResult(name, n_tickers, n_bars, repeat, min(times), statistics.median(times), peak)
+            )
+    return results
+
+
+def environment() -> Dict[str, str]:
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "machine": platform.machine(),
+        "platform": platform.platform(),
+    }
+
+
+def save_results(results: Sequence[BenchmarkResult], path: str, meta: Optional[Dict[str, Any]] = None) -> None:
+    """Write results as JSON (atomically) together with the library versions they were measured with."""
+    doc = {
+        "version": _FORMAT_VERSION,
+        "created": pd.Timestamp.now(tz="UTC").isoformat(),
+        "environment": environment(),
+        "meta": meta or {},
+        "results": [r.as_dict() for r in results],
+    }
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    with os.fdopen(fd, "w") as f:
+        json.dump(doc, f, indent=2)
+    os.replace(tmp, path)
+
+
+def load_results(path: str) -> List[BenchmarkResult]:
+    if not os.path.exists(path):
+        raise InvalidInputError(f"No benchmark results at {path}.")
+    with open(path) as f:
+        doc = json.load(f)
+    if doc.get("version") != _FORMAT_VERSION:
+        raise InvalidInputError(f"Unsupported benchmark file version: {doc.get('version')}")
+    return [BenchmarkResult(**r) for r in doc["results"]]
+
+
+@dataclass
+class Comparison:
+    key: str
+    baseline_seconds: float
+    current_seconds: float
+    time_ratio: float
+    memory_ratio: Optional[float]
+    regressed: bool
+
+
+def compare(
+    results: Sequence[BenchmarkResult],
+    baseline: Sequence[BenchmarkResult],
+    tolerance: float = 0.25,
+    memory_tolerance: float = 0.25,
+    min_seconds: float = 5e-3,
+) -> List[Comparison]:
+    """
+    Compare best times (and peak memory) with a baseline run. A benchmark
+    regresses when it is more than `tolerance` slower (e.g. 0.25 = 25%) or
+    uses more than `memory_tolerance` more memory. Runs faster than
+    `min_seconds` in both are too noisy to judge on time. Benchmarks
+    missing from either side are skipped.
+    """
+    if tolerance < 0 or memory_tolerance < 0:
+        raise InvalidInputError("tolerances must be >= 0.")
+    base = {r.key: r for r in baseline}
+    out = []
+    for r in results:
+        b = base.get(r.key)
+        if b is None:
+            continue
+        time_ratio = r.best_seconds / b.best_seconds if b.best_seconds > 0 else float("inf")
+        slow = max(r.best_seconds, b.best_seconds) >= min_seconds and time_ratio > 1 + tolerance
+        memory_ratio = None
+        if r.peak_memory_bytes is not None and b.peak_memory_bytes:
+            memory_ratio = r.peak_memory_bytes / b.peak_memory_bytes
+        heavy = memory_ratio is not None and memory_ratio > 1 + memory_tolerance
+        out.append(Comparison(r.key, b.best_seconds, r.best_seconds, time_ratio, memory_ratio, slow or heavy))
+    return out
+
+
+def format_results(results: Sequence[BenchmarkResult], comparisons: Optional[Sequence[Comparison]] = None) -> str:
+    """Plain-text table of results (plus the baseline ratio and a flag when compared)."""
+    by_key = {c.key: c for c in comparisons or []}
+    lines = [f"{'benchmark':<40} {'best ms':>10} {'median ms':>10} {'peak MB':>9} {'vs base':>8}"]
+    for r in results:
+        mem = "" if r.peak_memory_bytes is None else f"{r.peak_memory_bytes / 2**20:.1f}"
+        c = by_key.get(r.key)
+        ratio = "" if c is None else f"{c.time_ratio:.2f}x" + (" !" if c.regressed else "")
+        lines.append(f"{r.key:<40} {r.best_seconds * 1e3:>10.2f} {r.median_seconds * 1e3:>10.2f} {mem:>9} {ratio:>8}")
+    return "\n".join(lines)
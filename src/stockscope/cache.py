@@ -0,0 +1,301 @@
+from __future__ import annotations
+
+import os
+import re
+import tempfile
+import threading
+from dataclasses import dataclass, asdict
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from .exceptions import InvalidInputError, EmptyDataError
+
+
+# Fetch callable used to fill gaps: (tickers, start, end, interval, price_field) -> wide DataFrame
+Downloader = Callable[[List[str], Optional[pd.Timestamp], Optional[pd.Timestamp], str, str], pd.DataFrame]
+
+_INTRADAY_TTL = 5 * 60
+_DAILY_TTL = 12 * 60 * 60
+_PERIODIC_TTL = 24 * 60 * 60
+
+# How long (seconds) the most recent, still-forming bar of a cached series stays fresh.
+DEFAULT_TTL: Dict[str, Optional[float]] = {
+    "1m": _INTRADAY_TTL,
+    "2m": _INTRADAY_TTL,
+    "5m": _INTRADAY_TTL,
+    "15m": _INTRADAY_TTL,
+    "30m": _INTRADAY_TTL,
+    "60m": _INTRADAY_TTL,
+    "90m": _INTRADAY_TTL,
+    "1h": _INTRADAY_TTL,
+    "1d": _DAILY_TTL,
+    "5d": _DAILY_TTL,
+    "1wk": _PERIODIC_TTL,
+    "1mo": _PERIODIC_TTL,
+    "3mo": _PERIODIC_TTL,
+}
+
+_NAT = np.iinfo(np.int64).min
+_EMPTY = pd.Series([], index=pd.DatetimeIndex([]), dtype=float)
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    partial_hits: int = 0
+    misses: int = 0
+    downloads: int = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        return asdict(self)
+
+
+class _Entry:
+    __slots__ = ("series", "covered_start", "covered_end", "fetched_at")
+
+    def __init__(
+        self,
+        series: pd.Series,
+        covered_start: Optional[pd.Timestamp],
+        covered_end: pd.Timestamp,
+        fetched_at: pd.Timestamp,
+    ) -> None:
+        self.series = series
+        self.covered_start = covered_start
+        self.covered_end = covered_end
+        self.fetched_at = fetched_at
+
+
+def _naive(ts: Optional[pd.Timestamp]) -> Optional[pd.Timestamp]:
+    if ts is None:
+        return None
+    ts = pd.Timestamp(ts)
+    return ts.tz_localize(None) if ts.tzinfo is not None else ts
+
+
+def _slice(s: pd.Series, start: Optional[pd.Timestamp], end: pd.Timestamp) -> pd.Series:
+    idx = s.index
+    if idx.tz is not None:
+        idx = idx.tz_localize(None)
+    mask = idx < end
+    if start is not None:
+        mask &= idx >= start
+    return s[mask]
+
+
+class PriceCache:
+    """
+    On-disk cache of single-field price series, one NPZ file per
+    ticker/interval/price_field under `root`.
+
+    Each file records the date range it covers, so a request only downloads
+    the parts of `[start, end)` that are not on disk yet. Historical ranges
+    never expire; the live edge of a series (data fetched up to "now") is
+    trusted for `ttl[interval]` seconds and afterwards refreshed from the last
+    stored bar onwards. A ttl of None means the live edge never expires.
+    """
+
+    def __init__(self, root: Union[str, os.PathLike], ttl: Optional[Dict[str, Optional[float]]] = None) -> None:
+        if not isinstance(root, (str, os.PathLike)) or not str(root).strip():
+            raise InvalidInputError("root must be a non-empty path.")
+        self.root = os.fspath(root)
+        self.ttl: Dict[str, Optional[float]] = dict(DEFAULT_TTL)
+        if ttl is not None:
+            if not isinstance(ttl, dict):
+                raise InvalidInputError("ttl must be a dict like {'1d': 3600}.")
+            for k, v in ttl.items():
+                if v is not None and (not isinstance(v, (int, float)) or v < 0):
+                    raise InvalidInputError(f"ttl for '{k}' must be a non-negative number of seconds or None.")
+                self.ttl[k] = v
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+
+    def path_for(self, ticker: str, interval: str, price_field: str) -> str:
+        field = re.sub(r"[^A-Za-z0-9]+", "_", price_field).strip("_") or "field"
+        name = ticker.replace(os.sep, "_")
+        return os.path.join(self.root, interval, field, f"{name}.npz")
+
+    def get(
+        self,
+        tickers: List[str],
+        start: Optional[pd.Timestamp],
+        end: Optional[pd.Timestamp],
+        interval: str,
+        price_field: str,
+        download: Downloader,
+    ) -> pd.DataFrame:
+        """
+        Return prices for `tickers` over `[start, end)`, downloading only
+        missing ranges with `download` and persisting them.
+        """
+        now = pd.Timestamp.now()
+        start = _naive(start)
+        end = now if end is None else _naive(end)
+
+        entries: Dict[str, Optional[_Entry]] = {}
+        gaps: Dict[Tuple[Optional[pd.Timestamp], pd.Timestamp], List[str]] = {}
+        for t in tickers:
+            entry = self._read(t, interval, price_field)
+            entries[t] = entry
+            t_gaps = self._missing(entry, start, end, interval, now)
+            with self._lock:
+                if entry is None:
+                    self.stats.misses += 1
+                elif t_gaps:
+                    self.stats.partial_hits += 1
+                else:
+                    self.stats.hits += 1
+            for g in t_gaps:
+                gaps.setdefault(g, []).append(t)
+
+        # One download per distinct gap; tickers sharing a gap share the request
+        for (g_start, g_end), g_tickers in gaps.items():
+            try:
+                fresh = download(g_tickers, g_start, g_end, interval, price_field)
+            except EmptyDataError:
+                fresh = pd.DataFrame()
+            with self._lock:
+                self.stats.downloads += 1
+            for t in g_tickers:
+                new = fresh[t].dropna() if t in fresh.columns else _EMPTY
+                entries[t] = self._merge(entries[t], new, g_start, g_end, now)
+                self._write(t, interval, price_field, entries[t])
+
+        prices = {}
+        for t in tickers:
+            entry = entries[t]
+            if entry is None:
+                continue
+            s = _slice(entry.series, start, end)
+            if not s.empty:
+                prices[t] = s
+
+        if not prices:
+            raise EmptyDataError(f"No '{price_field}' data found for requested tickers.")
+
+        out = pd.DataFrame(prices)
+        out = out.sort_index()
+        out = out.dropna(how="all")
+        if out.empty:
+            raise EmptyDataError("All values are NaN after cleaning.")
+        return out
+
+    def clear(self) -> None:
+        for dirpath, _, files in os.walk(self.root):
+            for f in files:
+                if f.endswith(".npz"):
+                    os.remove(os.path.join(dirpath, f))
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.stats = CacheStats()
+
+    def _is_fresh(self, entry: _Entry, interval: str, now: pd.Timestamp) -> bool:
+        ttl = self.ttl.get(interval)
+        return ttl is None or (now - entry.fetched_at).total_seconds() <= ttl
+
+    def _missing(
+        self,
+        entry: Optional[_Entry],
+        start: Optional[pd.Timestamp],
+        end: pd.Timestamp,
+        interval: str,
+        now: pd.Timestamp,
+    ) -> List[Tuple[Optional[pd.Timestamp], pd.Timestamp]]:
+        if entry is None:
+            return [(start, end)]
+
+        gaps = []
+        cs = entry.covered_start
+        if cs is not None and (start is None or start < cs):
+            gaps.append((start, cs))
+
+        if entry.covered_end < entry.fetched_at:
+            # Ranges that ended before the fetch are history and never go stale
+            ce = entry.covered_end
+        elif self._is_fresh(entry, interval, now):
+            return gaps
+        elif not entry.series.empty:
+            # Stale live edge: the last stored bar may have been incomplete
+            ce = _naive(entry.series.index[-1])
+        else:
+            ce = cs
+        if ce is None or end > ce:
+            # Fetch from the covered end (not `start`) so coverage stays contiguous
+            gaps.append((ce, end))
+        return gaps
+
+    def _merge(
+        self,
+        entry: Optional[_Entry],
+        new: pd.Series,
+        start: Optional[pd.Timestamp],
+        end: pd.Timestamp,
+        now: pd.Timestamp,
+    ) -> _Entry:
+        new = new.astype(float)
+        if entry is None:
+            return _Entry(new.sort_index(), start, end, now)
+
+        if entry.series.empty:
+            merged = new
+        elif new.empty:
+            merged = entry.series
+        else:
+            merged = pd.concat([entry.series, new])
+            # Newly downloaded bars replace stale ones at the same timestamp
+            merged = merged[~merged.index.duplicated(keep="last")]
+        merged = merged.sort_index()
+
+        cs = None if start is None or entry.covered_start is None else min(start, entry.covered_start)
+        ce = max(end, entry.covered_end)
+        fetched_at = now if end >= entry.covered_end else entry.fetched_at
+        return _Entry(merged, cs, ce, fetched_at)
+
+    def _read(self, ticker: str, interval: str, price_field: str) -> Optional[_Entry]:
+        path = self.path_for(ticker, interval, price_field)
+        if not os.path.exists(path):
+            return None
+        with np.load(path, allow_pickle=False) as z:
+            index = pd.DatetimeIndex(z["index"])
+            tz = str(z["tz"])
+            if tz:
+                index = index.tz_localize("UTC").tz_convert(tz)
+            series = pd.Series(z["values"], index=index, name=ticker)
+            cs = int(z["covered_start"])
+            return _Entry(
+                series,
+                None if cs == _NAT else pd.Timestamp(cs),
+                pd.Timestamp(int(z["covered_end"])),
+                pd.Timestamp(int(z["fetched_at"])),
+            )
+
+    def _write(self, ticker: str, interval: str, price_field: str, entry: _Entry) -> None:
+        path = self.path_for(ticker, interval, price_field)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        index = pd.DatetimeIndex(entry.series.index)
+        tz = "" if index.tz is None else str(index.tz)
+        if index.tz is not None:
+            index = index.tz_convert("UTC").tz_localize(None)
+
+        # Write to a temp file and rename so readers never see a partial file
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez(
+                    f,
+                    index=index.to_numpy(),
+                    values=entry.series.to_numpy(dtype=float),
+                    tz=np.array(tz),
+                    covered_start=np.int64(_NAT if entry.covered_start is None else entry.covered_start.value),
+                    covered_end=np.int64(entry.covered_end.value),
+                    fetched_at=np.int64(entry.fetched_at.value),
+                )
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
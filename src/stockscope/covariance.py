@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+from typing import List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from .exceptions import InvalidInputError
+
+
+# Columns per block; bounds the per-block temporaries to a few (block x block) matrices
+_BLOCK_SIZE = 512
+
+
+def _check(returns: pd.DataFrame, span: Optional[int], min_periods: int, block_size: int) -> None:
+    if not isinstance(returns, pd.DataFrame) or returns.empty:
+        raise InvalidInputError("returns must be a non-empty pandas DataFrame.")
+    if span is not None and (not isinstance(span, int) or span < 1):
+        raise InvalidInputError("span must be a positive integer.")
+    if not isinstance(min_periods, int) or min_periods < 1:
+        raise InvalidInputError("min_periods must be a positive integer.")
+    if not isinstance(block_size, int) or block_size <= 0:
+        raise InvalidInputError("block_size must be a positive integer.")
+
+
+def _ewm_weights(n_rows: int, span: Optional[int]) -> Optional[np.ndarray]:
+    if span is None:
+        return None
+    alpha = 2.0 / (span + 1.0)
+    # Like ewm(adjust=True, ignore_na=False): weight decays with the distance from the last row
+    return (1.0 - alpha) ** np.arange(n_rows - 1, -1, -1, dtype=float)
+
+
+def _centered(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Shift every column by its own mean (limits cancellation in the sums) and zero-fill NaNs."""
+    mask = ~np.isnan(values)
+    counts = mask.sum(axis=0)
+    sums = np.where(mask, values, 0.0).sum(axis=0)
+    shift = np.divide(sums, counts, out=np.zeros(values.shape[1]), where=counts > 0)
+    x = np.asfortranarray(np.where(mask, values - shift, 0.0))
+    return x, np.asfortranarray(mask.astype(float)), shift
+
+
+class _Sums:
+    """
+    Weighted pairwise-complete moment sums for one (rows block x columns block):
+    sw[i, j]  = sum of weights over rows where both i and j are observed,
+    sx[i, j]  = weighted sum of x_i over those rows (sy: of x_j),
+    sxy[i, j] = weighted sum of x_i * x_j, n[i, j] = number of joint rows.
+    """
+
+    def __init__(self, x, m, w, bi, bj, complete, need_squares):
+        weighted = w is not None
+        xi, xj = x[:, bi], x[:, bj]
+        wxi = xi * w[:, None] if weighted else xi
+        self.sxy = wxi.T @ xj
+        if complete:
+            n_rows = x.shape[0]
+            self.sw = float(w.sum()) if weighted else float(n_rows)
+            self.sw2 = float((w * w).sum()) if weighted else self.sw
+            self.n = n_rows
+            wxj = xj * w[:, None] if weighted else xj
+            self.sx = wxi.sum(axis=0)[:, None]
+            self.sy = wxj.sum(axis=0)[None, :]
+            if need_squares:
+                self.sxx = (wxi * xi).sum(axis=0)[:, None]
+                self.syy = (wxj * xj).sum(axis=0)[None, :]
+            return
+
+        mi, mj = m[:, bi], m[:, bj]
+        wmi = mi * w[:, None] if weighted else mi
+        self.sx = wxi.T @ mj
+        self.sy = wmi.T @ xj
+        self.sw = wmi.T @ mj
+        self.n = mi.T @ mj if weighted else self.sw
+        self.sw2 = (wmi * w[:, None]).T @ mj if weighted else self.sw
+        if need_squares:
+            self.sxx = (wxi * xi).T @ mj
+            self.syy = wmi.T @ (xj * xj)
+
+
+def _cov_from_sums(s: _Sums, bias: bool) -> np.ndarray:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        c = s.sxy - s.sx * s.sy / s.sw
+        # Unbiased weighted estimator; reduces to 1 / (n - 1) without weights
+        denom = s.sw if bias else s.sw - s.sw2 / s.sw
+        return c / denom
+
+
+def _corr_from_sums(s: _Sums) -> np.ndarray:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        c = s.sxy - s.sx * s.sy / s.sw
+        vx = s.sxx - s.sx**2 / s.sw
+        vy = s.syy - s.sy**2 / s.sw
+        return np.clip(c / np.sqrt(vx * vy), -1.0, 1.0)
+
+
+def _pairwise(
+    returns: pd.DataFrame, span: Optional[int], min_periods: int, bias: bool, corr: bool, block_size: int
+) -> pd.DataFrame:
+    values = returns.to_numpy(dtype=float)
+    x, m, _ = _centered(values)
+    w = _ewm_weights(len(values), span)
+    complete = bool(m.all())
+    n_cols = values.shape[1]
+
+    out = np.empty((n_cols, n_cols))
+    for i0 in range(0, n_cols, block_size):
+        bi = slice(i0, min(n_cols, i0 + block_size))
+        # Symmetric: compute the upper block triangle and mirror it
+        for j0 in range(i0, n_cols, block_size):
+            bj = slice(j0, min(n_cols, j0 + block_size))
+            s = _Sums(x, m, w, bi, bj, complete, need_squares=corr)
+            blk = _corr_from_sums(s) if corr else _cov_from_sums(s, bias)
+            blk = np.where(s.n >= min_periods, blk, np.nan)
+            out[bi, bj] = blk
+            out[bj, bi] = blk.T
+    if corr:
+        diag = np.diag(out).copy()
+        np.fill_diagonal(out, np.where(np.isnan(diag), np.nan, 1.0))
+    return pd.DataFrame(out, index=returns.columns, columns=returns.columns)
+
+
+def covariance(
+    returns: pd.DataFrame,
+    span: Optional[int] = None,
+    min_periods: int = 2,
+    bias: bool = False,
+    block_size: int = _BLOCK_SIZE,
+) -> pd.DataFrame:
+    """
+    Covariance matrix of returns using pairwise-complete observations, so
+    ragged histories (NaNs) only affect the pairs that involve them. Without
+    `span` this matches `returns.cov(min_periods=...)`; with `span` rows are
+    exponentially weighted like the last date of `returns.ewm(span=span).cov()`.
+
+    The matrix is built from masked matrix products over column blocks of
+    `block_size`, so temporaries stay at block size.
+    """
+    _check(returns, span, min_periods, block_size)
+    return _pairwise(returns, span, min_periods, bias, corr=False, block_size=block_size)
+
+
+def correlation(
+    returns: pd.DataFrame, span: Optional[int] = None, min_periods: int = 2, block_size: int = _BLOCK_SIZE
+) -> pd.DataFrame:
+    """Pairwise-complete correlation matrix; same options as `covariance`."""
+    _check(returns, span, min_periods, block_size)
+    return _pairwise(returns, span, min_periods, bias=False, corr=True, block_size=block_size)
+
+
+def ledoit_wolf(
+    returns: pd.DataFrame, shrinkage: Optional[float] = None, block_size: int = _BLOCK_SIZE
+) -> Tuple[pd.DataFrame, float]:
+    """
+    Ledoit-Wolf shrinkage of the sample covariance toward a scaled identity:
+    (1 - delta) * S + delta * mu * I, where mu is the average variance.
+
+    Returns (matrix, delta). `delta` is estimated with the Ledoit-Wolf (2004)
+    formula unless given. S uses the 1 / n normalization of the paper;
+    missing returns are set to their column mean (they add nothing to the sums).
+    """
+    _check(returns, None, 1, block_size)
+    if shrinkage is not None and not (0 <= shrinkage <= 1):
+        raise InvalidInputError("shrinkage must be between 0 and 1.")
+    values = returns.to_numpy(dtype=float)
+    if np.isnan(values).all(axis=0).any():
+        raise InvalidInputError("Every column needs at least one observed return.")
+    x, m, _ = _centered(values)
+    n_rows, n_cols = x.shape
+
+    sample = np.empty((n_cols, n_cols))
+    for i0 in range(0, n_cols, block_size):
+        bi = slice(i0, min(n_cols, i0 + block_size))
+        for j0 in range(i0, n_cols, block_size):
+            bj = slice(j0, min(n_cols, j0 + block_size))
+            blk = (x[:, bi].T @ x[:, bj]) / n_rows
+            sample[bi, bj] = blk
+            sample[bj, bi] = blk.T
+
+    mu = np.trace(sample) / n_cols
+    if shrinkage is None:
+        sq_norm = float((sample**2).sum())
+        # sum over rows of ||x_t x_t^T||_F^2 = (sum_i x_ti^2)^2
+        beta = ((x * x).sum(axis=1) ** 2).sum() / n_rows**2 - sq_norm / n_rows
+        delta = sq_norm - 2.0 * mu * np.trace(sample) + n_cols * mu**2
+        beta = min(max(beta / n_cols, 0.0), delta / n_cols)
+        shrinkage = 0.0 if beta == 0 else beta / (delta / n_cols)
+
+    shrunk = (1.0 - shrinkage) * sample
+    shrunk[np.diag_indices(n_cols)] += shrinkage * mu
+    return pd.DataFrame(shrunk, index=returns.columns, columns=returns.columns), float(shrinkage)
+
+
+class CovarianceTracker:
+    """
+    Running pairwise-complete covariance that absorbs one new row of returns
+    in O(N^2) (rank-one updates of the moment sums) instead of recomputing
+    from the whole history. With `span`, older rows decay like
+    `covariance(..., span=span)`.
+    """
+
+    def __init__(self, tickers: Sequence[str], span: Optional[int] = None, min_periods: int = 2) -> None:
+        tickers = list(tickers)
+        if not tickers:
+            raise InvalidInputError("tickers cannot be empty.")
+        _check(pd.DataFrame(columns=tickers, index=[0]), span, min_periods, 1)
+        self.tickers: List[str] = tickers
+        self.span = span
+        self.min_periods = min_periods
+        self.count = 0
+        n = len(tickers)
+        self._shift: Optional[np.ndarray] = None
+        self._n = np.zeros((n, n))
+        self._sw = np.zeros((n, n))
+        self._sw2 = np.zeros((n, n)) if span is not None else self._sw
+        self._sx = np.zeros((n, n))
+        self._sxy = np.zeros((n, n))
+
+    def update(self, row: Union[pd.Series, np.ndarray, Sequence[float]]) -> None:
+        """Add one period of returns (a Series labelled by ticker, or values in `tickers` order)."""
+        if isinstance(row, pd.Series):
+            missing = [t for t in self.tickers if t not in row.index]
+            if missing:
+                raise InvalidInputError(f"Missing tickers in row: {missing}")
+            row = row[self.tickers]
+        x = np.asarray(row, dtype=float)
+        if x.shape != (len(self.tickers),):
+            raise InvalidInputError(f"Expected {len(self.tickers)} returns per update, got shape {x.shape}.")
+        mask = ~np.isnan(x)
+        if self._shift is None:
+            self._shift = np.where(mask, x, 0.0)
+        x0 = np.where(mask, x - self._shift, 0.0)
+        m = mask.astype(float)
+
+        if self.span is not None:
+            decay = 1.0 - 2.0 / (self.span + 1.0)
+            for acc in (self._sw, self._sx, self._sxy):
+                acc *= decay
+            self._sw2 *= decay * decay
+            self._sw2 += np.multiply.outer(m, m)
+            self._n += np.multiply.outer(m, m)
+        self._sw += np.multiply.outer(m, m)
+        self._sx += np.multiply.outer(x0, m)
+        self._sxy += np.multiply.outer(x0, x0)
+        self.count += 1
+
+    def covariance(self) -> pd.DataFrame:
+        """Current covariance matrix (NaN for pairs with fewer than `min_periods` joint rows)."""
+        n = self._n if self.span is not None else self._sw
+        with np.errstate(divide="ignore", invalid="ignore"):
+            c = self._sxy - self._sx * self._sx.T / self._sw
+            cov = c / (self._sw - self._sw2 / self._sw)
+        cov = np.where(n >= self.min_periods, cov, np.nan)
+        return pd.DataFrame(cov, index=self.tickers, columns=self.tickers)
+
+    @classmethod
+    def from_history(
+        cls, returns: pd.DataFrame, span: Optional[int] = None, min_periods: int = 2
+    ) -> "CovarianceTracker":
+        """Seed the running sums from a returns history with matrix products."""
+        _check(returns, span, min_periods, 1)
+        obj = cls(list(returns.columns), span=span, min_periods=min_periods)
+        values = returns.to_numpy(dtype=float)
+        x, m, obj._shift = _centered(values)
+        w = _ewm_weights(len(values), span)
+        s = _Sums(x, m, w, slice(None), slice(None), complete=False, need_squares=False)
+        obj._n, obj._sw, obj._sx, obj._sxy = s.n.copy(), s.sw.copy(), s.sx, s.sxy
+        obj._sw2 = s.sw2.copy() if span is not None else obj._sw
+        obj.count = len(values)
+        return obj
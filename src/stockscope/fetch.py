@@ -1,15 +1,59 @@
 from __future__ import annotations
 
-from typing import Union, Iterable, Optional
+import asyncio
+import time
+import weakref
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from functools import partial
+from typing import TYPE_CHECKING, Dict, Union, Iterable, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
-import yfinance as yf
 
-from .exceptions import InvalidInputError, DataDownloadError, EmptyDataError
+from .exceptions import StockScopeError, InvalidInputError, DataDownloadError, EmptyDataError
+from .options import as_float
+from .panel import OHLCVPanel
+from .providers import FieldFrames, PriceProvider, YFinanceProvider
+from .synthetic import OHLCV_FIELDS
 from .utils import ensure_ticker_list, parse_date, validate_date_range
 
+if TYPE_CHECKING:
+    from .cache import PriceCache
+
 
 _ALLOWED_INTERVALS = {"1d", "5d", "1wk", "1mo", "3mo", "1h", "90m", "60m", "30m", "15m", "5m", "2m", "1m"}
+_WINDOW_WORKERS = 4
+
+
+def _validate_field(price_field: str) -> str:
+    if not isinstance(price_field, str) or not price_field.strip():
+        raise InvalidInputError("price_field must be a non-empty string.")
+    return price_field.strip()
+
+
+def _validate_request(
+    tickers: Union[str, Iterable[str]],
+    start: Optional[object],
+    end: Optional[object],
+    interval: str,
+    price_field: str,
+) -> Tuple[List[str], Optional[pd.Timestamp], Optional[pd.Timestamp], str, str]:
+    tickers_list = ensure_ticker_list(tickers)
+
+    if not isinstance(interval, str) or interval.strip() == "":
+        raise InvalidInputError("interval must be a non-empty string.")
+    interval = interval.strip()
+
+    if interval not in _ALLOWED_INTERVALS:
+        raise InvalidInputError(f"Unsupported interval '{interval}'. Allowed: {sorted(_ALLOWED_INTERVALS)}")
+
+    start_ts = parse_date(start, "start")
+    end_ts = parse_date(end, "end")
+    validate_date_range(start_ts, end_ts)
+
+    price_field = _validate_field(price_field)
+    return tickers_list, start_ts, end_ts, interval, price_field
 
 
 def get_prices(
@@ -18,79 +62,438 @@ def get_prices(
     end: Optional[object] = None,
     interval: str = "1d",
     price_field: str = "Adj Close",
+    cache: Optional["PriceCache"] = None,
+    provider: Optional[PriceProvider] = None,
 ) -> pd.DataFrame:
     """
     Download historical price data and return a DataFrame of prices.
 
+    If `cache` is given, previously downloaded ranges are served from disk and
+    only the missing date ranges are requested from the provider.
+
+    `provider` selects the data backend (see `stockscope.providers`); the
+    default is `YFinanceProvider`.
+
     Returns:
-      DataFrame with DatetimeIndex and columns = tickers (uppercase)
+      DataFrame with DatetimeIndex and columns = tickers (uppercase), in the
+      dtype set by `stockscope.options` (float64 unless float32 mode is on)
     """
-    tickers_list = ensure_ticker_list(tickers)
+    tickers_list, start_ts, end_ts, interval, price_field = _validate_request(
+        tickers, start, end, interval, price_field
+    )
 
-    if not isinstance(interval, str) or interval.strip() == "":
-        raise InvalidInputError("interval must be a non-empty string.")
-    interval = interval.strip()
+    download = partial(_download, provider=provider)
+    if cache is not None:
+        return as_float(cache.get(tickers_list, start_ts, end_ts, interval, price_field, download))
+    return as_float(download(tickers_list, start_ts, end_ts, interval, price_field))
 
-    if interval not in _ALLOWED_INTERVALS:
-        raise InvalidInputError(f"Unsupported interval '{interval}'. Allowed: {sorted(_ALLOWED_INTERVALS)}")
 
-    start_ts = parse_date(start, "start")
-    end_ts = parse_date(end, "end")
-    validate_date_range(start_ts, end_ts)
+def _split_range(
+    start: pd.Timestamp, end: pd.Timestamp, span: pd.Timedelta
+) -> List[Tuple[pd.Timestamp, pd.Timestamp]]:
+    edges = list(pd.date_range(start, end, freq=span))
+    if edges[-1] < end:
+        edges.append(end)
+    return list(zip(edges[:-1], edges[1:]))
 
-    if not isinstance(price_field, str) or not price_field.strip():
-        raise InvalidInputError("price_field must be a non-empty string.")
-    price_field = price_field.strip()
 
-    try:
-        df = yf.download(
-            tickers=tickers_list,
-            start=None if start_ts is None else start_ts.to_pydatetime(),
-            end=None if end_ts is None else end_ts.to_pydatetime(),
-            interval=interval,
-            auto_adjust=False,
-            progress=False,
-            group_by="ticker",
-            threads=True,
-        )
-    except Exception as e:
-        raise DataDownloadError(f"yfinance download failed: {e}")
+def _fetch_windows(
+    provider: PriceProvider,
+    tickers_list: List[str],
+    start_ts: Optional[pd.Timestamp],
+    end_ts: Optional[pd.Timestamp],
+    interval: str,
+    fields: List[str],
+) -> FieldFrames:
+    """
+    Call `provider.fetch`, splitting ranges longer than the provider's
+    `max_request_span` for `interval` into windows fetched in parallel and
+    stitched back together without duplicate bars.
+    """
+    span = provider.max_request_span.get(interval)
+    if span is None or start_ts is None:
+        return provider.fetch(tickers_list, start_ts, end_ts, interval, fields)
+    end = pd.Timestamp.now() if end_ts is None else end_ts
+    if end - start_ts <= span:
+        return provider.fetch(tickers_list, start_ts, end_ts, interval, fields)
+
+    def fetch_window(window: Tuple[pd.Timestamp, pd.Timestamp]) -> FieldFrames:
+        try:
+            return provider.fetch(tickers_list, window[0], window[1], interval, fields)
+        except EmptyDataError:
+            return {}
 
-    if df is None or len(df) == 0:
+    windows = _split_range(start_ts, end, span)
+    with ThreadPoolExecutor(max_workers=min(_WINDOW_WORKERS, len(windows))) as ex:
+        parts = list(ex.map(fetch_window, windows))
+
+    out = {}
+    for f in fields:
+        pieces = [p[f] for p in parts if f in p and not p[f].empty]
+        if pieces:
+            df = pd.concat(pieces)
+            df = df[~df.index.duplicated(keep="last")]
+            out[f] = df.sort_index()
+    if not out:
         raise EmptyDataError("No data returned. Check tickers and date range.")
+    return out
 
-    # Normalize outputs to: columns=tickers, values=price_field
-    # Single ticker: columns like ["Open","High","Low","Close","Adj Close","Volume"]
-    if not isinstance(df.columns, pd.MultiIndex):
-        if price_field not in df.columns:
-            raise EmptyDataError(f"Missing '{price_field}' in downloaded data.")
-        out = df[[price_field]].copy()
-        out.columns = [tickers_list[0]]
-        out.index = pd.to_datetime(out.index)
-        out = out.sort_index()
-        out = out.dropna(how="all")
-        if out.empty:
-            raise EmptyDataError("All values are NaN after cleaning.")
-        return out
-
-    # Multi ticker: columns MultiIndex. With group_by="ticker": first level is ticker.
-    prices = {}
-    for t in tickers_list:
-        if t not in df.columns.get_level_values(0):
-            continue
-        sub = df[t]
-        if price_field not in sub.columns:
-            continue
-        s = sub[price_field].copy()
-        prices[t] = s
-
-    if not prices:
+
+def _download(
+    tickers_list: List[str],
+    start_ts: Optional[pd.Timestamp],
+    end_ts: Optional[pd.Timestamp],
+    interval: str,
+    price_field: str,
+    provider: Optional[PriceProvider] = None,
+) -> pd.DataFrame:
+    provider = YFinanceProvider() if provider is None else provider
+    frames = _fetch_windows(provider, tickers_list, start_ts, end_ts, interval, [price_field])
+
+    out = frames.get(price_field)
+    if out is None or out.empty:
         raise EmptyDataError(f"No '{price_field}' data found for requested tickers.")
 
-    out = pd.DataFrame(prices)
+    # Normalize outputs to: columns=tickers, values=price_field
+    out = out[[t for t in tickers_list if t in out.columns]]
     out.index = pd.to_datetime(out.index)
     out = out.sort_index()
     out = out.dropna(how="all")
     if out.empty:
         raise EmptyDataError("All values are NaN after cleaning.")
     return out
+
+
+def get_ohlcv(
+    tickers: Union[str, Iterable[str]],
+    start: Optional[object] = None,
+    end: Optional[object] = None,
+    interval: str = "1d",
+    fields: Iterable[str] = OHLCV_FIELDS,
+    provider: Optional[PriceProvider] = None,
+) -> OHLCVPanel:
+    """
+    Download several price fields in one request and return them as an
+    OHLCVPanel. Individual fields are then available via `panel.prices(field)`
+    without further downloads.
+    """
+    if isinstance(fields, str):
+        fields = [fields]
+    fields_list = list(dict.fromkeys(_validate_field(f) for f in fields))
+    if not fields_list:
+        raise InvalidInputError("fields cannot be empty.")
+    tickers_list, start_ts, end_ts, interval, _ = _validate_request(tickers, start, end, interval, fields_list[0])
+
+    provider = YFinanceProvider() if provider is None else provider
+    frames = _fetch_windows(provider, tickers_list, start_ts, end_ts, interval, fields_list)
+    frames = {f: frames[f] for f in fields_list if f in frames}
+    if not frames:
+        raise EmptyDataError(f"None of the fields {fields_list} were found for requested tickers.")
+
+    present = {t for df in frames.values() for t in df.columns}
+    panel = OHLCVPanel.from_frames(frames, tickers=[t for t in tickers_list if t in present])
+
+    # Drop bars that are empty in every field and ticker
+    keep = ~np.isnan(panel.values).all(axis=(0, 2))
+    if not keep.any():
+        raise EmptyDataError("All values are NaN after cleaning.")
+    if not keep.all():
+        panel = OHLCVPanel(panel.values[:, keep, :], panel.index[keep], panel.fields, panel.tickers)
+    return panel
+
+
+@dataclass
+class BatchResult:
+    """Prices for the tickers that succeeded plus the error for each one that did not."""
+
+    prices: pd.DataFrame
+    failures: Dict[str, StockScopeError] = field(default_factory=dict)
+
+
+@dataclass
+class _ChunkTask:
+    tickers: List[str]
+    attempt: int = 0
+    # Monotonic times: not submitted before `not_before` (backoff); failed after `deadline`
+    not_before: float = 0.0
+    deadline: Optional[float] = None
+
+
+def get_prices_batch(
+    tickers: Union[str, Iterable[str]],
+    start: Optional[object] = None,
+    end: Optional[object] = None,
+    interval: str = "1d",
+    price_field: str = "Adj Close",
+    chunk_size: int = 100,
+    max_workers: int = 8,
+    retries: int = DataDownloadError.default_max_retries,
+    backoff_seconds: float = 0.5,
+    timeout_seconds: Optional[float] = None,
+    cache: Optional["PriceCache"] = None,
+    provider: Optional[PriceProvider] = None,
+) -> BatchResult:
+    """
+    Download a large ticker universe in chunks on a bounded thread pool.
+
+    A failed chunk is retried up to `retries` times with exponential backoff
+    (`backoff_seconds * 2**attempt`); an attempt running longer than
+    `timeout_seconds` counts as failed. If a chunk still fails, each of its
+    tickers is tried once on its own so a single bad symbol only fails itself.
+    Timed-out downloads keep their thread until they return; once every
+    thread is held by one, waiting attempts fail after `timeout_seconds`
+    too, so the call always returns.
+
+    Returns a BatchResult; raises DataDownloadError only if every ticker failed.
+    """
+    tickers_list, start_ts, end_ts, interval, price_field = _validate_request(
+        tickers, start, end, interval, price_field
+    )
+    if not isinstance(chunk_size, int) or chunk_size <= 0:
+        raise InvalidInputError("chunk_size must be a positive integer.")
+    if not isinstance(max_workers, int) or max_workers <= 0:
+        raise InvalidInputError("max_workers must be a positive integer.")
+    if not isinstance(retries, int) or retries < 0:
+        raise InvalidInputError("retries must be a non-negative integer.")
+    if backoff_seconds < 0:
+        raise InvalidInputError("backoff_seconds must be >= 0.")
+    if timeout_seconds is not None and timeout_seconds <= 0:
+        raise InvalidInputError("timeout_seconds must be > 0.")
+
+    provider = YFinanceProvider() if provider is None else provider
+    download = partial(_download, provider=provider)
+
+    def run(task: _ChunkTask) -> pd.DataFrame:
+        if cache is not None:
+            return cache.get(task.tickers, start_ts, end_ts, interval, price_field, download)
+        return download(task.tickers, start_ts, end_ts, interval, price_field)
+
+    frames: List[pd.DataFrame] = []
+    failures: Dict[str, StockScopeError] = {}
+    queued: List[_ChunkTask] = []
+    running: Dict[Future, _ChunkTask] = {}
+    # Attempts that timed out: their threads cannot be interrupted and hold a pool slot until they return
+    abandoned: List[Future] = []
+    ex = ThreadPoolExecutor(max_workers=max_workers)
+
+    def failed(task: _ChunkTask, err: Exception, now: float) -> None:
+        if task.attempt < retries:
+            # Backoff is waited out here, not in a worker, so it holds no pool slot
+            delay = backoff_seconds * 2**task.attempt
+            queued.append(_ChunkTask(task.tickers, task.attempt + 1, not_before=now + delay))
+        elif len(task.tickers) > 1:
+            # Isolate the bad symbol(s): one last attempt per ticker
+            for t in task.tickers:
+                queued.append(_ChunkTask([t], attempt=retries, not_before=now))
+        else:
+            t = task.tickers[0]
+            failures[t] = DataDownloadError(
+                f"Download failed for {t} after {task.attempt + 1} attempt(s): {err}",
+                data_provider=provider.name,
+                retries=task.attempt,
+                timeout_seconds=timeout_seconds,
+                ticker=t,
+                interval=interval,
+            )
+
+    def collect(fut: Future, task: _ChunkTask, now: float) -> None:
+        try:
+            df = fut.result()
+        except EmptyDataError as e:
+            for t in task.tickers:
+                failures[t] = EmptyDataError(str(e), ticker=t, interval=interval)
+        except Exception as e:
+            failed(task, e, now)
+        else:
+            frames.append(df)
+            for t in task.tickers:
+                if t not in df.columns:
+                    failures[t] = EmptyDataError(f"No '{price_field}' data returned for {t}.", ticker=t)
+
+    try:
+        for i in range(0, len(tickers_list), chunk_size):
+            queued.append(_ChunkTask(tickers_list[i : i + chunk_size]))
+
+        while queued or running:
+            now = time.monotonic()
+            abandoned = [f for f in abandoned if not f.done()]
+            free = max_workers - len(running) - len(abandoned)
+            # Only submit what a free thread starts right away, so a deadline set here bounds the attempt
+            for task in sorted((t for t in queued if t.not_before <= now), key=lambda t: t.not_before):
+                if free <= 0:
+                    break
+                queued.remove(task)
+                if timeout_seconds is not None:
+                    task.deadline = now + timeout_seconds
+                running[ex.submit(run, task)] = task
+                free -= 1
+            if timeout_seconds is not None and free <= 0 and not running:
+                # Every slot is held by a hung attempt: tasks waiting for one run out their deadline too
+                for task in queued:
+                    if task.deadline is None and task.not_before <= now:
+                        task.deadline = now + timeout_seconds
+
+            wake = [t.not_before for t in queued if t.not_before > now]
+            wake += [t.deadline for t in queued if t.deadline is not None]
+            wake += [t.deadline for t in running.values() if t.deadline is not None]
+            wait_for = max(0.0, min(wake) - now) if wake else None
+            if running or abandoned:
+                done, _ = wait(list(running) + abandoned, timeout=wait_for, return_when=FIRST_COMPLETED)
+            else:
+                time.sleep(wait_for or 0.0)
+                done = set()
+
+            now = time.monotonic()
+            for fut in done:
+                if fut in running:
+                    collect(fut, running.pop(fut), now)
+            for fut, task in list(running.items()):
+                if task.deadline is not None and now >= task.deadline:
+                    del running[fut]
+                    abandoned.append(fut)
+                    failed(task, TimeoutError(f"timed out after {timeout_seconds}s"), now)
+            for task in list(queued):
+                if task.deadline is not None and now >= task.deadline:
+                    queued.remove(task)
+                    failed(task, TimeoutError(f"not started within {timeout_seconds}s: all workers are hung"), now)
+    finally:
+        ex.shutdown(wait=False, cancel_futures=True)
+
+    if not frames:
+        raise DataDownloadError(
+            f"All {len(tickers_list)} tickers failed to download.",
+            data_provider=provider.name,
+            retries=retries,
+            timeout_seconds=timeout_seconds,
+            failures=failures,
+        )
+
+    out = pd.concat(frames, axis=1)
+    out = out[[t for t in tickers_list if t in out.columns]]
+    out = out.sort_index()
+    out = out.dropna(how="all")
+    return BatchResult(prices=as_float(out), failures=failures)
+
+
+class AsyncPriceFetcher:
+    """
+    Non-blocking price fetcher for asyncio applications.
+
+    Requests are split into `chunk_size` ticker chunks and downloaded in
+    worker threads, at most `max_concurrency` at a time. Concurrent requests
+    for an identical chunk share one in-flight download; a download is only
+    cancelled once every request waiting on it has been cancelled.
+    """
+
+    def __init__(
+        self,
+        provider: Optional[PriceProvider] = None,
+        cache: Optional["PriceCache"] = None,
+        max_concurrency: int = 8,
+        chunk_size: int = 50,
+    ) -> None:
+        if not isinstance(max_concurrency, int) or max_concurrency <= 0:
+            raise InvalidInputError("max_concurrency must be a positive integer.")
+        if not isinstance(chunk_size, int) or chunk_size <= 0:
+            raise InvalidInputError("chunk_size must be a positive integer.")
+        self.provider = provider
+        self.cache = cache
+        self.max_concurrency = max_concurrency
+        self.chunk_size = chunk_size
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        # chunk key -> [shared task, number of waiting requests]
+        self._inflight: Dict[tuple, list] = {}
+
+    def _bind_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._inflight = {}
+
+    async def _download_chunk(self, key: tuple) -> Optional[pd.DataFrame]:
+        tickers_list, start_ts, end_ts, interval, price_field = key
+        download = partial(_download, provider=self.provider)
+        call = download
+        if self.cache is not None:
+            call = partial(self.cache.get, download=download)
+        async with self._semaphore:
+            try:
+                return await asyncio.to_thread(call, list(tickers_list), start_ts, end_ts, interval, price_field)
+            except EmptyDataError:
+                return None
+
+    async def _join(self, key: tuple) -> Optional[pd.DataFrame]:
+        entry = self._inflight.get(key)
+        if entry is None:
+            task = asyncio.ensure_future(self._download_chunk(key))
+            entry = self._inflight[key] = [task, 0]
+            task.add_done_callback(lambda t: self._forget(key, t))
+        entry[1] += 1
+        try:
+            return await asyncio.shield(entry[0])
+        except asyncio.CancelledError:
+            entry[1] -= 1
+            if entry[1] == 0:
+                self._forget(key, entry[0])
+                entry[0].cancel()
+            raise
+
+    def _forget(self, key: tuple, task: asyncio.Future) -> None:
+        entry = self._inflight.get(key)
+        if entry is not None and entry[0] is task:
+            del self._inflight[key]
+
+    async def get_prices(
+        self,
+        tickers: Union[str, Iterable[str]],
+        start: Optional[object] = None,
+        end: Optional[object] = None,
+        interval: str = "1d",
+        price_field: str = "Adj Close",
+    ) -> pd.DataFrame:
+        tickers_list, start_ts, end_ts, interval, price_field = _validate_request(
+            tickers, start, end, interval, price_field
+        )
+        self._bind_loop()
+
+        keys = [
+            (tuple(tickers_list[i : i + self.chunk_size]), start_ts, end_ts, interval, price_field)
+            for i in range(0, len(tickers_list), self.chunk_size)
+        ]
+        frames = [df for df in await asyncio.gather(*(self._join(k) for k in keys)) if df is not None]
+        if not frames:
+            raise EmptyDataError(f"No '{price_field}' data found for requested tickers.")
+
+        out = pd.concat(frames, axis=1)
+        out = out[[t for t in tickers_list if t in out.columns]]
+        out = out.sort_index()
+        out = out.dropna(how="all")
+        if out.empty:
+            raise EmptyDataError("All values are NaN after cleaning.")
+        return as_float(out)
+
+
+_default_fetchers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncPriceFetcher]" = weakref.WeakKeyDictionary()
+
+
+async def get_prices_async(
+    tickers: Union[str, Iterable[str]],
+    start: Optional[object] = None,
+    end: Optional[object] = None,
+    interval: str = "1d",
+    price_field: str = "Adj Close",
+    fetcher: Optional[AsyncPriceFetcher] = None,
+) -> pd.DataFrame:
+    """
+    Async counterpart of `get_prices`. Without `fetcher`, a default
+    AsyncPriceFetcher (yfinance, 8 concurrent downloads) is shared by all
+    calls on the running event loop.
+    """
+    if fetcher is None:
+        loop = asyncio.get_running_loop()
+        fetcher = _default_fetchers.get(loop)
+        if fetcher is None:
+            fetcher = _default_fetchers[loop] = AsyncPriceFetcher()
+    return await fetcher.get_prices(tickers, start, end, interval, price_field)
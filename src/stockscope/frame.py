@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import functools
+import inspect
+import threading
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .exceptions import InvalidInputError
+from .options import float_dtype
+
+
+DEFAULT_MAXSIZE = 128
+
+
+@dataclass
+class FrameCacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    size: int = 0
+    maxsize: int = DEFAULT_MAXSIZE
+
+    def as_dict(self) -> Dict[str, int]:
+        return asdict(self)
+
+
+def _freeze(value: Any) -> Hashable:
+    """Hashable stand-in for call parameters (dicts/lists become tuples); raises TypeError if impossible."""
+    if isinstance(value, dict):
+        return tuple(sorted((str(k), _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(v) for v in value)
+    hash(value)
+    return value
+
+
+class PriceFrame:
+    """
+    Validated wrapper around `get_prices` output (dates x tickers) that
+    memoizes derived results in a size-bounded LRU.
+
+    Functions such as `daily_returns`, `sma`, `rsi`, `max_drawdown` or
+    `buy_and_hold_value` accept a PriceFrame wherever they accept prices; the
+    first call computes the result and later calls with the same parameters
+    return it from the cache. `append` adds new bars and clears the cache.
+    """
+
+    def __init__(self, prices: pd.DataFrame, maxsize: int = DEFAULT_MAXSIZE) -> None:
+        if not isinstance(maxsize, int) or maxsize <= 0:
+            raise InvalidInputError("maxsize must be a positive integer.")
+        self._data = self._validate(prices)
+        self._cache: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = FrameCacheStats(maxsize=maxsize)
+
+    @staticmethod
+    def _validate(prices: pd.DataFrame, dtype: Optional[np.dtype] = None) -> pd.DataFrame:
+        if isinstance(prices, PriceFrame):
+            return prices.data if dtype is None else prices.data.astype(dtype, copy=False)
+        if not isinstance(prices, pd.DataFrame) or prices.empty:
+            raise InvalidInputError("prices must be a non-empty pandas DataFrame.")
+        if not isinstance(prices.index, pd.DatetimeIndex):
+            raise InvalidInputError("prices must have a DatetimeIndex.")
+        if not prices.index.is_monotonic_increasing or not prices.index.is_unique:
+            raise InvalidInputError("prices index must be sorted and unique.")
+        if prices.columns.has_duplicates:
+            raise InvalidInputError("prices has duplicate ticker columns.")
+        try:
+            return prices.astype(float_dtype() if dtype is None else dtype)
+        except (TypeError, ValueError):
+            raise InvalidInputError("prices must be numeric.")
+
+    @property
+    def data(self) -> pd.DataFrame:
+        return self._data
+
+    @property
+    def tickers(self) -> List[str]:
+        return list(self._data.columns)
+
+    @property
+    def index(self) -> pd.DatetimeIndex:
+        return self._data.index
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __getitem__(self, ticker: str) -> pd.Series:
+        return self._data[ticker]
+
+    def __repr__(self) -> str:
+        return f"PriceFrame({len(self._data)} rows x {self._data.shape[1]} tickers, cached={len(self._cache)})"
+
+    def memoize(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Return the cached result for `key`, computing (and caching) it on a miss."""
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                self.stats.hits += 1
+                return _shallow(self._cache[key])
+            self.stats.misses += 1
+
+        result = compute()
+        with self._lock:
+            self._cache[key] = result
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.stats.maxsize:
+                self._cache.popitem(last=False)
+                self.stats.evictions += 1
+            self.stats.size = len(self._cache)
+        return _shallow(result)
+
+    def returns(self) -> pd.DataFrame:
+        from .indicators import daily_returns
+
+        return daily_returns(self)
+
+    def log_returns(self) -> pd.DataFrame:
+        from .indicators import log_returns
+
+        return log_returns(self)
+
+    def append(self, rows: pd.DataFrame) -> None:
+        """Append bars dated after the last one; clears every cached result."""
+        rows = self._validate(rows)
+        if rows.index[0] <= self._data.index[-1]:
+            raise InvalidInputError("Appended rows must be dated after the last existing bar.")
+        unknown = [c for c in rows.columns if c not in self._data.columns]
+        if unknown:
+            raise InvalidInputError(f"Appended rows have unknown tickers: {unknown}")
+        self._data = pd.concat([self._data, rows.reindex(columns=self._data.columns)])
+        self.clear_cache()
+        with self._lock:
+            self.stats.invalidations += 1
+
+    def clear_cache(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self.stats.size = 0
+
+    def cache_info(self) -> FrameCacheStats:
+        with self._lock:
+            return FrameCacheStats(**self.stats.as_dict())
+
+
+_PANDAS_MAJOR = int(pd.__version__.split(".")[0])
+
+
+def _copy_on_write() -> bool:
+    # Always on from pandas 3; an opt-in option before that
+    return _PANDAS_MAJOR >= 3 or pd.options.mode.copy_on_write is True
+
+
+def _shallow(result: Any) -> Any:
+    # Callers may modify what they get back: under copy-on-write a shallow copy protects the
+    # cached object, otherwise only a deep copy does
+    if isinstance(result, (pd.Series, pd.DataFrame)):
+        return result.copy(deep=not _copy_on_write())
+    return result
+
+
+def accepts_price_frame(func: Callable) -> Callable:
+    """
+    Let a function whose first argument is prices take a PriceFrame: the
+    result is memoized on the frame, keyed by the function and the remaining
+    arguments. Plain pandas inputs go straight through.
+    """
+    sig = inspect.signature(func)
+    first = next(iter(sig.parameters))
+    name = f"{func.__module__}.{func.__qualname__}"
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        target = args[0] if args else kwargs.get(first)
+        if not isinstance(target, PriceFrame):
+            return func(*args, **kwargs)
+        try:
+            bound = sig.bind(*args, **kwargs)
+        except TypeError:
+            return func(*args, **kwargs)
+        bound.apply_defaults()
+        params = {k: v for k, v in bound.arguments.items() if k != first}
+        bound.arguments[first] = target.data
+        try:
+            # Results depend on the dtype option too
+            key: Tuple = (name, _freeze(params), float_dtype().name)
+        except TypeError:
+            return func(*bound.args, **bound.kwargs)
+        return target.memoize(key, lambda: func(*bound.args, **bound.kwargs))
+
+    return wrapper
@@ -0,0 +1,291 @@
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from typing import Dict, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from .exceptions import InvalidInputError
+from .online import OnlineEMA
+from .portfolio import normalize_weights
+
+
+PORTFOLIO = "PORTFOLIO"
+
+_FORMAT_VERSION = 1
+
+
+class IncrementalMetrics:
+    """
+    Running state that advances daily metrics by one bar in O(1) per ticker:
+    last price, return, volatility (Welford mean/variance of returns), running
+    peak / drawdown / worst drawdown and EMA.
+
+    With `weights`, a buy-and-hold portfolio is tracked as one more series
+    named "PORTFOLIO": shares are fixed on the first bar where every held
+    ticker has a price, and holdings are valued at their last known price
+    (`buy_and_hold_value` on forward-filled prices).
+
+    Feed rows of `get_prices` output to `update`; `snapshot` returns the
+    current metrics. State persists with `save` / `load`.
+    """
+
+    def __init__(
+        self,
+        tickers: Sequence[str],
+        weights: Optional[Dict[str, float]] = None,
+        ema_span: int = 20,
+        initial_value: float = 10_000.0,
+        periods_per_year: int = 252,
+    ) -> None:
+        tickers = [str(t).strip().upper() for t in tickers]
+        if not tickers or any(not t for t in tickers):
+            raise InvalidInputError("tickers must be a non-empty list of ticker strings.")
+        if PORTFOLIO in tickers:
+            raise InvalidInputError(f"'{PORTFOLIO}' is reserved for the portfolio series.")
+        if not isinstance(periods_per_year, int) or periods_per_year <= 0:
+            raise InvalidInputError("periods_per_year must be a positive integer.")
+        try:
+            initial_value = float(initial_value)
+        except Exception:
+            raise InvalidInputError("initial_value must be numeric.")
+        if initial_value <= 0:
+            raise InvalidInputError("initial_value must be > 0.")
+
+        self.tickers: List[str] = tickers
+        self.weights = None if weights is None else normalize_weights(weights)
+        if self.weights is not None:
+            missing = [t for t in self.weights if t not in tickers]
+            if missing:
+                raise InvalidInputError(f"Weighted tickers are not tracked: {missing}")
+            self._w = np.array([self.weights.get(t, 0.0) for t in tickers])
+        self.initial_value = initial_value
+        self.periods_per_year = periods_per_year
+        self.count = 0
+        self.last_date: Optional[pd.Timestamp] = None
+
+        n = len(self.labels)
+        self._ema = OnlineEMA(ema_span)
+        self._prev = np.full(n, np.nan)
+        self._last = np.full(n, np.nan)
+        self._ret = np.full(n, np.nan)
+        self._peak = np.full(n, np.nan)
+        self._worst = np.full(n, np.nan)
+        self._n = np.zeros(n)
+        self._mean = np.zeros(n)
+        self._m2 = np.zeros(n)
+        self._shares: Optional[np.ndarray] = None
+
+    @property
+    def labels(self) -> List[str]:
+        return self.tickers + ([PORTFOLIO] if self.weights is not None else [])
+
+    @property
+    def ema_span(self) -> int:
+        return self._ema.span
+
+    def _row_values(self, row: pd.Series) -> np.ndarray:
+        missing = [t for t in self.tickers if t not in row.index]
+        if missing:
+            raise InvalidInputError(f"Missing tickers in row: {missing}")
+        return row[self.tickers].to_numpy(dtype=float)
+
+    def _check_date(self, date) -> Optional[pd.Timestamp]:
+        if date is None or not isinstance(date, (pd.Timestamp, np.datetime64, str)):
+            return None
+        date = pd.Timestamp(date)
+        if self.last_date is not None and date <= self.last_date:
+            raise InvalidInputError(f"Row for {date} is not after the last processed bar ({self.last_date}).")
+        return date
+
+    def update(self, row: Union[pd.Series, pd.DataFrame]) -> None:
+        """
+        Advance the state by one bar (a Series indexed by ticker, named by its
+        date) or by every row of a DataFrame, in order. Rows with no prices
+        at all are skipped, like `get_prices` drops them.
+        """
+        if isinstance(row, pd.DataFrame):
+            for _, r in row.iterrows():
+                self.update(r)
+            return
+        if not isinstance(row, pd.Series):
+            raise InvalidInputError("row must be a pandas Series (one bar) or DataFrame.")
+        x = self._row_values(row)
+        date = self._check_date(row.name)
+        if np.isnan(x).all():
+            return
+
+        n = len(self.tickers)
+        last = np.where(np.isnan(x), self._last[:n], x)
+        self._last[:n] = last
+        if self.weights is not None:
+            held = self._w > 0
+            if self._shares is None and not np.isnan(last[held]).any():
+                self._shares = np.where(held, self.initial_value * self._w / last, 0.0)
+            value = np.nan if self._shares is None else float(self._shares[held] @ last[held])
+            x = np.r_[x, value]
+            self._last[n] = value
+        self._advance(x)
+        if date is not None:
+            self.last_date = date
+
+    def _advance(self, x: np.ndarray) -> None:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            r = x / self._prev - 1.0
+        self._prev = x
+        self._ret = r
+
+        # Welford update of the return mean/variance, skipping missing returns
+        ok = ~np.isnan(r)
+        self._n += ok
+        delta = np.where(ok, r - self._mean, 0.0)
+        self._mean += np.where(ok, delta / np.maximum(self._n, 1), 0.0)
+        self._m2 += np.where(ok, delta * (np.where(ok, r, 0.0) - self._mean), 0.0)
+
+        self._peak = np.fmax(self._peak, x)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            self._worst = np.fmin(self._worst, x / self._peak - 1.0)
+        self._ema.update(x)
+        self.count += 1
+
+    @property
+    def portfolio_value(self) -> Optional[float]:
+        if self.weights is None or self.count == 0:
+            return None
+        return float(self._last[-1])
+
+    def snapshot(self) -> pd.DataFrame:
+        """Current metrics, one row per ticker (plus PORTFOLIO when weights were given)."""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            var = np.where(self._n >= 2, self._m2 / (self._n - 1), np.nan)
+            drawdown = self._last / self._peak - 1.0
+        ema = self._ema.value
+        return pd.DataFrame(
+            {
+                "price": self._last,
+                "return": self._ret,
+                "volatility": np.sqrt(var) * np.sqrt(self.periods_per_year),
+                "drawdown": drawdown,
+                "max_drawdown": self._worst,
+                "ema": np.full(len(self.labels), np.nan) if ema is None else ema,
+            },
+            index=pd.Index(self.labels, name="ticker"),
+        )
+
+    @classmethod
+    def from_history(
+        cls,
+        prices: pd.DataFrame,
+        weights: Optional[Dict[str, float]] = None,
+        ema_span: int = 20,
+        initial_value: float = 10_000.0,
+        periods_per_year: int = 252,
+    ) -> "IncrementalMetrics":
+        """Build the state from a full price history with vectorized passes (same result as replaying it)."""
+        if not isinstance(prices, pd.DataFrame) or prices.empty:
+            raise InvalidInputError("prices must be a non-empty pandas DataFrame.")
+        obj = cls(list(prices.columns), weights, ema_span, initial_value, periods_per_year)
+        p = prices.copy()
+        p.columns = obj.tickers
+        p = p.dropna(how="all")
+        if p.empty:
+            raise InvalidInputError("prices are empty after dropping NaNs.")
+        values = p.to_numpy(dtype=float)
+        filled = p.ffill().to_numpy(dtype=float)
+
+        if obj.weights is not None:
+            held = obj._w > 0
+            ready = np.flatnonzero(~np.isnan(filled[:, held]).any(axis=1))
+            port = np.full(len(values), np.nan)
+            if len(ready):
+                first = ready[0]
+                obj._shares = np.where(held, initial_value * obj._w / filled[first], 0.0)
+                port[first:] = filled[first:, held] @ obj._shares[held]
+            values = np.column_stack([values, port])
+            filled = np.column_stack([filled, port])
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rets = values[1:] / values[:-1] - 1.0
+            peaks = np.fmax.accumulate(values, axis=0)
+            drawdowns = values / peaks - 1.0
+        ok = ~np.isnan(rets)
+        obj._n = ok.sum(axis=0).astype(float)
+        obj._mean = np.divide(np.where(ok, rets, 0.0).sum(axis=0), obj._n, out=np.zeros(values.shape[1]), where=obj._n > 0)
+        obj._m2 = np.where(ok, (rets - obj._mean) ** 2, 0.0).sum(axis=0)
+        obj._prev = values[-1].copy()
+        obj._ret = rets[-1].copy() if len(rets) else np.full(values.shape[1], np.nan)
+        obj._last = filled[-1].copy()
+        obj._peak = peaks[-1].copy()
+        obj._worst = np.fmin.reduce(drawdowns, axis=0)
+        obj._ema = OnlineEMA.from_history(pd.DataFrame(values), ema_span)
+        obj.count = len(values)
+        if isinstance(p.index, pd.DatetimeIndex):
+            obj.last_date = p.index[-1]
+        return obj
+
+    def save(self, path: str) -> None:
+        """Write the state to a single .npz file (atomically)."""
+        meta = {
+            "version": _FORMAT_VERSION,
+            "tickers": self.tickers,
+            "weights": self.weights,
+            "ema_span": self.ema_span,
+            "initial_value": self.initial_value,
+            "periods_per_year": self.periods_per_year,
+            "count": self.count,
+            "ema_count": self._ema.count,
+            "last_date": None if self.last_date is None else self.last_date.isoformat(),
+        }
+        arrays = {
+            "prev": self._prev,
+            "last": self._last,
+            "ret": self._ret,
+            "peak": self._peak,
+            "worst": self._worst,
+            "n": self._n,
+            "mean": self._mean,
+            "m2": self._m2,
+            "shares": np.full(len(self.tickers), np.nan) if self._shares is None else self._shares,
+        }
+        if self._ema.n is not None:
+            arrays["ema_weighted"] = self._ema._weighted
+            arrays["ema_old_wt"] = self._ema._old_wt
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez(f, meta=np.array(json.dumps(meta)), **arrays)
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+
+    @classmethod
+    def load(cls, path: str) -> "IncrementalMetrics":
+        if not os.path.exists(path):
+            raise InvalidInputError(f"No saved state at {path}.")
+        with np.load(path, allow_pickle=False) as z:
+            meta = json.loads(str(z["meta"]))
+            if meta.get("version") != _FORMAT_VERSION:
+                raise InvalidInputError(f"Unsupported state file version: {meta.get('version')}")
+            obj = cls(meta["tickers"], meta["weights"], meta["ema_span"], meta["initial_value"], meta["periods_per_year"])
+            obj._prev, obj._last, obj._ret = z["prev"], z["last"], z["ret"]
+            obj._peak, obj._worst = z["peak"], z["worst"]
+            obj._n, obj._mean, obj._m2 = z["n"], z["mean"], z["m2"]
+            shares = z["shares"]
+            obj._shares = None if np.isnan(shares).all() else shares
+            if "ema_weighted" in z:
+                obj._ema.n = len(z["ema_weighted"])
+                obj._ema._weighted = z["ema_weighted"]
+                obj._ema._old_wt = z["ema_old_wt"]
+                obj._ema._value = obj._ema._weighted.copy()
+            obj._ema.count = meta["ema_count"]
+        obj.count = meta["count"]
+        obj.last_date = None if meta["last_date"] is None else pd.Timestamp(meta["last_date"])
+        return obj
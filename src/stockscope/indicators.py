@@ -1,11 +1,14 @@
 from __future__ import annotations
 
-from typing import Union
+from typing import Dict, Iterable, List, Optional, Union
 
 import numpy as np
 import pandas as pd
 
 from .exceptions import InvalidInputError
+from .frame import accepts_price_frame
+from .kernels import ewm_smooth, rolling_means, smooth
+from .options import as_float, float_dtype
 
 
 SeriesOrFrame = Union[pd.Series, pd.DataFrame]
@@ -19,47 +22,154 @@ def _ensure_series_or_frame(x: SeriesOrFrame, name: str) -> SeriesOrFrame:
     return x
 
 
+@accepts_price_frame
 def daily_returns(prices: SeriesOrFrame) -> SeriesOrFrame:
     prices = _ensure_series_or_frame(prices, "prices")
     rets = prices.pct_change()
-    return rets.dropna(how="all")
+    return as_float(rets.dropna(how="all"))
 
 
+@accepts_price_frame
 def log_returns(prices: SeriesOrFrame) -> SeriesOrFrame:
     prices = _ensure_series_or_frame(prices, "prices")
     rets = np.log(prices / prices.shift(1))
-    return rets.dropna(how="all")
+    return as_float(rets.dropna(how="all"))
 
 
+@accepts_price_frame
 def sma(series: SeriesOrFrame, window: int) -> SeriesOrFrame:
     series = _ensure_series_or_frame(series, "series")
     if not isinstance(window, int) or window <= 0:
         raise InvalidInputError("window must be a positive integer.")
-    return series.rolling(window=window).mean()
+    return as_float(series.rolling(window=window).mean())
 
 
+@accepts_price_frame
 def ema(series: SeriesOrFrame, span: int) -> SeriesOrFrame:
     series = _ensure_series_or_frame(series, "series")
     if not isinstance(span, int) or span <= 0:
         raise InvalidInputError("span must be a positive integer.")
-    return series.ewm(span=span, adjust=False).mean()
+    return as_float(series.ewm(span=span, adjust=False).mean())
 
 
-def rsi(series: pd.Series, window: int = 14) -> pd.Series:
-    if not isinstance(series, pd.Series):
-        raise InvalidInputError("RSI input must be a pandas Series (single ticker series).")
-    if series.empty:
-        raise InvalidInputError("series cannot be empty.")
+@accepts_price_frame
+def rsi(series: SeriesOrFrame, window: int = 14, method: str = "simple") -> SeriesOrFrame:
+    """
+    Relative Strength Index. method="simple" averages gains/losses with a
+    rolling mean; method="wilder" uses Wilder's recursive smoothing.
+    """
+    series = _ensure_series_or_frame(series, "series")
     if not isinstance(window, int) or window <= 0:
         raise InvalidInputError("window must be a positive integer.")
-
-    delta = series.diff()
-    gain = delta.clip(lower=0.0)
-    loss = -delta.clip(upper=0.0)
-
-    avg_gain = gain.rolling(window=window).mean()
-    avg_loss = loss.rolling(window=window).mean()
-
-    rs = avg_gain / avg_loss.replace(0, np.nan)
-    rsi_val = 100 - (100 / (1 + rs))
-    return rsi_val
+    if method not in ("simple", "wilder"):
+        raise InvalidInputError("method must be 'simple' or 'wilder'.")
+
+    values = _rsi_values(series.to_numpy(dtype=float), window, method).astype(float_dtype(), copy=False)
+    if isinstance(series, pd.Series):
+        return pd.Series(values[:, 0], index=series.index, name=series.name)
+    return pd.DataFrame(values, index=series.index, columns=series.columns)
+
+
+def _gains_losses(values: np.ndarray):
+    delta = np.full(values.shape, np.nan)
+    delta[1:] = values[1:] - values[:-1]
+    with np.errstate(invalid="ignore"):
+        gain = np.where(np.isnan(delta), np.nan, np.clip(delta, 0.0, None))
+        loss = np.where(np.isnan(delta), np.nan, np.clip(-delta, 0.0, None))
+    return gain, loss
+
+
+def _rsi_values(values: np.ndarray, window: int, method: str) -> np.ndarray:
+    values = values[:, None] if values.ndim == 1 else values
+    gain, loss = _gains_losses(values)
+    avg_gain = smooth(gain, window, method)
+    avg_loss = smooth(loss, window, method)
+    return _rsi_from_averages(avg_gain, avg_loss)
+
+
+def _rsi_from_averages(avg_gain: np.ndarray, avg_loss: np.ndarray) -> np.ndarray:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rs = avg_gain / np.where(avg_loss == 0, np.nan, avg_loss)
+        return 100 - (100 / (1 + rs))
+
+
+# Indicator name -> windows/spans, e.g. {"sma": [20, 50, 200], "ema": [12, 26], "rsi": [14]}
+IndicatorSpec = Dict[str, Iterable[int]]
+
+DEFAULT_SPEC: IndicatorSpec = {"sma": (20,), "ema": (12,), "rsi": (14,)}
+
+
+def _parse_spec(spec: IndicatorSpec) -> Dict[str, List[int]]:
+    if not isinstance(spec, dict) or not spec:
+        raise InvalidInputError("spec must be a non-empty dict like {'sma': [20, 50], 'rsi': [14]}.")
+    clean = {}
+    for name, windows in spec.items():
+        key = str(name).lower()
+        if key not in ("sma", "ema", "rsi"):
+            raise InvalidInputError(f"Unknown indicator '{name}'. Supported: sma, ema, rsi.")
+        if isinstance(windows, int):
+            windows = [windows]
+        windows = list(dict.fromkeys(windows))
+        for w in windows:
+            if not isinstance(w, int) or w <= 0:
+                raise InvalidInputError(f"{key} windows must be positive integers.")
+        if windows:
+            clean[key] = windows
+    if not clean:
+        raise InvalidInputError("spec does not request any indicator windows.")
+    return clean
+
+
+@accepts_price_frame
+def compute_indicators(
+    prices: SeriesOrFrame,
+    spec: Optional[IndicatorSpec] = None,
+    dtype: Optional[Union[str, np.dtype]] = None,
+    rsi_method: str = "simple",
+) -> pd.DataFrame:
+    """
+    Compute many indicators over many tickers in shared vectorized passes:
+    all SMA windows come from one cumulative sum, and all RSI windows from one
+    diff and one cumulative sum of gains/losses.
+
+    Returns a DataFrame with columns MultiIndex (indicator, ticker), e.g.
+    ("SMA_20", "AAPL"), or just indicator columns for a Series input.
+    Pass dtype="float32" to halve the size of the result (the default follows
+    `stockscope.options`); rsi_method is passed through as in `rsi`.
+    """
+    prices = _ensure_series_or_frame(prices, "prices")
+    spec = _parse_spec(DEFAULT_SPEC if spec is None else spec)
+    if rsi_method not in ("simple", "wilder"):
+        raise InvalidInputError("rsi_method must be 'simple' or 'wilder'.")
+
+    frame = prices.to_frame() if isinstance(prices, pd.Series) else prices
+    values = frame.to_numpy(dtype=float)
+    results = {}
+
+    if "sma" in spec:
+        for w, res in rolling_means(values, spec["sma"]).items():
+            results[f"SMA_{w}"] = res
+
+    if "ema" in spec:
+        for span in spec["ema"]:
+            results[f"EMA_{span}"] = ewm_smooth(values, 2.0 / (span + 1.0))
+
+    if "rsi" in spec:
+        gain, loss = _gains_losses(values)
+        if rsi_method == "simple":
+            avg_gain = rolling_means(gain, spec["rsi"])
+            avg_loss = rolling_means(loss, spec["rsi"])
+        else:
+            avg_gain = {w: smooth(gain, w, rsi_method) for w in spec["rsi"]}
+            avg_loss = {w: smooth(loss, w, rsi_method) for w in spec["rsi"]}
+        for w in spec["rsi"]:
+            results[f"RSI_{w}"] = _rsi_from_averages(avg_gain[w], avg_loss[w])
+
+    out_dtype = float_dtype() if dtype is None else np.dtype(dtype)
+    if isinstance(prices, pd.Series):
+        return pd.DataFrame({k: v[:, 0].astype(out_dtype, copy=False) for k, v in results.items()}, index=frame.index)
+
+    labels = list(results)
+    block = np.concatenate([results[k] for k in labels], axis=1).astype(out_dtype, copy=False)
+    columns = pd.MultiIndex.from_product([labels, frame.columns], names=["indicator", "ticker"])
+    return pd.DataFrame(block, index=frame.index, columns=columns, copy=False)
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from .exceptions import InvalidInputError
+
+
+SMOOTHING_METHODS = ("simple", "wilder", "ema")
+
+
+def _as_2d(values: np.ndarray) -> np.ndarray:
+    values = np.asarray(values, dtype=float)
+    if values.ndim == 1:
+        return values[:, None]
+    if values.ndim != 2:
+        raise InvalidInputError("values must be a 1-D or 2-D array (time x series).")
+    return values
+
+
+def rolling_means(values: np.ndarray, windows: Iterable[int]) -> Dict[int, np.ndarray]:
+    """
+    Trailing means for several windows from one shared cumulative sum
+    (float64 accumulation). A window containing a NaN yields NaN, like
+    `rolling(window).mean()`.
+    """
+    values = _as_2d(values)
+    n = values.shape[0]
+    nan = np.isnan(values)
+    csum = np.zeros((n + 1,) + values.shape[1:])
+    np.cumsum(np.where(nan, 0.0, values), axis=0, out=csum[1:])
+    cnan = np.zeros((n + 1,) + values.shape[1:], dtype=np.int64)
+    np.cumsum(nan, axis=0, out=cnan[1:])
+
+    out = {}
+    for w in windows:
+        res = np.full(values.shape, np.nan)
+        if w <= n:
+            sums = csum[w:] - csum[:-w]
+            gaps = cnan[w:] - cnan[:-w]
+            res[w - 1 :] = np.where(gaps == 0, sums / w, np.nan)
+        out[w] = res
+    return out
+
+
+def _ewm_scan(values: np.ndarray, alpha: float, last: np.ndarray) -> np.ndarray:
+    """
+    y_t = (1 - alpha) * y_{t-1} + alpha * x_t for NaN-free columns starting
+    from `last`, as a scaled cumulative sum over row blocks short enough
+    that the scale factors stay within 1e2 (bounding the rounding error).
+    """
+    decay = 1.0 - alpha
+    if decay == 0.0:
+        return values.copy()
+    block = max(1, int(np.log(1e-2) / np.log(decay)))
+    powers = decay ** np.arange(1, block + 1)
+    out = np.empty_like(values)
+    prev = last
+    for lo in range(0, values.shape[0], block):
+        x = values[lo : lo + block]
+        p = powers[: len(x), None]
+        y = p * (prev + alpha * np.cumsum(x / p, axis=0))
+        out[lo : lo + len(x)] = y
+        prev = y[-1]
+    return out
+
+
+def ewm_resume(values: np.ndarray, alpha: float, state: list, ignore_na: bool = False) -> np.ndarray:
+    """
+    `ewm_smooth` of the next piece of a series that was smoothed in pieces.
+    `state` (empty at first, then [last value, bars since the last
+    observation] per column) is updated in place.
+
+    Columns without NaNs in the piece or a pending gap are resumed with a
+    vectorized scan. The others go through pandas' compiled recursion with
+    the carried state replayed as a short prefix: the last value followed by
+    its trailing gap, which decays the old weight exactly as it would have
+    (gaps beyond the point where that weight underflows are cut short).
+    """
+    if not (0 < alpha <= 1):
+        raise InvalidInputError("alpha must be in (0, 1].")
+    values = _as_2d(values)
+    n_rows, n_cols = values.shape
+    if state:
+        last, gap = state
+    else:
+        last, gap = np.full(n_cols, np.nan), np.zeros(n_cols, dtype=np.int64)
+    if n_rows == 0:
+        return values.copy()
+
+    obs = ~np.isnan(values)
+    started = ~np.isnan(last)
+    out = np.empty_like(values)
+
+    clean = obs.all(axis=0) & (~started | (gap == 0))
+    # A series that has not started yet starts at its first value
+    first = np.where(started, last, values[0])
+    if clean.all():
+        out = _ewm_scan(values, alpha, first)
+    elif clean.any():
+        out[:, clean] = _ewm_scan(values[:, clean], alpha, first[clean])
+
+    rest = np.flatnonzero(~clean)
+    if len(rest):
+        decay = 1.0 - alpha
+        if ignore_na or decay == 0.0:
+            lag = np.zeros(len(rest), dtype=np.int64)
+        else:
+            # (1 - alpha)**cap < 1e-18 * alpha: older weight no longer changes a float64 result
+            cap = int(np.ceil(np.log(1e-18 * alpha) / np.log(decay)))
+            lag = np.minimum(gap[rest], cap)
+        on = started[rest]
+        k = int(lag[on].max()) if on.any() else 0
+        prefix = np.full((k + 1, len(rest)), np.nan)
+        cols = np.flatnonzero(on)
+        prefix[k - lag[cols], cols] = last[rest][cols]
+        out[:, rest] = ewm_smooth(np.vstack([prefix, values[:, rest]]), alpha, ignore_na=ignore_na)[k + 1 :]
+
+    seen = obs.any(axis=0)
+    last_obs = n_rows - 1 - np.argmax(obs[::-1], axis=0)
+    state[:] = [out[-1].copy(), np.where(seen, n_rows - 1 - last_obs, gap + n_rows)]
+    return out
+
+
+def ewm_smooth(values: np.ndarray, alpha: float, ignore_na: bool = False) -> np.ndarray:
+    """
+    Recursive exponential smoothing y_t = (1 - alpha) * y_{t-1} + alpha * x_t
+    applied column-wise to a (time x series) array, i.e.
+    `DataFrame.ewm(alpha=alpha, adjust=False, ignore_na=ignore_na).mean()`
+    (pandas' compiled recursion, for any number of columns).
+    """
+    if not (0 < alpha <= 1):
+        raise InvalidInputError("alpha must be in (0, 1].")
+    values = _as_2d(values)
+    return pd.DataFrame(values).ewm(alpha=alpha, adjust=False, ignore_na=ignore_na).mean().to_numpy()
+
+
+def wilder_smooth(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Wilder's smoothing: the first value is the simple mean of the first
+    `window` observations, then y_t = (y_{t-1} * (window - 1) + x_t) / window.
+    Missing values are skipped (the previous value is carried forward).
+    """
+    if not isinstance(window, int) or window <= 0:
+        raise InvalidInputError("window must be a positive integer.")
+    values = _as_2d(values)
+    valid = ~np.isnan(values)
+    seen = np.cumsum(valid, axis=0)
+    seed_row = (seen == window) & valid
+    csum = np.cumsum(np.where(valid, values, 0.0), axis=0)
+
+    # Replace the window-th observation with the seed mean and hide everything before it;
+    # from there on it is plain ewm(alpha=1/window) that skips NaNs.
+    seeded = np.where(seen < window, np.nan, values)
+    seeded = np.where(seed_row, csum / window, seeded)
+    return ewm_smooth(seeded, 1.0 / window, ignore_na=True)
+
+
+def smooth(values: np.ndarray, window: int, method: str = "simple") -> np.ndarray:
+    """
+    Column-wise smoothing of a (time x series) array:
+    "simple" = rolling mean, "wilder" = Wilder's recursive mean,
+    "ema" = ewm(span=window, adjust=False).
+    """
+    if not isinstance(window, int) or window <= 0:
+        raise InvalidInputError("window must be a positive integer.")
+    if method == "simple":
+        return rolling_means(values, [window])[window]
+    if method == "wilder":
+        return wilder_smooth(values, window)
+    if method == "ema":
+        return ewm_smooth(values, 2.0 / (window + 1.0))
+    raise InvalidInputError(f"Unknown smoothing method '{method}'. Supported: {SMOOTHING_METHODS}")
@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from .exceptions import InvalidInputError
+from .indicators import _rsi_from_averages
+from .kernels import wilder_smooth
+
+
+Tick = Union[float, np.ndarray, pd.Series]
+SeriesOrFrame = Union[pd.Series, pd.DataFrame]
+
+
+def _check_window(window: int, name: str = "window") -> None:
+    if not isinstance(window, int) or window <= 0:
+        raise InvalidInputError(f"{name} must be a positive integer.")
+
+
+def _history_array(history: SeriesOrFrame) -> np.ndarray:
+    if not isinstance(history, (pd.Series, pd.DataFrame)):
+        raise InvalidInputError("history must be a pandas Series or DataFrame.")
+    if history.empty:
+        raise InvalidInputError("history cannot be empty.")
+    values = history.to_numpy(dtype=float)
+    return values[:, None] if values.ndim == 1 else values
+
+
+class _OnlineIndicator(ABC):
+    """
+    Shared plumbing: state is a vector with one slot per series, sized on the
+    first update. A scalar tick returns a float; an array or Series of ticks
+    (one per ticker) returns the same shape/labels.
+    """
+
+    def __init__(self) -> None:
+        self.n: Optional[int] = None
+        self.count = 0
+        self._value: Optional[np.ndarray] = None
+
+    @abstractmethod
+    def _init_state(self, n: int) -> None:
+        """Allocate the state for `n` series."""
+
+    @abstractmethod
+    def _step(self, x: np.ndarray) -> np.ndarray:
+        """Consume one bar per series and return the new values."""
+
+    def update(self, x: Tick) -> Tick:
+        """Feed one new bar (per ticker) and return the updated indicator value."""
+        arr = np.atleast_1d(np.asarray(x, dtype=float))
+        if arr.ndim != 1:
+            raise InvalidInputError("update expects a scalar or a 1-D vector with one value per ticker.")
+        if self.n is None:
+            self.n = len(arr)
+            self._init_state(self.n)
+        elif len(arr) != self.n:
+            raise InvalidInputError(f"Expected {self.n} values per update, got {len(arr)}.")
+
+        out = self._step(arr)
+        self.count += 1
+        self._value = out
+        if isinstance(x, pd.Series):
+            return pd.Series(out, index=x.index, name=x.name)
+        if np.ndim(x) == 0:
+            return float(out[0])
+        return out.copy()
+
+    @property
+    def value(self) -> Optional[np.ndarray]:
+        """Latest value per series (None before the first update)."""
+        return None if self._value is None else self._value.copy()
+
+
+class OnlineSMA(_OnlineIndicator):
+    """Incremental equivalent of `indicators.sma` backed by a ring buffer; O(1) per tick."""
+
+    def __init__(self, window: int) -> None:
+        _check_window(window)
+        super().__init__()
+        self.window = window
+
+    def _init_state(self, n: int) -> None:
+        self._buf = np.full((self.window, n), np.nan)
+        self._pos = 0
+        self._sum = np.zeros(n)
+        self._nans = np.full(n, self.window)
+
+    def _step(self, x: np.ndarray) -> np.ndarray:
+        old = self._buf[self._pos]
+        old_nan = np.isnan(old)
+        new_nan = np.isnan(x)
+        self._sum += np.where(new_nan, 0.0, x) - np.where(old_nan, 0.0, old)
+        self._nans += new_nan.astype(int) - old_nan.astype(int)
+        self._buf[self._pos] = x
+        self._pos = (self._pos + 1) % self.window
+        # Like rolling(window).mean(): NaN until the window holds `window` valid values
+        return np.where(self._nans == 0, self._sum / self.window, np.nan)
+
+    @classmethod
+    def from_history(cls, history: SeriesOrFrame, window: int) -> "OnlineSMA":
+        values = _history_array(history)
+        obj = cls(window)
+        obj.n = values.shape[1]
+        obj._init_state(obj.n)
+        tail = values[-window:]
+        obj._buf[: len(tail)] = tail
+        obj._pos = len(tail) % window
+        obj._sum = np.nansum(tail, axis=0)
+        obj._nans = np.isnan(tail).sum(axis=0) + (window - len(tail))
+        obj.count = len(values)
+        obj._value = np.where(obj._nans == 0, obj._sum / window, np.nan)
+        return obj
+
+
+class OnlineEMA(_OnlineIndicator):
+    """
+    Incremental equivalent of `indicators.ema` (`ewm(span, adjust=False)`),
+    including pandas' handling of missing values.
+    """
+
+    def __init__(self, span: int) -> None:
+        _check_window(span, "span")
+        super().__init__()
+        self.span = span
+        self.alpha = 2.0 / (span + 1.0)
+
+    def _init_state(self, n: int) -> None:
+        self._weighted = np.full(n, np.nan)
+        self._old_wt = np.ones(n)
+
+    def _step(self, x: np.ndarray) -> np.ndarray:
+        obs = ~np.isnan(x)
+        started = ~np.isnan(self._weighted)
+        self._old_wt = np.where(started, self._old_wt * (1.0 - self.alpha), self._old_wt)
+        mix = (self._old_wt * self._weighted + self.alpha * x) / (self._old_wt + self.alpha)
+        self._weighted = np.where(obs, np.where(started, mix, x), self._weighted)
+        self._old_wt = np.where(obs, 1.0, self._old_wt)
+        return self._weighted.copy()
+
+    @classmethod
+    def from_history(cls, history: SeriesOrFrame, span: int) -> "OnlineEMA":
+        values = _history_array(history)
+        obj = cls(span)
+        obj.n = values.shape[1]
+        obj._init_state(obj.n)
+        batch = pd.DataFrame(values).ewm(span=span, adjust=False).mean().to_numpy()
+        obj._weighted = batch[-1].copy()
+        # Each missing value after the last observation decays the old weight once
+        obs = ~np.isnan(values)
+        last_obs = np.where(obs.any(axis=0), len(values) - 1 - np.argmax(obs[::-1], axis=0), -1)
+        trailing = len(values) - 1 - last_obs
+        obj._old_wt = np.where(last_obs >= 0, (1.0 - obj.alpha) ** trailing, 1.0)
+        obj.count = len(values)
+        obj._value = obj._weighted.copy()
+        return obj
+
+
+class _OnlineWilder(_OnlineIndicator):
+    """Incremental equivalent of `kernels.wilder_smooth`."""
+
+    def __init__(self, window: int) -> None:
+        _check_window(window)
+        super().__init__()
+        self.window = window
+
+    def _init_state(self, n: int) -> None:
+        self._seen = np.zeros(n, dtype=int)
+        self._sum = np.zeros(n)
+        self._avg = np.full(n, np.nan)
+
+    def _step(self, x: np.ndarray) -> np.ndarray:
+        obs = ~np.isnan(x)
+        seeding = obs & (self._seen < self.window)
+        self._sum = np.where(seeding, self._sum + np.where(obs, x, 0.0), self._sum)
+        recursive = obs & (self._seen >= self.window)
+        self._avg = np.where(recursive, (self._avg * (self.window - 1) + x) / self.window, self._avg)
+        self._seen = self._seen + obs
+        self._avg = np.where(seeding & (self._seen == self.window), self._sum / self.window, self._avg)
+        return self._avg.copy()
+
+    @classmethod
+    def from_history(cls, history: SeriesOrFrame, window: int) -> "_OnlineWilder":
+        values = _history_array(history)
+        obj = cls(window)
+        obj.n = values.shape[1]
+        obj._init_state(obj.n)
+        valid = ~np.isnan(values)
+        obj._seen = np.minimum(valid.sum(axis=0), window)
+        obj._sum = np.where(obj._seen < window, np.nansum(values, axis=0), 0.0)
+        obj._avg = wilder_smooth(values, window)[-1].copy()
+        obj.count = len(values)
+        obj._value = obj._avg.copy()
+        return obj
+
+
+class OnlineRSI(_OnlineIndicator):
+    """
+    Incremental equivalent of `indicators.rsi`; method="simple" (rolling
+    means of gains and losses) or "wilder".
+    """
+
+    def __init__(self, window: int = 14, method: str = "simple") -> None:
+        _check_window(window)
+        if method not in ("simple", "wilder"):
+            raise InvalidInputError("method must be 'simple' or 'wilder'.")
+        super().__init__()
+        self.window = window
+        self.method = method
+        avg = OnlineSMA if method == "simple" else _OnlineWilder
+        self._gain = avg(window)
+        self._loss = avg(window)
+
+    def _init_state(self, n: int) -> None:
+        self._prev = np.full(n, np.nan)
+
+    def _step(self, x: np.ndarray) -> np.ndarray:
+        delta = x - self._prev
+        self._prev = x
+        avg_gain = self._gain.update(np.where(delta > 0, delta, np.where(np.isnan(delta), np.nan, 0.0)))
+        avg_loss = self._loss.update(np.where(delta < 0, -delta, np.where(np.isnan(delta), np.nan, 0.0)))
+        return _rsi_from_averages(avg_gain, avg_loss)
+
+    @classmethod
+    def from_history(cls, history: SeriesOrFrame, window: int = 14, method: str = "simple") -> "OnlineRSI":
+        values = _history_array(history)
+        obj = cls(window, method)
+        obj.n = values.shape[1]
+        obj._init_state(obj.n)
+        delta = np.vstack([np.full((1, obj.n), np.nan), np.diff(values, axis=0)])
+        gain = np.where(delta > 0, delta, np.where(np.isnan(delta), np.nan, 0.0))
+        loss = np.where(delta < 0, -delta, np.where(np.isnan(delta), np.nan, 0.0))
+        avg = OnlineSMA if method == "simple" else _OnlineWilder
+        obj._gain = avg.from_history(pd.DataFrame(gain), window)
+        obj._loss = avg.from_history(pd.DataFrame(loss), window)
+        obj._prev = values[-1].copy()
+        obj.count = len(values)
+        obj._value = _rsi_from_averages(obj._gain.value, obj._loss.value)
+        return obj
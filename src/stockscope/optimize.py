@@ -0,0 +1,306 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .covariance import covariance
+from .exceptions import InvalidInputError
+from .portfolio import normalize_weights
+
+
+_GOLDEN = (np.sqrt(5.0) - 1.0) / 2.0
+
+# Try the exact solve on the current support after it has been stable this many
+# iterations, and again every _POLISH_EVERY iterations if that attempt fails
+_POLISH_AFTER = 10
+_POLISH_EVERY = 200
+
+
+@dataclass
+class Frontier:
+    weights: pd.DataFrame
+    expected_return: pd.Series
+    volatility: pd.Series
+
+
+def _inputs(
+    returns: Optional[pd.DataFrame], cov: Optional[pd.DataFrame], need_mean: bool = False,
+    expected_returns: Optional[pd.Series] = None,
+) -> Tuple[list, np.ndarray, Optional[np.ndarray]]:
+    if cov is None:
+        if not isinstance(returns, pd.DataFrame) or returns.empty:
+            raise InvalidInputError("Pass a non-empty returns DataFrame or a covariance matrix.")
+        cov = covariance(returns)
+    if not isinstance(cov, pd.DataFrame) or cov.empty or cov.shape[0] != cov.shape[1]:
+        raise InvalidInputError("cov must be a non-empty square pandas DataFrame.")
+    tickers = list(cov.columns)
+    c = cov.loc[tickers, tickers].to_numpy(dtype=float)
+    if np.isnan(c).any():
+        raise InvalidInputError("Covariance matrix contains NaNs.")
+
+    if not need_mean:
+        return tickers, c, None
+    if expected_returns is None:
+        if not isinstance(returns, pd.DataFrame):
+            raise InvalidInputError("expected_returns (or a returns DataFrame) is required.")
+        expected_returns = returns.mean()
+    if not isinstance(expected_returns, pd.Series):
+        raise InvalidInputError("expected_returns must be a pandas Series indexed by ticker.")
+    missing = [t for t in tickers if t not in expected_returns.index]
+    if missing:
+        raise InvalidInputError(f"Missing tickers in expected returns: {missing}")
+    mu = expected_returns[tickers].to_numpy(dtype=float)
+    if np.isnan(mu).any():
+        raise InvalidInputError("Expected returns contain NaNs.")
+    return tickers, c, mu
+
+
+def _as_weights(tickers: list, w: np.ndarray) -> Dict[str, float]:
+    return normalize_weights({str(t): float(v) for t, v in zip(tickers, np.clip(w, 0.0, None))})
+
+
+def _project_simplex(v: np.ndarray) -> np.ndarray:
+    """Euclidean projection onto {w >= 0, sum(w) = 1} (sort-based, O(n log n))."""
+    u = np.sort(v)[::-1]
+    css = np.cumsum(u) - 1.0
+    k = np.arange(1, len(v) + 1)
+    rho = np.flatnonzero(u - css / k > 0)[-1]
+    return np.maximum(v - css[rho] / (rho + 1), 0.0)
+
+
+def _lipschitz(c: np.ndarray, iters: int = 500) -> float:
+    """Largest eigenvalue of 2C by power iteration, with a safety margin."""
+    v = np.ones(len(c)) / np.sqrt(len(c))
+    lam = 0.0
+    for _ in range(iters):
+        cv = c @ v
+        new = float(np.linalg.norm(cv))
+        if new == 0.0:
+            return 1.0
+        v = cv / new
+        if abs(new - lam) <= 1e-8 * new:
+            break
+        lam = new
+    return 2.2 * new
+
+
+def _polish(c: np.ndarray, q: np.ndarray, support: np.ndarray) -> Optional[np.ndarray]:
+    """
+    Exact solution of min w'Cw - q'w, sum(w) = 1 restricted to `support`;
+    returned only if it satisfies the KKT conditions of the long-only problem.
+    """
+    k = int(support.sum())
+    kkt = np.zeros((k + 1, k + 1))
+    kkt[:k, :k] = 2.0 * c[np.ix_(support, support)]
+    kkt[:k, k] = kkt[k, :k] = 1.0
+    try:
+        sol = np.linalg.solve(kkt, np.r_[q[support], 1.0])
+    except np.linalg.LinAlgError:
+        return None
+    if (sol[:k] <= 0).any():
+        return None
+    w = np.zeros(len(q))
+    w[support] = sol[:k]
+    grad = 2.0 * (c @ w) - q
+    # Multipliers of the inactive bounds must be non-negative
+    slack = grad[~support] + sol[k]
+    if (slack < -1e-9 * (np.abs(grad).max() + abs(sol[k]))).any():
+        return None
+    return w
+
+
+def _solve(c: np.ndarray, q: np.ndarray, w0: np.ndarray, lip: float, tol: float, max_iter: int) -> np.ndarray:
+    """
+    min w'Cw - q'w over the simplex with FISTA (accelerated projected
+    gradient) and adaptive restart, warm-started from w0. Once the set of
+    non-zero weights stops changing, the problem on that set is solved exactly
+    and accepted if it is optimal, so iterations stop early.
+    """
+    step = 1.0 / lip
+    w = y = w0
+    t = 1.0
+    stable = 0
+    for _ in range(max_iter):
+        w_new = _project_simplex(y - step * (2.0 * (c @ y) - q))
+        diff = w_new - w
+        support = w_new > 0
+        stable = stable + 1 if np.array_equal(support, w > 0) else 0
+        if np.abs(diff).max() < tol:
+            exact = _polish(c, q, support)
+            return w_new if exact is None else exact
+        if stable % _POLISH_EVERY == _POLISH_AFTER:
+            exact = _polish(c, q, support)
+            if exact is not None:
+                return exact
+        if np.dot(y - w_new, diff) > 0:
+            # Momentum is pointing uphill: restart from the current iterate
+            t = 1.0
+            y = w_new
+        else:
+            t_new = (1.0 + np.sqrt(1.0 + 4.0 * t * t)) / 2.0
+            y = w_new + ((t - 1.0) / t_new) * diff
+            t = t_new
+        w = w_new
+    return w
+
+
+def _check_solver(tol: float, max_iter: int) -> None:
+    if not (tol > 0):
+        raise InvalidInputError("tol must be > 0.")
+    if not isinstance(max_iter, int) or max_iter <= 0:
+        raise InvalidInputError("max_iter must be a positive integer.")
+
+
+def min_variance(
+    returns: Optional[pd.DataFrame] = None,
+    cov: Optional[pd.DataFrame] = None,
+    tol: float = 1e-10,
+    max_iter: int = 20_000,
+) -> Dict[str, float]:
+    """Long-only minimum-variance weights from returns or a covariance matrix."""
+    _check_solver(tol, max_iter)
+    tickers, c, _ = _inputs(returns, cov)
+    n = len(tickers)
+    w = _solve(c, np.zeros(n), np.full(n, 1.0 / n), _lipschitz(c), tol, max_iter)
+    return _as_weights(tickers, w)
+
+
+def _max_return_tradeoff(c: np.ndarray, mu: np.ndarray) -> float:
+    """Smallest t at which the all-in-the-best-asset corner solves min w'Cw - t mu'w."""
+    j = int(np.argmax(mu))
+    gap = mu[j] - mu
+    lower = gap > 1e-15 * max(1.0, abs(mu[j]))
+    if not lower.any():
+        return 1.0
+    return float(max(np.max(2.0 * (c[j, j] - c[j, lower]) / gap[lower]), 1e-12))
+
+
+def efficient_frontier(
+    returns: Optional[pd.DataFrame] = None,
+    cov: Optional[pd.DataFrame] = None,
+    expected_returns: Optional[pd.Series] = None,
+    n_points: int = 20,
+    tol: float = 1e-10,
+    max_iter: int = 20_000,
+) -> Frontier:
+    """
+    Long-only efficient frontier at `n_points` risk-aversion levels, from the
+    minimum-variance portfolio to the highest-expected-return asset. Each
+    point solves min w'Cw - t * mu'w and starts from the previous solution.
+    Returns and volatility are per period of the inputs.
+    """
+    _check_solver(tol, max_iter)
+    if not isinstance(n_points, int) or n_points < 2:
+        raise InvalidInputError("n_points must be an integer >= 2.")
+    tickers, c, mu = _inputs(returns, cov, need_mean=True, expected_returns=expected_returns)
+    n = len(tickers)
+    lip = _lipschitz(c)
+    t_max = _max_return_tradeoff(c, mu)
+    grid = np.r_[0.0, np.geomspace(t_max * 1e-3, t_max, n_points - 1)]
+
+    rows = np.empty((n_points, n))
+    w = np.full(n, 1.0 / n)
+    for k, t in enumerate(grid):
+        w = _solve(c, t * mu, w, lip, tol, max_iter)
+        rows[k] = w
+    rows /= rows.sum(axis=1, keepdims=True)
+
+    vol = np.sqrt(np.clip(np.einsum("kn,kn->k", rows @ c, rows), 0.0, None))
+    weights = pd.DataFrame(rows, columns=[str(t).upper() for t in tickers])
+    return Frontier(
+        weights=weights,
+        expected_return=pd.Series(rows @ mu, name="expected_return"),
+        volatility=pd.Series(vol, name="volatility"),
+    )
+
+
+def max_sharpe(
+    returns: Optional[pd.DataFrame] = None,
+    cov: Optional[pd.DataFrame] = None,
+    expected_returns: Optional[pd.Series] = None,
+    risk_free: float = 0.0,
+    tol: float = 1e-10,
+    max_iter: int = 20_000,
+) -> Dict[str, float]:
+    """
+    Long-only maximum-Sharpe weights. The Sharpe ratio is unimodal along the
+    frontier, so this runs a golden-section search over the risk-aversion
+    level t of min w'Cw - t * mu'w, warm-starting every solve.
+    `risk_free` is per period of the inputs.
+    """
+    _check_solver(tol, max_iter)
+    tickers, c, mu = _inputs(returns, cov, need_mean=True, expected_returns=expected_returns)
+    if not (mu > risk_free).any():
+        raise InvalidInputError("No asset has an expected return above risk_free.")
+    n = len(tickers)
+    lip = _lipschitz(c)
+    state = {"w": np.full(n, 1.0 / n)}
+
+    def sharpe(log_t: float) -> Tuple[float, np.ndarray]:
+        w = _solve(c, np.exp(log_t) * mu, state["w"], lip, tol, max_iter)
+        state["w"] = w
+        vol = np.sqrt(max(float(w @ c @ w), 0.0))
+        return (float(w @ mu) - risk_free) / vol if vol > 0 else -np.inf, w
+
+    t_max = _max_return_tradeoff(c, mu)
+    lo, hi = np.log(t_max * 1e-8), np.log(t_max)
+    a = hi - _GOLDEN * (hi - lo)
+    b = lo + _GOLDEN * (hi - lo)
+    fa, wa = sharpe(a)
+    fb, wb = sharpe(b)
+    while hi - lo > 1e-9:
+        if fa < fb:
+            lo, a, fa, wa = a, b, fb, wb
+            b = lo + _GOLDEN * (hi - lo)
+            fb, wb = sharpe(b)
+        else:
+            hi, b, fb, wb = b, a, fa, wa
+            a = hi - _GOLDEN * (hi - lo)
+            fa, wa = sharpe(a)
+    best = wa if fa >= fb else wb
+    return _as_weights(tickers, best)
+
+
+def risk_parity(
+    returns: Optional[pd.DataFrame] = None,
+    cov: Optional[pd.DataFrame] = None,
+    budgets: Optional[Dict[str, float]] = None,
+    tol: float = 1e-12,
+    max_iter: int = 100,
+) -> Dict[str, float]:
+    """
+    Weights whose risk contributions w_i * (Cw)_i are proportional to
+    `budgets` (equal by default). Solves Spinu's convex formulation
+    min 0.5 y'Cy - sum(b_i log y_i) with damped Newton steps; w = y / sum(y).
+    """
+    _check_solver(tol, max_iter)
+    tickers, c, _ = _inputs(returns, cov)
+    n = len(tickers)
+    if budgets is None:
+        b = np.full(n, 1.0 / n)
+    else:
+        nb = normalize_weights(budgets)
+        missing = [str(t).upper() for t in tickers if str(t).upper() not in nb]
+        if missing:
+            raise InvalidInputError(f"Missing tickers in budgets: {missing}")
+        b = np.array([nb[str(t).upper()] for t in tickers])
+        if (b <= 0).any():
+            raise InvalidInputError("Risk budgets must be > 0.")
+    if (np.diag(c) <= 0).any():
+        raise InvalidInputError("Every asset needs a positive variance for risk parity.")
+
+    y = b / np.sqrt(np.diag(c))
+    y /= np.sqrt(y @ c @ y)
+    for _ in range(max_iter):
+        grad = c @ y - b / y
+        hess = c + np.diag(b / (y * y))
+        dx = np.linalg.solve(hess, grad)
+        decrement = np.sqrt(max(float(grad @ dx), 0.0))
+        if decrement < tol:
+            break
+        # Damped step keeps y > 0 and guarantees convergence (Nesterov's self-concordant analysis)
+        y = y - (dx / (1.0 + decrement) if decrement > 0.25 else dx)
+    return _as_weights(tickers, y / y.sum())
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .exceptions import InvalidInputError, EmptyDataError
+
+
+class OHLCVPanel:
+    """
+    Ticker x field x time price panel stored in one contiguous float array.
+
+    `values` has shape (n_fields, n_times, n_tickers), so each field is a
+    C-contiguous (time x ticker) block and `field()` returns a zero-copy
+    DataFrame view of it in the usual `get_prices` layout.
+    """
+
+    def __init__(self, values: np.ndarray, index: pd.DatetimeIndex, fields: Iterable[str], tickers: Iterable[str]) -> None:
+        fields = list(fields)
+        tickers = list(tickers)
+        values = np.ascontiguousarray(values, dtype=float)
+        if values.shape != (len(fields), len(index), len(tickers)):
+            raise InvalidInputError(
+                f"values shape {values.shape} does not match (fields, index, tickers) = "
+                f"({len(fields)}, {len(index)}, {len(tickers)})."
+            )
+        self.values = values
+        self.index = pd.DatetimeIndex(index)
+        self.fields = fields
+        self.tickers = tickers
+        self._field_pos = {f: i for i, f in enumerate(fields)}
+        self._ticker_pos = {t: i for i, t in enumerate(tickers)}
+
+    @classmethod
+    def from_frames(cls, frames: Dict[str, pd.DataFrame], tickers: Optional[List[str]] = None) -> "OHLCVPanel":
+        """Pack field -> DataFrame(time x tickers) frames into a single panel."""
+        frames = {f: df for f, df in frames.items() if df is not None and not df.empty}
+        if not frames:
+            raise EmptyDataError("No data to build a panel from.")
+
+        index = frames[next(iter(frames))].index
+        for df in frames.values():
+            if not df.index.equals(index):
+                index = index.union(df.index)
+        index = pd.DatetimeIndex(pd.to_datetime(index)).sort_values()
+        if tickers is None:
+            tickers = list(dict.fromkeys(t for df in frames.values() for t in df.columns))
+
+        values = np.full((len(frames), len(index), len(tickers)), np.nan)
+        for k, df in enumerate(frames.values()):
+            df = df.set_axis(pd.to_datetime(df.index), axis=0)
+            values[k] = df.reindex(index=index, columns=tickers).to_numpy(dtype=float)
+        return cls(values, index, frames.keys(), tickers)
+
+    @property
+    def shape(self) -> tuple:
+        return self.values.shape
+
+    @property
+    def nbytes(self) -> int:
+        return self.values.nbytes
+
+    def field(self, name: str) -> pd.DataFrame:
+        """Zero-copy DataFrame (time x tickers) view of one field."""
+        if name not in self._field_pos:
+            raise InvalidInputError(f"Unknown field '{name}'. Available: {self.fields}")
+        return pd.DataFrame(self.values[self._field_pos[name]], index=self.index, columns=self.tickers, copy=False)
+
+    def ticker(self, name: str) -> pd.DataFrame:
+        """DataFrame (time x fields) of one ticker's bars."""
+        if name not in self._ticker_pos:
+            raise InvalidInputError(f"Unknown ticker '{name}'.")
+        return pd.DataFrame(self.values[:, :, self._ticker_pos[name]].T, index=self.index, columns=self.fields)
+
+    def prices(self, price_field: str = "Adj Close") -> pd.DataFrame:
+        """
+        One field normalized like `get_prices` output (all-NaN rows and
+        tickers without data dropped), without touching the network.
+        """
+        out = self.field(price_field)
+        out = out.dropna(how="all")
+        out = out.dropna(axis=1, how="all")
+        if out.empty:
+            raise EmptyDataError("All values are NaN after cleaning.")
+        return out
+
+    def __repr__(self) -> str:
+        return f"OHLCVPanel(fields={self.fields}, tickers={len(self.tickers)}, bars={len(self.index)})"
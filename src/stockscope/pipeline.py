@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple, Union
+
+from .exceptions import InvalidInputError
+from .frame import _freeze
+
+
+class Node:
+    """One step of a Pipeline: `func` applied to constants and the outputs of other nodes."""
+
+    __slots__ = ("name", "func", "args", "kwargs")
+
+    def __init__(self, name: str, func: Callable, args: Tuple, kwargs: Dict[str, Any]) -> None:
+        self.name = name
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+
+    @property
+    def deps(self) -> List["Node"]:
+        found = [a for a in self.args if isinstance(a, Node)]
+        found += [v for v in self.kwargs.values() if isinstance(v, Node)]
+        return list(dict.fromkeys(found))
+
+    def __repr__(self) -> str:
+        return f"Node({self.name!r})"
+
+
+@dataclass
+class PipelineResult:
+    values: Dict[str, Any]
+    timings: Dict[str, float]
+    wall_time: float = 0.0
+    executed: List[str] = field(default_factory=list)
+
+    def __getitem__(self, node: Union[Node, str]) -> Any:
+        return self.values[node.name if isinstance(node, Node) else node]
+
+
+def _constant(value: Any) -> Any:
+    return value
+
+
+def _select(value: Any, key: Any) -> Any:
+    return value[key]
+
+
+def _run_node(func: Callable, args: Tuple, kwargs: Dict[str, Any]) -> Tuple[Any, float]:
+    t0 = time.perf_counter()
+    out = func(*args, **kwargs)
+    return out, time.perf_counter() - t0
+
+
+class Pipeline:
+    """
+    Declarative graph of analysis steps.
+
+        p = Pipeline()
+        prices = p.add(get_prices, ["AAPL", "MSFT"], start="2024-01-01", end="2024-12-31")
+        rets = p.add(daily_returns, prices)
+        vol = p.add(volatility, rets)
+        port = p.add(portfolio_returns, rets, {"AAPL": 0.5, "MSFT": 0.5})
+        result = p.run()
+        result[vol], result.timings
+
+    Any Node passed as an argument becomes a dependency. Adding the same
+    function with the same arguments again returns the existing node, so
+    several reports declared on one pipeline share their fetch/returns steps.
+    `run` executes each needed node once, independent branches in parallel.
+    """
+
+    def __init__(self) -> None:
+        self._nodes: Dict[Hashable, Node] = {}
+        self._names: Dict[str, Node] = {}
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    @property
+    def nodes(self) -> List[Node]:
+        return list(self._names.values())
+
+    def _unique_name(self, base: str) -> str:
+        name, k = base, 2
+        while name in self._names:
+            name = f"{base}_{k}"
+            k += 1
+        return name
+
+    def add(self, func: Callable, *args: Any, name: Optional[str] = None, **kwargs: Any) -> Node:
+        """Declare `func(*args, **kwargs)`; Node arguments are replaced by their results at run time."""
+        if not callable(func):
+            raise InvalidInputError("func must be callable.")
+        for v in list(args) + list(kwargs.values()):
+            if isinstance(v, Node) and self._names.get(v.name) is not v:
+                raise InvalidInputError(f"{v!r} belongs to a different pipeline.")
+        try:
+            key: Hashable = (func, _freeze(args), _freeze(kwargs))
+        except TypeError:
+            # Unhashable constants (e.g. a DataFrame): the node cannot be shared
+            key = object()
+        if key in self._nodes:
+            return self._nodes[key]
+        if name is not None and name in self._names:
+            raise InvalidInputError(f"A node named '{name}' already exists.")
+        node = Node(name or self._unique_name(getattr(func, "__name__", "node")), func, tuple(args), dict(kwargs))
+        self._nodes[key] = node
+        self._names[node.name] = node
+        return node
+
+    def source(self, value: Any, name: str) -> Node:
+        """A node that just yields `value` (e.g. prices fetched elsewhere), identified by `name`."""
+        if name in self._names:
+            existing = self._names[name]
+            if existing.func is _constant and existing.args[0] is value:
+                return existing
+            raise InvalidInputError(f"A node named '{name}' already exists.")
+        node = Node(name, _constant, (value,), {})
+        self._nodes[object()] = node
+        self._names[name] = node
+        return node
+
+    def select(self, node: Node, key: Any, name: Optional[str] = None) -> Node:
+        """A node yielding `result_of_node[key]`, e.g. one ticker's column."""
+        return self.add(_select, node, key, name=name)
+
+    def _plan(self, targets: Optional[Iterable[Union[Node, str]]]) -> List[Node]:
+        if targets is None:
+            wanted = self.nodes
+        else:
+            wanted = []
+            for t in targets:
+                node = self._names.get(t.name if isinstance(t, Node) else t)
+                if node is None or (isinstance(t, Node) and node is not t):
+                    raise InvalidInputError(f"Unknown pipeline node: {t!r}")
+                wanted.append(node)
+
+        # Depth-first topological order over the ancestors of the targets
+        order: List[Node] = []
+        state: Dict[str, int] = {}
+        for root in wanted:
+            stack = [(root, False)]
+            while stack:
+                node, done = stack.pop()
+                if done:
+                    state[node.name] = 2
+                    order.append(node)
+                    continue
+                if state.get(node.name) == 2:
+                    continue
+                if state.get(node.name) == 1:
+                    raise InvalidInputError(f"Pipeline has a cycle through {node!r}.")
+                state[node.name] = 1
+                stack.append((node, True))
+                stack.extend((d, False) for d in node.deps if state.get(d.name) != 2)
+        return order
+
+    def run(
+        self,
+        targets: Optional[Sequence[Union[Node, str]]] = None,
+        executor: Optional[str] = "thread",
+        max_workers: Optional[int] = None,
+    ) -> PipelineResult:
+        """
+        Execute the nodes needed for `targets` (all nodes by default).
+
+        executor: "thread", "process" (functions and values must be
+          picklable) or None to run sequentially in dependency order.
+        Returns every computed value by node name plus per-node timings.
+        The first failing node's exception is re-raised once running nodes finish.
+        """
+        if executor not in (None, "thread", "process"):
+            raise InvalidInputError("executor must be 'thread', 'process' or None.")
+        if max_workers is not None and (not isinstance(max_workers, int) or max_workers <= 0):
+            raise InvalidInputError("max_workers must be a positive integer.")
+        order = self._plan(targets)
+        values: Dict[str, Any] = {}
+        timings: Dict[str, float] = {}
+        executed: List[str] = []
+        t0 = time.perf_counter()
+
+        def call_args(node: Node) -> Tuple[Tuple, Dict[str, Any]]:
+            args = tuple(values[a.name] if isinstance(a, Node) else a for a in node.args)
+            kwargs = {k: values[v.name] if isinstance(v, Node) else v for k, v in node.kwargs.items()}
+            return args, kwargs
+
+        def finish(node: Node, out: Any, elapsed: float) -> None:
+            values[node.name] = out
+            timings[node.name] = elapsed
+            executed.append(node.name)
+
+        if executor is None or len(order) <= 1:
+            for node in order:
+                finish(node, *_run_node(node.func, *call_args(node)))
+            return PipelineResult(values, timings, time.perf_counter() - t0, executed)
+
+        pending = {n.name: len(n.deps) for n in order}
+        children: Dict[str, List[Node]] = {n.name: [] for n in order}
+        for n in order:
+            for d in n.deps:
+                children[d.name].append(n)
+
+        pool_cls = ThreadPoolExecutor if executor == "thread" else ProcessPoolExecutor
+        with pool_cls(max_workers=max_workers) as pool:
+            ready = [n for n in order if pending[n.name] == 0]
+            running: Dict[Any, Node] = {}
+            error: Optional[BaseException] = None
+            while ready or running:
+                for node in ready:
+                    args, kwargs = call_args(node)
+                    running[pool.submit(_run_node, node.func, args, kwargs)] = node
+                ready = []
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    node = running.pop(fut)
+                    try:
+                        out, elapsed = fut.result()
+                    except BaseException as exc:
+                        error = error or exc
+                        continue
+                    finish(node, out, elapsed)
+                    for child in children[node.name]:
+                        pending[child.name] -= 1
+                        if pending[child.name] == 0 and error is None:
+                            ready.append(child)
+            if error is not None:
+                raise error
+        return PipelineResult(values, timings, time.perf_counter() - t0, executed)
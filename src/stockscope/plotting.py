@@ -1,24 +1,78 @@
 from __future__ import annotations
 
-from typing import Optional
+import hashlib
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
 
 from .exceptions import InvalidInputError
 from .indicators import sma
-from .risk import max_drawdown
+from .risk import drawdown_stats, max_drawdown
 
 
-def plot_price(series: pd.Series, title: str = "Price", show: bool = True):
-    if not isinstance(series, pd.Series) or series.empty:
-        raise InvalidInputError("series must be a non-empty pandas Series.")
-    fig, ax = plt.subplots()
-    ax.plot(series.index, series.values)
+CHART_KINDS = ("price", "sma", "drawdown")
+DOWNSAMPLE_METHODS = ("minmax", "lttb")
+
+
+def _draw_price(ax, x, y, title: str) -> None:
+    ax.plot(x, y)
     ax.set_title(title)
     ax.set_xlabel("Date")
     ax.set_ylabel("Price")
     ax.grid(True)
+
+
+def _draw_sma(ax, x, y, ma_x, ma_y, window: int, title: str) -> None:
+    ax.plot(x, y, label="Price")
+    ax.plot(ma_x, ma_y, label=f"SMA({window})")
+    ax.set_title(title)
+    ax.set_xlabel("Date")
+    ax.set_ylabel("Value")
+    ax.grid(True)
+    ax.legend()
+
+
+def _shade_worst(ax, worst: Optional[Tuple]) -> None:
+    if worst is not None:
+        # Shade the worst episode from peak to recovery (or the end of the data)
+        peak, end, depth = worst
+        ax.axvspan(peak, end, alpha=0.2, label=f"Max drawdown {depth:.1%}")
+        ax.legend()
+
+
+def _draw_drawdown(ax, x, dd, worst: Optional[Tuple], title: str) -> None:
+    ax.plot(x, dd)
+    _shade_worst(ax, worst)
+    ax.set_title(title)
+    ax.set_xlabel("Date")
+    ax.set_ylabel("Drawdown")
+    ax.grid(True)
+
+
+def _worst_episode(stats: pd.Series, last_date) -> Optional[Tuple]:
+    if pd.isna(stats["peak"]):
+        return None
+    end = stats["recovery"] if pd.notna(stats["recovery"]) else last_date
+    return stats["peak"], end, stats["max_drawdown"]
+
+
+def _pyplot():
+    # Imported on first plot so that importing stockscope never loads a GUI backend
+    import matplotlib.pyplot as plt
+
+    return plt
+
+
+def plot_price(series: pd.Series, title: str = "Price", show: bool = True):
+    if not isinstance(series, pd.Series) or series.empty:
+        raise InvalidInputError("series must be a non-empty pandas Series.")
+    plt = _pyplot()
+    fig, ax = plt.subplots()
+    _draw_price(ax, series.index, series.values, title)
     if show:
         plt.show()
     return fig, ax
@@ -28,29 +82,266 @@ def plot_price_with_sma(series: pd.Series, window: int = 20, title: Optional[str
     if not isinstance(series, pd.Series) or series.empty:
         raise InvalidInputError("series must be a non-empty pandas Series.")
     ma = sma(series, window=window)
+    plt = _pyplot()
     fig, ax = plt.subplots()
-    ax.plot(series.index, series.values, label="Price")
-    ax.plot(ma.index, ma.values, label=f"SMA({window})")
-    ax.set_title(title or f"Price + SMA({window})")
-    ax.set_xlabel("Date")
-    ax.set_ylabel("Value")
-    ax.grid(True)
-    ax.legend()
+    _draw_sma(ax, series.index, series.values, ma.index, ma.values, window, title or f"Price + SMA({window})")
     if show:
         plt.show()
     return fig, ax
 
 
-def plot_drawdown(series: pd.Series, title: str = "Drawdown", show: bool = True):
+def plot_drawdown(series: pd.Series, title: str = "Drawdown", show: bool = True, highlight_max: bool = True):
     if not isinstance(series, pd.Series) or series.empty:
         raise InvalidInputError("series must be a non-empty pandas Series.")
     dd = max_drawdown(series)
+    worst = _worst_episode(drawdown_stats(series).iloc[0], dd.index[-1]) if highlight_max else None
+    plt = _pyplot()
     fig, ax = plt.subplots()
-    ax.plot(dd.index, dd.values)
-    ax.set_title(title)
-    ax.set_xlabel("Date")
-    ax.set_ylabel("Drawdown")
-    ax.grid(True)
+    _draw_drawdown(ax, dd.index, dd.values, worst, title)
     if show:
         plt.show()
     return fig, ax
+
+
+# ---------------------------------------------------------------------------
+# Downsampling
+# ---------------------------------------------------------------------------
+
+
+def _minmax_rows(y: np.ndarray, n_out: int) -> np.ndarray:
+    # Keep the lowest and highest point of each bucket (plus both ends): spikes survive
+    n = len(y)
+    buckets = max(n_out // 2, 1)
+    starts = np.unique(np.linspace(0, n, buckets + 1).astype(int)[:-1])
+    seg = np.repeat(np.arange(len(starts)), np.diff(np.r_[starts, n]))
+    keep = [0, n - 1]
+    for extreme in (np.minimum.reduceat(y, starts), np.maximum.reduceat(y, starts)):
+        hits = np.flatnonzero(y == extreme[seg])
+        keep.append(hits[np.r_[True, seg[hits][1:] != seg[hits][:-1]]])
+    return np.unique(np.concatenate([np.atleast_1d(k) for k in keep]))
+
+
+def _lttb_rows(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    # Largest-Triangle-Three-Buckets: per bucket, the point forming the largest
+    # triangle with the previously kept point and the next bucket's average
+    n = len(y)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    out = np.empty(n_out, dtype=np.int64)
+    out[0], out[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        nxt_hi = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x, avg_y = x[hi:nxt_hi].mean(), y[hi:nxt_hi].mean()
+        area = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        a = lo + int(np.argmax(area))
+        out[i + 1] = a
+    return out
+
+
+def _downsample_rows(x: np.ndarray, y: np.ndarray, n_out: int, method: str) -> np.ndarray:
+    """Positions of the points to draw for a line of `len(y)` points (NaNs are dropped)."""
+    valid = np.flatnonzero(~np.isnan(y))
+    if len(valid) <= n_out or n_out < 3:
+        return valid
+    yv = y[valid]
+    if method == "minmax":
+        return valid[_minmax_rows(yv, n_out)]
+    xv = x[valid].astype(np.int64).astype(float) if x.dtype.kind == "M" else x[valid].astype(float)
+    return valid[_lttb_rows(xv - xv[0], yv, n_out)]
+
+
+def downsample(series: pd.Series, n_out: int, method: str = "lttb") -> pd.Series:
+    """
+    Reduce a long series to about `n_out` points that draw the same line:
+    "lttb" (Largest-Triangle-Three-Buckets, keeps the shape) or "minmax"
+    (each bucket's low and high, keeps every spike). NaNs are dropped.
+    """
+    if not isinstance(series, pd.Series) or series.empty:
+        raise InvalidInputError("series must be a non-empty pandas Series.")
+    if not isinstance(n_out, int) or n_out <= 0:
+        raise InvalidInputError("n_out must be a positive integer.")
+    if method not in DOWNSAMPLE_METHODS:
+        raise InvalidInputError(f"method must be one of {DOWNSAMPLE_METHODS}.")
+    rows = _downsample_rows(series.index.to_numpy(), series.to_numpy(dtype=float), n_out, method)
+    return series.iloc[rows]
+
+
+# ---------------------------------------------------------------------------
+# Batch rendering
+# ---------------------------------------------------------------------------
+
+
+class _Chart:
+    """Figure, axes and lines reused for every chart of one kind drawn in this process."""
+
+    def __init__(self, opts: dict) -> None:
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        self.opts = opts
+        self.fig = Figure(figsize=opts["figsize"], dpi=opts["dpi"])
+        FigureCanvasAgg(self.fig)
+        self.ax = self.fig.add_subplot()
+        self.lines = None
+
+    def draw(self, lines: List[Tuple[np.ndarray, np.ndarray]], title: str, worst: Optional[Tuple]) -> None:
+        ax, kind = self.ax, self.opts["kind"]
+        if self.lines is None:
+            # The first chart creates the artists; later ones only swap their data
+            if kind == "price":
+                _draw_price(ax, *lines[0], title)
+            elif kind == "sma":
+                _draw_sma(ax, *lines[0], *lines[1], self.opts["window"], title)
+            else:
+                _draw_drawdown(ax, *lines[0], worst, title)
+            self.lines = list(ax.lines)
+            return
+        for artist, (x, y) in zip(self.lines, lines):
+            artist.set_data(x, y)
+        ax.set_title(title)
+        if kind == "drawdown":
+            for patch in list(ax.patches):
+                patch.remove()
+            if ax.get_legend() is not None:
+                ax.get_legend().remove()
+            _shade_worst(ax, worst)
+        ax.relim()
+        ax.autoscale_view()
+
+
+# Per worker process: one _Chart per chart layout
+_CHARTS: Dict[tuple, _Chart] = {}
+
+
+def _render_chunk(x: np.ndarray, items: List[tuple], opts: dict) -> List[str]:
+    n_out, method = opts["max_points"], opts["downsample"]
+    key = tuple(sorted(opts.items()))
+    if key not in _CHARTS:
+        _CHARTS[key] = _Chart(opts)
+    chart = _CHARTS[key]
+
+    def thin(y):
+        if method is None:
+            return x, y
+        rows = _downsample_rows(x, y, n_out, method)
+        return x[rows], y[rows]
+
+    written = []
+    for path, title, lines, worst in items:
+        chart.draw([thin(y) for y in lines], title, worst)
+        # Fast PNG compression: the files are a bit larger but encode several times faster
+        extra = {"pil_kwargs": {"compress_level": 1}} if opts["fmt"] == "png" else {}
+        chart.fig.savefig(path, format=opts["fmt"], **extra)
+        written.append(path)
+    return written
+
+
+def _safe_name(ticker: str) -> str:
+    return re.sub(r"[^A-Za-z0-9._-]", "_", str(ticker))
+
+
+def _file_names(tickers: Sequence[str]) -> Dict[str, str]:
+    """
+    Filename stem per ticker. When several tickers sanitize to the same stem
+    (e.g. BRK/B and BRK:B, or case variants on case-insensitive disks), one
+    ticker whose stem is its own name keeps it and the others get a short
+    hash of the ticker appended.
+    """
+    stems = {t: _safe_name(t) for t in tickers}
+    groups: Dict[str, List[str]] = {}
+    for t, stem in stems.items():
+        groups.setdefault(stem.lower(), []).append(t)
+    names = {}
+    for group in groups.values():
+        plain = next((t for t in group if stems[t] == str(t)), group[0] if len(group) == 1 else None)
+        for t in group:
+            stem = stems[t]
+            names[t] = stem if t == plain else f"{stem}_{hashlib.sha1(str(t).encode()).hexdigest()[:8]}"
+    return names
+
+
+def render_charts(
+    prices: pd.DataFrame,
+    out_dir: str,
+    kind: str = "price",
+    window: int = 20,
+    tickers: Optional[Iterable[str]] = None,
+    fmt: str = "png",
+    figsize: Tuple[float, float] = (8.0, 4.0),
+    dpi: int = 100,
+    max_points: Optional[int] = None,
+    downsample: Optional[str] = "minmax",
+    n_jobs: int = 1,
+) -> Dict[str, str]:
+    """
+    Write one chart per ticker (`<out_dir>/<TICKER>_<kind>.<fmt>`, with a
+    short hash added when two tickers would share a file name) without
+    pyplot: each process draws on one Agg figure whose axes and lines are
+    reused, so nothing accumulates however many charts are made.
+
+    kind: "price", "sma" (price + SMA(window)) or "drawdown" (worst episode shaded).
+    Lines longer than `max_points` (default: the figure width in pixels) are
+    downsampled first ("minmax" or "lttb", None to draw every point).
+    With `n_jobs > 1`, tickers are spread over that many worker processes.
+    SMA and drawdowns are computed for all tickers at once before drawing.
+    Returns ticker -> file path.
+    """
+    if not isinstance(prices, pd.DataFrame) or prices.empty:
+        raise InvalidInputError("prices must be a non-empty pandas DataFrame.")
+    if kind not in CHART_KINDS:
+        raise InvalidInputError(f"kind must be one of {CHART_KINDS}.")
+    if downsample is not None and downsample not in DOWNSAMPLE_METHODS:
+        raise InvalidInputError(f"downsample must be one of {DOWNSAMPLE_METHODS} or None.")
+    if not isinstance(n_jobs, int) or n_jobs <= 0:
+        raise InvalidInputError("n_jobs must be a positive integer.")
+    if max_points is None:
+        max_points = int(figsize[0] * dpi)
+    if not isinstance(max_points, int) or max_points < 3:
+        raise InvalidInputError("max_points must be an integer >= 3.")
+
+    selected: Sequence[str] = list(prices.columns) if tickers is None else list(tickers)
+    missing = [t for t in selected if t not in prices.columns]
+    if missing:
+        raise InvalidInputError(f"Missing tickers in price data: {missing}")
+    if not selected:
+        raise InvalidInputError("tickers cannot be empty.")
+    p = prices[selected]
+
+    values = p.to_numpy(dtype=float)
+    extra = None
+    if kind == "sma":
+        extra = sma(p, window).to_numpy(dtype=float)
+    elif kind == "drawdown":
+        extra = max_drawdown(p).to_numpy(dtype=float)
+        stats = drawdown_stats(p)
+
+    os.makedirs(out_dir, exist_ok=True)
+    items = []
+    paths = {}
+    names = _file_names(selected)
+    for j, t in enumerate(selected):
+        path = os.path.join(out_dir, f"{names[t]}_{kind}.{fmt}")
+        paths[t] = path
+        if kind == "price":
+            items.append((path, f"{t} Price", [values[:, j]], None))
+        elif kind == "sma":
+            items.append((path, f"{t} Price + SMA({window})", [values[:, j], extra[:, j]], None))
+        else:
+            worst = _worst_episode(stats.iloc[j], p.index[-1])
+            items.append((path, f"{t} Drawdown", [extra[:, j]], worst))
+
+    opts = {"kind": kind, "window": window, "fmt": fmt, "figsize": tuple(figsize), "dpi": dpi,
+            "max_points": max_points, "downsample": downsample}
+    x = p.index.to_numpy()
+    if n_jobs == 1 or len(items) == 1:
+        _render_chunk(x, items, opts)
+        return paths
+
+    # A few chunks per worker balances load without pickling per chart
+    size = max(1, -(-len(items) // (n_jobs * 4)))
+    chunks = [items[i : i + size] for i in range(0, len(items), size)]
+    with ProcessPoolExecutor(max_workers=n_jobs) as ex:
+        for _ in ex.map(_render_chunk, [x] * len(chunks), chunks, [opts] * len(chunks)):
+            pass
+    return paths
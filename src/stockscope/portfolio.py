@@ -1,11 +1,13 @@
 from __future__ import annotations
 
-from typing import Dict
+from typing import Dict, Optional, Sequence, Union
 
 import numpy as np
 import pandas as pd
 
 from .exceptions import InvalidInputError
+from .frame import accepts_price_frame
+from .options import as_float
 
 
 def normalize_weights(weights: Dict[str, float], tol: float = 1e-8) -> Dict[str, float]:
@@ -45,14 +47,16 @@ def portfolio_returns(asset_returns: pd.DataFrame, weights: Dict[str, float]) ->
     if missing:
         raise InvalidInputError(f"Missing tickers in returns data: {missing}")
 
-    # Align column order to weights
-    ordered = asset_returns[list(w.keys())].copy()
+    # Align column order to weights (a new frame already; the caller's data is never modified)
+    ordered = asset_returns[list(w.keys())]
     w_vec = np.array([w[t] for t in ordered.columns], dtype=float)
 
-    port = ordered.values @ w_vec
-    return pd.Series(port, index=ordered.index, name="portfolio_return")
+    # float64 weights make the dot product accumulate in float64 for float32 returns too
+    port = ordered.to_numpy() @ w_vec
+    return as_float(pd.Series(port, index=ordered.index, name="portfolio_return"))
 
 
+@accepts_price_frame
 def buy_and_hold_value(prices: pd.DataFrame, weights: Dict[str, float], initial_value: float = 10_000.0) -> pd.Series:
     if not isinstance(prices, pd.DataFrame) or prices.empty:
         raise InvalidInputError("prices must be a non-empty pandas DataFrame.")
@@ -69,7 +73,7 @@ def buy_and_hold_value(prices: pd.DataFrame, weights: Dict[str, float], initial_
     if missing:
         raise InvalidInputError(f"Missing tickers in price data: {missing}")
 
-    p = prices[list(w.keys())].copy().dropna(how="all")
+    p = prices[list(w.keys())].dropna(how="all")
     if p.empty:
         raise InvalidInputError("prices are empty after dropping NaNs.")
 
@@ -82,7 +86,179 @@ def buy_and_hold_value(prices: pd.DataFrame, weights: Dict[str, float], initial_
         raise InvalidInputError("Cannot compute buy-and-hold: initial prices contain NaNs.")
 
     # shares = (initial_value * weight) / initial_price
-    shares = {t: (initial_value * w[t]) / float(first[t]) for t in w.keys()}
-    values = sum(p[t] * shares[t] for t in w.keys())
-    values.name = "portfolio_value"
-    return values
+    w_vec = np.array([w[t] for t in p.columns], dtype=float)
+    shares = initial_value * w_vec / first.to_numpy(dtype=float)
+    values = p.to_numpy(dtype=float) @ shares
+    return as_float(pd.Series(values, index=p.index, name="portfolio_value"))
+
+
+WeightMatrix = Union[pd.DataFrame, np.ndarray, Sequence[Dict[str, float]]]
+
+
+def normalize_weight_matrix(weights: WeightMatrix, tickers: Optional[Sequence[str]] = None) -> pd.DataFrame:
+    """
+    Vectorized `normalize_weights` for many portfolios at once.
+
+    weights: a DataFrame (rows = portfolios, columns = tickers; NaN means 0),
+      a list of weight dicts, or a (K x N) array whose columns follow `tickers`.
+    Returns a float DataFrame with upper-case ticker columns (columns equal
+    after upper-casing are summed) and rows summing to 1.
+    """
+    if isinstance(weights, np.ndarray):
+        if weights.ndim != 2 or weights.size == 0:
+            raise InvalidInputError("weights array must be a non-empty 2-D (portfolios x assets) array.")
+        if tickers is None or len(tickers) != weights.shape[1]:
+            raise InvalidInputError("tickers must name every column of the weights array.")
+        frame = pd.DataFrame(weights, columns=list(tickers))
+        if frame.isna().any().any():
+            raise InvalidInputError("weights array contains NaNs.")
+    elif isinstance(weights, pd.DataFrame):
+        frame = weights.fillna(0.0)
+    elif isinstance(weights, (list, tuple)) and weights and all(isinstance(w, dict) for w in weights):
+        frame = pd.DataFrame(list(weights)).fillna(0.0)
+    else:
+        raise InvalidInputError("weights must be a DataFrame, a 2-D array or a non-empty list of weight dicts.")
+    if frame.empty:
+        raise InvalidInputError("weights cannot be empty.")
+
+    columns = [str(c).strip().upper() for c in frame.columns]
+    if any(not c for c in columns):
+        raise InvalidInputError("Each weight column must be a non-empty ticker string.")
+    try:
+        values = frame.to_numpy(dtype=float)
+    except (TypeError, ValueError):
+        raise InvalidInputError("weights must be numeric.")
+    if (values < 0).any():
+        raise InvalidInputError("Weights cannot be negative.")
+    codes, unique = pd.factorize(pd.Index(columns))
+    if len(unique) < len(columns):
+        # 'aapl' and 'AAPL' are the same ticker: add their weights
+        merged = np.zeros((len(values), len(unique)))
+        np.add.at(merged, (slice(None), codes), values)
+        values, columns = merged, list(unique)
+    totals = values.sum(axis=1)
+    if (totals <= 0).any():
+        raise InvalidInputError("Sum of weights must be > 0 for every portfolio.")
+    return pd.DataFrame(values / totals[:, None], index=frame.index, columns=columns)
+
+
+def evaluate_portfolios(
+    asset_returns: pd.DataFrame,
+    weights: WeightMatrix,
+    level: float = 0.05,
+    initial_value: float = 10_000.0,
+    periods_per_year: int = 252,
+    chunk_size: int = 4096,
+) -> pd.DataFrame:
+    """
+    Score many portfolios over one returns history.
+
+    Returns a DataFrame indexed like the weight rows with columns volatility
+    (annualized, ddof=1), var (historical, same convention as
+    `risk.value_at_risk`) and final_value (`initial_value` compounded with
+    per-period rebalancing). For each portfolio, rows where any asset it
+    holds is NaN are dropped; NaNs in other assets do not matter.
+
+    The returns are aligned once; portfolio returns come from one matmul per
+    block of `chunk_size` portfolios, which bounds memory to
+    (chunk_size x periods).
+    """
+    if not isinstance(asset_returns, pd.DataFrame) or asset_returns.empty:
+        raise InvalidInputError("asset_returns must be a non-empty pandas DataFrame.")
+    w = normalize_weight_matrix(weights, tickers=list(asset_returns.columns))
+    try:
+        level = float(level)
+        initial_value = float(initial_value)
+    except Exception:
+        raise InvalidInputError("level and initial_value must be numeric.")
+    if not (0 < level < 1):
+        raise InvalidInputError("level must be between 0 and 1 (e.g., 0.05).")
+    if initial_value <= 0:
+        raise InvalidInputError("initial_value must be > 0.")
+    for name, v in (("periods_per_year", periods_per_year), ("chunk_size", chunk_size)):
+        if not isinstance(v, int) or v <= 0:
+            raise InvalidInputError(f"{name} must be a positive integer.")
+
+    missing = [t for t in w.columns if t not in asset_returns.columns]
+    if missing:
+        raise InvalidInputError(f"Missing tickers in returns data: {missing}")
+
+    r = asset_returns[list(w.columns)].to_numpy(dtype=float)
+    w_mat = w.to_numpy()
+    nan_rows = np.isnan(r)
+    gappy = np.flatnonzero(nan_rows.any(axis=0))
+    # NaNs become 0 so one matmul serves every portfolio; a held NaN is masked out below
+    r_t = np.ascontiguousarray(np.where(nan_rows, 0.0, r).T if len(gappy) else r.T)
+    gaps_t = np.ascontiguousarray(nan_rows[:, gappy].T, dtype=float)
+
+    n = len(w_mat)
+    vol = np.empty(n)
+    var = np.empty(n)
+    final = np.empty(n)
+    for lo in range(0, n, chunk_size):
+        # (portfolios x periods): each portfolio's history is contiguous for the quantile
+        block = w_mat[lo : lo + chunk_size]
+        port = block @ r_t
+        hi = lo + len(port)
+        if not len(gappy):
+            if port.shape[1] < 2:
+                raise InvalidInputError("Need at least 2 complete return rows to evaluate portfolios.")
+            vol[lo:hi] = port.std(axis=1, ddof=1)
+            var[lo:hi] = np.quantile(port, level, axis=1)
+            final[lo:hi] = np.prod(1.0 + port, axis=1)
+            continue
+        # A row counts for a portfolio when none of the assets it holds is NaN there
+        ok = ((block[:, gappy] > 0).astype(float) @ gaps_t) == 0
+        count = ok.sum(axis=1)
+        if (count < 2).any():
+            raise InvalidInputError("Need at least 2 complete return rows to evaluate portfolios.")
+        mean = np.where(ok, port, 0.0).sum(axis=1) / count
+        vol[lo:hi] = np.sqrt(np.where(ok, (port - mean[:, None]) ** 2, 0.0).sum(axis=1) / (count - 1))
+        var[lo:hi] = np.nanquantile(np.where(ok, port, np.nan), level, axis=1)
+        final[lo:hi] = np.prod(np.where(ok, 1.0 + port, 1.0), axis=1)
+
+    return pd.DataFrame(
+        {
+            "volatility": vol * np.sqrt(periods_per_year),
+            "var": var,
+            "final_value": initial_value * final,
+        },
+        index=w.index,
+    )
+
+
+def portfolio_volatility(
+    cov: pd.DataFrame,
+    weights: Union[Dict[str, float], WeightMatrix],
+    annualize: bool = True,
+    periods_per_year: int = 252,
+) -> Union[float, pd.Series]:
+    """
+    Volatility sqrt(w' C w) from a covariance matrix of periodic returns
+    (e.g. `covariance.covariance` or `covariance.ledoit_wolf` output).
+
+    A weights dict returns a float; a weight matrix (see
+    `normalize_weight_matrix`) returns one value per portfolio.
+    """
+    if not isinstance(cov, pd.DataFrame) or cov.empty or cov.shape[0] != cov.shape[1]:
+        raise InvalidInputError("cov must be a non-empty square pandas DataFrame.")
+    if not isinstance(periods_per_year, int) or periods_per_year <= 0:
+        raise InvalidInputError("periods_per_year must be a positive integer.")
+
+    single = isinstance(weights, dict)
+    w = pd.DataFrame([normalize_weights(weights)]) if single else normalize_weight_matrix(weights, tickers=list(cov.columns))
+    missing = [t for t in w.columns if t not in cov.columns]
+    if missing:
+        raise InvalidInputError(f"Missing tickers in covariance matrix: {missing}")
+    c = cov.loc[list(w.columns), list(w.columns)].to_numpy(dtype=float)
+    if np.isnan(c).any():
+        raise InvalidInputError("Covariance matrix has NaNs for the weighted tickers.")
+
+    w_mat = w.to_numpy()
+    var = np.einsum("kn,kn->k", w_mat @ c, w_mat)
+    vol = np.sqrt(np.clip(var, 0.0, None))
+    if annualize:
+        vol = vol * np.sqrt(periods_per_year)
+    if single:
+        return float(vol[0])
+    return pd.Series(vol, index=w.index, name="volatility")
@@ -0,0 +1,333 @@
+from __future__ import annotations
+
+import os
+import threading
+from abc import ABC, abstractmethod
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from .exceptions import InvalidInputError, DataDownloadError, EmptyDataError
+from .synthetic import synthetic_index, synthetic_ohlcv
+
+
+# Field name -> DataFrame(DatetimeIndex x tickers)
+FieldFrames = Dict[str, pd.DataFrame]
+
+
+class PriceProvider(ABC):
+    """
+    Base class for price data backends used by `get_prices`.
+
+    `fetch` returns one wide DataFrame (DatetimeIndex x tickers) per requested
+    field. Tickers or fields the backend has no data for are simply left out;
+    raise `EmptyDataError` when nothing at all is available.
+    """
+
+    name: str = "base"
+    # Longest date range a single request may span, per interval; longer
+    # ranges are split into windows by the fetch layer.
+    max_request_span: Dict[str, pd.Timedelta] = {}
+
+    @abstractmethod
+    def fetch(
+        self,
+        tickers: List[str],
+        start: Optional[pd.Timestamp],
+        end: Optional[pd.Timestamp],
+        interval: str,
+        fields: Sequence[str],
+    ) -> FieldFrames:
+        """Return {field: DataFrame(DatetimeIndex x tickers)} for the request."""
+
+
+def _yfinance():
+    # Imported on first download: yfinance is slow to import and only this provider needs it.
+    # Cached as the module attribute `yf`, so code that replaces `providers.yf` (e.g. a mock) is used.
+    module = globals().get("yf")
+    if module is None:
+        import yfinance as module
+
+        globals()["yf"] = module
+    return module
+
+
+def __getattr__(name: str):
+    # `providers.yf` still resolves to the yfinance module, loaded on first access
+    if name == "yf":
+        return _yfinance()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class YFinanceProvider(PriceProvider):
+    name = "yfinance"
+    max_request_span = {
+        "1m": pd.Timedelta(days=7),
+        "2m": pd.Timedelta(days=59),
+        "5m": pd.Timedelta(days=59),
+        "15m": pd.Timedelta(days=59),
+        "30m": pd.Timedelta(days=59),
+        "60m": pd.Timedelta(days=729),
+        "90m": pd.Timedelta(days=59),
+        "1h": pd.Timedelta(days=729),
+    }
+
+    def __init__(self, threads: bool = True) -> None:
+        self.threads = threads
+
+    def fetch(
+        self,
+        tickers: List[str],
+        start: Optional[pd.Timestamp],
+        end: Optional[pd.Timestamp],
+        interval: str,
+        fields: Sequence[str],
+    ) -> FieldFrames:
+        try:
+            df = _yfinance().download(
+                tickers=tickers,
+                start=None if start is None else start.to_pydatetime(),
+                end=None if end is None else end.to_pydatetime(),
+                interval=interval,
+                auto_adjust=False,
+                progress=False,
+                group_by="ticker",
+                threads=self.threads,
+            )
+        except Exception as e:
+            raise DataDownloadError(f"yfinance download failed: {e}", data_provider=self.name)
+
+        if df is None or len(df) == 0:
+            raise EmptyDataError("No data returned. Check tickers and date range.")
+
+        # Single ticker: columns like ["Open","High","Low","Close","Adj Close","Volume"]
+        if not isinstance(df.columns, pd.MultiIndex):
+            return {f: df[[f]].set_axis([tickers[0]], axis=1) for f in fields if f in df.columns}
+
+        # Multi ticker: columns MultiIndex. With group_by="ticker": first level is ticker.
+        present = set(df.columns.get_level_values(0))
+        out = {}
+        for f in fields:
+            cols = {t: df[t][f] for t in tickers if t in present and f in df[t].columns}
+            if cols:
+                out[f] = pd.DataFrame(cols)
+        return out
+
+
+class LocalFileProvider(PriceProvider):
+    """
+    Reads one file per ticker from a local mirror: `root/<interval>/<TICKER>.<ext>`
+    or, if that does not exist, `root/<TICKER>.<ext>`.
+
+    Only the date column and the requested fields are parsed, and for Parquet
+    the date filter is pushed down into the reader. Files are read in parallel.
+    """
+
+    name = "local"
+    _EXTENSIONS = {"csv": (".csv",), "parquet": (".parquet", ".pq"), "auto": (".parquet", ".pq", ".csv")}
+
+    def __init__(
+        self,
+        root: Union[str, os.PathLike],
+        fmt: str = "auto",
+        date_column: str = "Date",
+        max_workers: int = 8,
+    ) -> None:
+        if not isinstance(root, (str, os.PathLike)) or not str(root).strip():
+            raise InvalidInputError("root must be a non-empty path.")
+        if fmt not in self._EXTENSIONS:
+            raise InvalidInputError(f"fmt must be one of {sorted(self._EXTENSIONS)}.")
+        if not isinstance(max_workers, int) or max_workers <= 0:
+            raise InvalidInputError("max_workers must be a positive integer.")
+        self.root = os.fspath(root)
+        self.fmt = fmt
+        self.date_column = date_column
+        self.max_workers = max_workers
+
+    def path_for(self, ticker: str, interval: str) -> Optional[str]:
+        for base in (os.path.join(self.root, interval), self.root):
+            for ext in self._EXTENSIONS[self.fmt]:
+                path = os.path.join(base, ticker + ext)
+                if os.path.exists(path):
+                    return path
+        return None
+
+    def _read_one(
+        self,
+        path: str,
+        start: Optional[pd.Timestamp],
+        end: Optional[pd.Timestamp],
+        fields: Sequence[str],
+    ) -> pd.DataFrame:
+        if path.endswith(".csv"):
+            wanted = {self.date_column, *fields}
+            df = pd.read_csv(
+                path,
+                usecols=lambda c: c in wanted,
+                index_col=self.date_column,
+                parse_dates=[self.date_column],
+            )
+        else:
+            import pyarrow.parquet as pq
+
+            names = pq.read_schema(path).names
+            filters = []
+            if start is not None:
+                filters.append((self.date_column, ">=", start))
+            if end is not None:
+                filters.append((self.date_column, "<", end))
+            # The date column may be stored as the index or as a plain column (index=False)
+            wanted = [f for f in fields if f in names]
+            if self.date_column in names:
+                wanted.append(self.date_column)
+            df = pd.read_parquet(path, columns=wanted, filters=filters or None)
+            if self.date_column in df.columns:
+                df = df.set_index(self.date_column)
+            elif not isinstance(df.index, pd.DatetimeIndex):
+                raise ValueError(f"{path} has no '{self.date_column}' column.")
+
+        df.index = pd.to_datetime(df.index)
+        # CSV has no pushdown; for Parquet this is a no-op on the filtered rows
+        mask = pd.Series(True, index=df.index)
+        if start is not None:
+            mask &= df.index >= start
+        if end is not None:
+            mask &= df.index < end
+        return df[mask.to_numpy()]
+
+    def fetch(
+        self,
+        tickers: List[str],
+        start: Optional[pd.Timestamp],
+        end: Optional[pd.Timestamp],
+        interval: str,
+        fields: Sequence[str],
+    ) -> FieldFrames:
+        paths = {t: self.path_for(t, interval) for t in tickers}
+        paths = {t: p for t, p in paths.items() if p is not None}
+        if not paths:
+            raise EmptyDataError(f"No local files found for requested tickers under '{self.root}'.")
+
+        try:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(paths))) as ex:
+                frames = dict(zip(paths, ex.map(lambda p: self._read_one(p, start, end, fields), paths.values())))
+        except (OSError, ValueError) as e:
+            raise DataDownloadError(f"Reading local price files failed: {e}", data_provider=self.name)
+
+        out = {}
+        for f in fields:
+            cols = {t: df[f] for t, df in frames.items() if f in df.columns}
+            if cols:
+                out[f] = pd.DataFrame(cols)
+        return out
+
+
+class SyntheticProvider(PriceProvider):
+    """
+    In-memory provider of deterministic random-walk OHLCV bars (see `synthetic_ohlcv`).
+
+    `latency` (seconds per call), `fail_tickers` (any request containing one
+    of them fails) and `failure_rate` (probability that a call fails
+    transiently) inject faults for offline testing of the fetch layer;
+    `nan_density` / `max_gap` punch gaps into the bars.
+    """
+
+    name = "synthetic"
+
+    def __init__(
+        self,
+        seed: int = 0,
+        start_price: float = 100.0,
+        mu: float = 0.0003,
+        sigma: float = 0.02,
+        latency: float = 0.0,
+        fail_tickers: Iterable[str] = (),
+        failure_rate: float = 0.0,
+        nan_density: float = 0.0,
+        max_gap: int = 1,
+    ) -> None:
+        if latency < 0:
+            raise InvalidInputError("latency must be >= 0.")
+        if not (0 <= failure_rate <= 1):
+            raise InvalidInputError("failure_rate must be between 0 and 1.")
+        if not (0 <= nan_density < 1):
+            raise InvalidInputError("nan_density must be in [0, 1).")
+        self.seed = seed
+        self.start_price = start_price
+        self.mu = mu
+        self.sigma = sigma
+        self.latency = latency
+        self.fail_tickers = {t.upper() for t in fail_tickers}
+        self.failure_rate = failure_rate
+        self.nan_density = nan_density
+        self.max_gap = max_gap
+        self.calls = 0
+        self._rng = np.random.default_rng(seed)
+        self._lock = threading.Lock()
+
+    def fetch(
+        self,
+        tickers: List[str],
+        start: Optional[pd.Timestamp],
+        end: Optional[pd.Timestamp],
+        interval: str,
+        fields: Sequence[str],
+    ) -> FieldFrames:
+        with self._lock:
+            self.calls += 1
+            transient = self.failure_rate > 0 and self._rng.random() < self.failure_rate
+        if self.latency:
+            time.sleep(self.latency)
+        bad = sorted(self.fail_tickers.intersection(tickers))
+        if bad:
+            raise DataDownloadError(f"synthetic download failed for {bad}", data_provider=self.name)
+        if transient:
+            raise DataDownloadError("synthetic transient failure", data_provider=self.name)
+
+        index = synthetic_index(start, end, interval)
+        if len(index) == 0:
+            raise EmptyDataError("No data returned. Check tickers and date range.")
+        return synthetic_ohlcv(
+            tickers,
+            index,
+            seed=self.seed,
+            start_price=self.start_price,
+            mu=self.mu,
+            sigma=self.sigma,
+            fields=fields,
+            nan_density=self.nan_density,
+            max_gap=self.max_gap,
+        )
+
+
+def write_local_mirror(
+    frames: FieldFrames,
+    root: Union[str, os.PathLike],
+    fmt: str = "parquet",
+    date_column: str = "Date",
+) -> List[str]:
+    """
+    Write field frames (as returned by `PriceProvider.fetch`) to one file per
+    ticker, in the layout `LocalFileProvider` reads.
+    """
+    if fmt not in ("csv", "parquet"):
+        raise InvalidInputError("fmt must be 'csv' or 'parquet'.")
+    if not frames:
+        raise InvalidInputError("frames cannot be empty.")
+    os.makedirs(root, exist_ok=True)
+
+    tickers: Iterable[str] = dict.fromkeys(t for df in frames.values() for t in df.columns)
+    written = []
+    for t in tickers:
+        df = pd.DataFrame({f: frames[f][t] for f in frames if t in frames[f].columns})
+        df.index.name = date_column
+        path = os.path.join(os.fspath(root), f"{t}.{fmt}")
+        if fmt == "csv":
+            df.to_csv(path)
+        else:
+            df.to_parquet(path)
+        written.append(path)
+    return written
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+from typing import Dict, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from .exceptions import InvalidInputError
+from .panel import OHLCVPanel
+
+
+# How each field is aggregated into a coarser bar
+AGGREGATIONS = {
+    "Open": "first",
+    "High": "max",
+    "Low": "min",
+    "Close": "last",
+    "Adj Close": "last",
+    "Volume": "sum",
+}
+
+_INTERVAL_RULES = {"1m": "1min", "2m": "2min", "5m": "5min", "15m": "15min", "30m": "30min",
+                   "60m": "60min", "90m": "90min", "1h": "60min", "1d": "1D"}
+
+Bars = Union[OHLCVPanel, Dict[str, pd.DataFrame]]
+
+
+def _to_offset(rule: str) -> pd.Timedelta:
+    if not isinstance(rule, str) or not rule.strip():
+        raise InvalidInputError("rule must be a non-empty string like '5m', '1h' or '1d'.")
+    rule = rule.strip()
+    try:
+        td = pd.Timedelta(_INTERVAL_RULES.get(rule, rule))
+    except ValueError:
+        raise InvalidInputError(f"Unsupported resample rule '{rule}'.")
+    if td <= pd.Timedelta(0) or td > pd.Timedelta(days=1):
+        raise InvalidInputError("rule must be a positive duration of at most one day.")
+    return td
+
+
+def _bin_labels(
+    index: pd.DatetimeIndex,
+    freq: pd.Timedelta,
+    session: Optional[Tuple[str, str]],
+) -> Tuple[np.ndarray, pd.DatetimeIndex]:
+    """Return (row mask kept, bin label per kept row)."""
+    # Session times and bins follow the local clock, which on DST switch days
+    # differs by an hour from the time elapsed since midnight
+    local = index if index.tz is None else index.tz_localize(None)
+    day = local.normalize()
+    keep = np.ones(len(index), dtype=bool)
+    if session is None:
+        origin = day
+    else:
+        open_ = pd.Timedelta(session[0] + ":00" if session[0].count(":") == 1 else session[0])
+        close = pd.Timedelta(session[1] + ":00" if session[1].count(":") == 1 else session[1])
+        tod = local - day
+        keep = np.asarray((tod >= open_) & (tod < close))
+        origin = day + open_
+
+    if freq >= pd.Timedelta(days=1):
+        labels = day
+    else:
+        # Bins are anchored at the session open (or midnight) of each day
+        labels = origin + ((local - origin) // freq) * freq
+    labels = labels[keep]
+    if index.tz is not None:
+        labels = _localize_labels(labels, index[keep], local[keep])
+    return keep, labels
+
+
+def _localize_labels(labels: pd.DatetimeIndex, index: pd.DatetimeIndex, local: pd.DatetimeIndex) -> pd.DatetimeIndex:
+    """Attach the time zone of `index` to wall-clock `labels` (one per row)."""
+    out = labels.tz_localize(index.tz, ambiguous="NaT", nonexistent="shift_forward")
+    ambiguous = np.asarray(out.isna())
+    if ambiguous.any():
+        # A label repeated by a fall-back takes the UTC offset of its own bar
+        offset = local.as_unit("ns").asi8 - index.as_unit("ns").asi8
+        fixed = labels.as_unit("ns").asi8 - offset
+        utc = np.where(ambiguous, fixed, out.as_unit("ns").asi8)
+        out = pd.DatetimeIndex(utc.astype("datetime64[ns]")).tz_localize("UTC").tz_convert(index.tz).as_unit(labels.unit)
+    return out
+
+
+def _reduce(values: np.ndarray, starts: np.ndarray, how: str) -> np.ndarray:
+    """Grouped reduction of contiguous row blocks, NaN-aware, all columns at once."""
+    valid = ~np.isnan(values)
+    n_rows = values.shape[0]
+    if how == "max":
+        out = np.fmax.reduceat(values, starts, axis=0)
+    elif how == "min":
+        out = np.fmin.reduceat(values, starts, axis=0)
+    elif how == "sum":
+        out = np.add.reduceat(np.where(valid, values, 0.0), starts, axis=0)
+    elif how in ("first", "last"):
+        rows = np.arange(n_rows)[:, None]
+        if how == "first":
+            pos = np.minimum.reduceat(np.where(valid, rows, n_rows), starts, axis=0)
+        else:
+            pos = np.maximum.reduceat(np.where(valid, rows, -1), starts, axis=0)
+        found = (pos >= 0) & (pos < n_rows)
+        out = np.take_along_axis(values, np.clip(pos, 0, n_rows - 1), axis=0)
+        out[~found] = np.nan
+        return out
+    else:
+        raise InvalidInputError(f"Unknown aggregation '{how}'.")
+
+    # Bins where a column has no observations stay NaN
+    counts = np.add.reduceat(valid.astype(np.int64), starts, axis=0)
+    out[counts == 0] = np.nan
+    return out
+
+
+def resample_ohlcv(
+    bars: Bars,
+    rule: str,
+    tz: Optional[str] = None,
+    session: Optional[Tuple[str, str]] = None,
+) -> Bars:
+    """
+    Aggregate fine bars (e.g. 1m) into coarser ones ('5m', '15m', '1h', '1d')
+    for every ticker at once: Open=first, High=max, Low=min, Close=last,
+    Volume=sum, NaN-aware.
+
+    `tz` converts the bar timestamps (naive ones are assumed to be UTC) before
+    binning. `session=("09:30", "16:00")` drops bars outside the session and
+    anchors intraday bins at the session open. Only bins with at least one
+    bar are returned. Accepts and returns an OHLCVPanel or a dict of frames.
+    """
+    freq = _to_offset(rule)
+    if session is not None and (not isinstance(session, tuple) or len(session) != 2):
+        raise InvalidInputError("session must be a tuple like ('09:30', '16:00').")
+
+    if isinstance(bars, OHLCVPanel):
+        panel = bars
+    elif isinstance(bars, dict) and bars:
+        panel = OHLCVPanel.from_frames(bars)
+    else:
+        raise InvalidInputError("bars must be an OHLCVPanel or a non-empty dict of field -> DataFrame.")
+    unknown = [f for f in panel.fields if f not in AGGREGATIONS]
+    if unknown:
+        raise InvalidInputError(f"No aggregation rule for fields {unknown}.")
+
+    index = panel.index
+    if tz is not None:
+        index = (index.tz_localize("UTC") if index.tz is None else index).tz_convert(tz)
+
+    order = np.argsort(index.asi8, kind="stable")
+    index = index[order]
+    try:
+        keep, labels = _bin_labels(index, freq, session)
+    except ValueError:
+        raise InvalidInputError(f"session {session} must contain times like '09:30'.")
+    rows = order[keep]
+    if len(rows) == 0:
+        raise InvalidInputError("No bars fall inside the requested session.")
+
+    label_ns = labels.asi8
+    starts = np.flatnonzero(np.r_[True, label_ns[1:] != label_ns[:-1]])
+    out = np.empty((len(panel.fields), len(starts), len(panel.tickers)))
+    for k, f in enumerate(panel.fields):
+        out[k] = _reduce(panel.values[k][rows], starts, AGGREGATIONS[f])
+
+    result = OHLCVPanel(out, labels[starts], panel.fields, panel.tickers)
+    if isinstance(bars, OHLCVPanel):
+        return result
+    return {f: result.field(f) for f in result.fields}
@@ -6,6 +6,8 @@ import numpy as np
 import pandas as pd
 
 from .exceptions import InvalidInputError
+from .frame import accepts_price_frame
+from .options import as_float, as_float64
 
 
 SeriesOrFrame = Union[pd.Series, pd.DataFrame]
@@ -19,21 +21,22 @@ def volatility(returns: SeriesOrFrame, annualize: bool = True, periods_per_year:
     if not isinstance(periods_per_year, int) or periods_per_year <= 0:
         raise InvalidInputError("periods_per_year must be a positive integer.")
 
-    vol = returns.std(ddof=1)
+    vol = as_float64(returns).std(ddof=1)
     if annualize:
         vol = vol * np.sqrt(periods_per_year)
     return vol
 
 
-def max_drawdown(prices: pd.Series) -> pd.Series:
-    if not isinstance(prices, pd.Series):
-        raise InvalidInputError("prices must be a pandas Series (single ticker).")
+@accepts_price_frame
+def max_drawdown(prices: SeriesOrFrame) -> SeriesOrFrame:
+    if not isinstance(prices, (pd.Series, pd.DataFrame)):
+        raise InvalidInputError("prices must be a pandas Series or DataFrame.")
     if prices.empty:
         raise InvalidInputError("prices cannot be empty.")
 
     running_max = prices.cummax()
     drawdown = prices / running_max - 1.0
-    return drawdown
+    return as_float(drawdown)
 
 
 def value_at_risk(returns: pd.Series, level: float = 0.05) -> float:
@@ -53,3 +56,111 @@ def value_at_risk(returns: pd.Series, level: float = 0.05) -> float:
         raise InvalidInputError("returns contain only NaNs.")
     # Historical VaR: percentile of returns distribution
     return float(clean.quantile(level))
+
+
+def _price_matrix(prices: SeriesOrFrame):
+    if not isinstance(prices, (pd.Series, pd.DataFrame)):
+        raise InvalidInputError("prices must be a pandas Series or DataFrame.")
+    if prices.empty:
+        raise InvalidInputError("prices cannot be empty.")
+    frame = prices.to_frame(name=prices.name if prices.name is not None else "price") if isinstance(prices, pd.Series) else prices
+    values = frame.to_numpy(dtype=float)
+    with np.errstate(invalid="ignore"):
+        running_max = np.fmax.accumulate(values, axis=0)
+        dd = values / running_max - 1.0
+    return frame, values, running_max, dd
+
+
+@accepts_price_frame
+def drawdown_stats(prices: SeriesOrFrame) -> pd.DataFrame:
+    """
+    Worst drawdown of every column in one vectorized pass.
+
+    Returns a DataFrame indexed by ticker with columns: max_drawdown (<= 0),
+    peak, trough, recovery (first date back at the peak level, NaT if not yet
+    recovered) and duration (recovery - peak).
+    """
+    frame, values, running_max, dd = _price_matrix(prices)
+    n_rows, n_cols = values.shape
+    rows = np.arange(n_rows)[:, None]
+    cols = np.arange(n_cols)
+
+    filled = np.where(np.isnan(dd), np.inf, dd)
+    trough = np.argmin(filled, axis=0)
+    depth = filled[trough, cols]
+    has_dd = depth < 0
+    # All-NaN columns stay NaN; columns that never fell below a peak report 0
+    depth = np.where(np.isfinite(depth), np.minimum(depth, 0.0), np.nan)
+
+    peak_level = running_max[trough, cols]
+    at_peak = (values == peak_level) & (rows <= trough)
+    peak = n_rows - 1 - np.argmax(at_peak[::-1], axis=0)
+    back = (values >= peak_level) & (rows > trough)
+    recovered = has_dd & back.any(axis=0)
+    recovery = np.argmax(back, axis=0)
+
+    index = frame.index
+    peak_dates = pd.DatetimeIndex(np.where(has_dd, index[peak].to_numpy(), np.datetime64("NaT")))
+    trough_dates = pd.DatetimeIndex(np.where(has_dd, index[trough].to_numpy(), np.datetime64("NaT")))
+    recovery_dates = pd.DatetimeIndex(np.where(recovered, index[recovery].to_numpy(), np.datetime64("NaT")))
+    return pd.DataFrame(
+        {
+            "max_drawdown": depth,
+            "peak": peak_dates,
+            "trough": trough_dates,
+            "recovery": recovery_dates,
+            "duration": recovery_dates - peak_dates,
+        },
+        index=frame.columns,
+    )
+
+
+@accepts_price_frame
+def drawdown_episodes(prices: SeriesOrFrame, top_n: int = 5) -> pd.DataFrame:
+    """
+    The `top_n` deepest drawdown episodes (peak -> trough -> recovery) of
+    every column.
+
+    Returns a long DataFrame with columns: ticker, rank, depth, peak, trough,
+    recovery (NaT if not recovered) and duration.
+    """
+    if not isinstance(top_n, int) or top_n <= 0:
+        raise InvalidInputError("top_n must be a positive integer.")
+    frame, values, running_max, dd = _price_matrix(prices)
+
+    # A new high (price at its running max) starts a new episode
+    episode = np.cumsum(values >= running_max, axis=0)
+    valid = ~np.isnan(dd) & (episode > 0)
+    col_idx = np.broadcast_to(np.arange(values.shape[1]), values.shape)
+    row_idx = np.broadcast_to(np.arange(values.shape[0])[:, None], values.shape)
+    long = pd.DataFrame({"col": col_idx[valid], "episode": episode[valid], "row": row_idx[valid], "dd": dd[valid]})
+    long = long.sort_values(["col", "episode", "row"], kind="stable")
+
+    g = long.groupby(["col", "episode"], sort=True)
+    ep = g.agg(peak_row=("row", "first"), depth=("dd", "min"))
+    ep["trough_row"] = long.loc[g["dd"].idxmin(), "row"].to_numpy()
+    ep["recovery_row"] = ep.groupby(level="col")["peak_row"].shift(-1)
+    ep = ep[ep["depth"] < 0].reset_index()
+
+    ep = ep.sort_values(["col", "depth"], kind="stable")
+    ep["rank"] = ep.groupby("col").cumcount() + 1
+    ep = ep[ep["rank"] <= top_n]
+
+    index = frame.index
+    recovery_row = ep["recovery_row"]
+    recovery = pd.DatetimeIndex(
+        np.where(recovery_row.notna(), index[recovery_row.fillna(0).astype(int)].to_numpy(), np.datetime64("NaT"))
+    )
+    peak = index[ep["peak_row"].to_numpy()]
+    out = pd.DataFrame(
+        {
+            "ticker": frame.columns[ep["col"].to_numpy()],
+            "rank": ep["rank"].to_numpy(),
+            "depth": ep["depth"].to_numpy(),
+            "peak": peak,
+            "trough": index[ep["trough_row"].to_numpy()],
+            "recovery": recovery,
+            "duration": recovery - peak,
+        }
+    )
+    return out.reset_index(drop=True)
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from typing import Optional, Union
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+from .exceptions import InvalidInputError
+
+
+SeriesOrFrame = Union[pd.Series, pd.DataFrame]
+
+# Elements (rows x columns x window) per block in rolling_max_drawdown: 2**21 float64 = 16 MB per temporary
+_MDD_BLOCK_ELEMENTS = 2**21
+
+
+def _check(x: SeriesOrFrame, name: str, window: int, min_periods: Optional[int]) -> int:
+    if not isinstance(x, (pd.Series, pd.DataFrame)):
+        raise InvalidInputError(f"{name} must be a pandas Series or DataFrame.")
+    if x.empty:
+        raise InvalidInputError(f"{name} cannot be empty.")
+    if not isinstance(window, int) or window <= 1:
+        raise InvalidInputError("window must be an integer > 1.")
+    if min_periods is None:
+        return window
+    if not isinstance(min_periods, int) or not (1 <= min_periods <= window):
+        raise InvalidInputError("min_periods must be an integer between 1 and window.")
+    return min_periods
+
+
+def rolling_volatility(
+    returns: SeriesOrFrame,
+    window: int = 63,
+    annualize: bool = True,
+    periods_per_year: int = 252,
+    min_periods: Optional[int] = None,
+) -> SeriesOrFrame:
+    """
+    Trailing-window standard deviation of returns (ddof=1), aligned to the
+    input index. Each step adds one observation and drops one from running
+    moments, so the cost per step does not depend on the window length.
+    """
+    min_periods = _check(returns, "returns", window, min_periods)
+    if not isinstance(periods_per_year, int) or periods_per_year <= 0:
+        raise InvalidInputError("periods_per_year must be a positive integer.")
+
+    vol = returns.rolling(window=window, min_periods=min_periods).std(ddof=1)
+    if annualize:
+        vol = vol * np.sqrt(periods_per_year)
+    return vol
+
+
+def rolling_value_at_risk(
+    returns: SeriesOrFrame,
+    window: int = 252,
+    level: float = 0.05,
+    min_periods: Optional[int] = None,
+) -> SeriesOrFrame:
+    """
+    Trailing-window historical VaR: the `level` quantile of the last `window`
+    returns, interpolated like `value_at_risk`. The window is kept as a
+    sorted structure (skiplist), so each step costs O(log window) instead of
+    re-sorting the window.
+    """
+    min_periods = _check(returns, "returns", window, min_periods)
+    try:
+        level = float(level)
+    except Exception:
+        raise InvalidInputError("level must be a float like 0.05.")
+    if not (0 < level < 1):
+        raise InvalidInputError("level must be between 0 and 1 (e.g., 0.05).")
+
+    return returns.rolling(window=window, min_periods=min_periods).quantile(level, interpolation="linear")
+
+
+def rolling_drawdown(prices: SeriesOrFrame, window: int = 252, min_periods: Optional[int] = None) -> SeriesOrFrame:
+    """Drawdown from the highest price of the trailing `window` bars."""
+    min_periods = _check(prices, "prices", window, min_periods)
+    peak = prices.rolling(window=window, min_periods=min_periods).max()
+    return prices / peak - 1.0
+
+
+def rolling_max_drawdown(prices: SeriesOrFrame, window: int = 252) -> SeriesOrFrame:
+    """
+    Worst peak-to-trough drawdown that happened entirely inside each trailing
+    `window` of prices (<= 0). Windows containing NaNs ignore them; rows with
+    fewer than `window` bars are NaN.
+    """
+    _check(prices, "prices", window, None)
+    is_series = isinstance(prices, pd.Series)
+    values = prices.to_numpy(dtype=float)
+    values = values[:, None] if is_series else values
+    n_rows = values.shape[0]
+
+    out = np.full(values.shape, np.nan)
+    if n_rows >= window:
+        # windows[i] covers rows i .. i + window - 1 -> shape (n_windows, n_cols, window)
+        windows = sliding_window_view(values, window, axis=0)
+        n_windows, n_cols = windows.shape[:2]
+        # Split over columns as well as rows so the working set stays bounded for wide universes
+        block_cols = max(1, min(n_cols, _MDD_BLOCK_ELEMENTS // window))
+        block_rows = max(1, _MDD_BLOCK_ELEMENTS // (block_cols * window))
+        for c0 in range(0, n_cols, block_cols):
+            for lo in range(0, n_windows, block_rows):
+                block = windows[lo : lo + block_rows, c0 : c0 + block_cols]
+                with np.errstate(invalid="ignore"):
+                    running_max = np.fmax.accumulate(block, axis=2)
+                    worst = np.fmin.reduce(block / running_max - 1.0, axis=2)
+                out[window - 1 + lo : window - 1 + lo + len(block), c0 : c0 + block_cols] = worst
+
+    if is_series:
+        return pd.Series(out[:, 0], index=prices.index, name=prices.name)
+    return pd.DataFrame(out, index=prices.index, columns=prices.columns)
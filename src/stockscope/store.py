@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import tempfile
+from typing import Iterable, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from .exceptions import InvalidInputError
+from .frame import PriceFrame
+from .options import _validate_dtype, float_dtype
+
+
+_FORMAT_VERSION = 1
+_META = "meta.json"
+_INDEX = "index.i8"
+_VALUES = {"float64": "values.f8", "float32": "values.f4"}
+
+
+def _write_meta(path: str, meta: dict) -> None:
+    fd, tmp = tempfile.mkstemp(dir=path, suffix=".tmp")
+    with os.fdopen(fd, "w") as f:
+        json.dump(meta, f)
+    os.replace(tmp, os.path.join(path, _META))
+
+
+def _index_ints(index: pd.DatetimeIndex, unit: str) -> np.ndarray:
+    naive = index if index.tz is None else index.tz_convert("UTC").tz_localize(None)
+    return naive.as_unit(unit).asi8
+
+
+class PriceStore:
+    """
+    Prices (dates x tickers, the `get_prices` layout) kept in a directory of
+    raw binary files that every process maps read-only:
+
+        meta.json   tickers, timezone, row count, dtype
+        index.i8    int64 timestamps
+        values.f8   float64 values, row-major (one row per date)
+                    (values.f4 for a float32 store)
+
+    Opening a store reads only the metadata and the date index; `frame`,
+    `ticker` and `values` are views into the mapping, so N processes reading
+    the same store share one copy in the page cache. The views are read-only
+    (copy before modifying). `append` adds new dates; readers that opened
+    the store earlier keep their snapshot until `refresh`.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike]) -> None:
+        self.path = os.fspath(path)
+        if not os.path.exists(os.path.join(self.path, _META)):
+            raise InvalidInputError(f"No price store at {self.path}.")
+        self.refresh()
+
+    @classmethod
+    def create(
+        cls,
+        path: Union[str, os.PathLike],
+        prices: pd.DataFrame,
+        overwrite: bool = False,
+        dtype: Optional[object] = None,
+    ) -> "PriceStore":
+        """
+        Write `prices` as a new store at `path` and open it. `dtype`
+        ("float64" or "float32", default: the `dtype` option) is fixed for
+        the life of the store; views are always of that dtype.
+        """
+        dtype = _validate_dtype(float_dtype() if dtype is None else dtype)
+        prices = PriceFrame._validate(prices, dtype)
+        path = os.fspath(path)
+        if os.path.exists(os.path.join(path, _META)):
+            if not overwrite:
+                raise InvalidInputError(f"A price store already exists at {path} (pass overwrite=True).")
+            shutil.rmtree(path)
+        os.makedirs(path, exist_ok=True)
+        tz = None if prices.index.tz is None else str(prices.index.tz)
+        unit = prices.index.unit
+        with open(os.path.join(path, _INDEX), "wb") as f:
+            f.write(_index_ints(prices.index, unit).tobytes())
+        with open(os.path.join(path, _VALUES[dtype]), "wb") as f:
+            f.write(np.ascontiguousarray(prices.to_numpy(dtype=dtype)).tobytes())
+        meta = {
+            "version": _FORMAT_VERSION,
+            "tickers": [str(c) for c in prices.columns],
+            "tz": tz,
+            "unit": unit,
+            "rows": len(prices),
+            "dtype": dtype,
+        }
+        _write_meta(path, meta)
+        return cls(path)
+
+    def refresh(self) -> None:
+        """Re-read the metadata and remap the files (picks up rows appended since opening)."""
+        with open(os.path.join(self.path, _META)) as f:
+            meta = json.load(f)
+        if meta.get("version") != _FORMAT_VERSION:
+            raise InvalidInputError(f"Unsupported price store version: {meta.get('version')}")
+        self._meta = meta
+        self.tickers: List[str] = meta["tickers"]
+        self._positions = {t: i for i, t in enumerate(self.tickers)}
+        rows, width = meta["rows"], len(self.tickers)
+        # Files may be longer than `rows` while an append is in progress; only mapped up to it
+        stamps = np.memmap(os.path.join(self.path, _INDEX), dtype=np.int64, mode="r", shape=(rows,))
+        index = pd.DatetimeIndex(stamps.view(f"M8[{meta['unit']}]"), name=None)
+        if meta["tz"]:
+            index = index.tz_localize("UTC").tz_convert(meta["tz"])
+        self.index = index
+        # Stores written before the dtype was recorded are float64
+        self.dtype = np.dtype(meta.get("dtype", "float64"))
+        values = os.path.join(self.path, _VALUES[self.dtype.name])
+        self._values = np.memmap(values, dtype=self.dtype, mode="r", shape=(rows, width))
+
+    def __len__(self) -> int:
+        return self._meta["rows"]
+
+    @property
+    def shape(self):
+        return self._values.shape
+
+    @property
+    def values(self) -> np.ndarray:
+        """The whole (dates x tickers) array, memory-mapped read-only."""
+        return self._values
+
+    def __repr__(self) -> str:
+        return f"PriceStore({self.path!r}, {len(self)} rows x {len(self.tickers)} tickers)"
+
+    def _bound(self, value) -> pd.Timestamp:
+        ts = pd.Timestamp(value)
+        # Naive bounds on a tz-aware store are read as local dates
+        if self.index.tz is not None and ts.tz is None:
+            ts = ts.tz_localize(self.index.tz)
+        return ts
+
+    def _rows(self, start, end) -> slice:
+        lo = 0 if start is None else self.index.searchsorted(self._bound(start), side="left")
+        hi = len(self.index) if end is None else self.index.searchsorted(self._bound(end), side="right")
+        return slice(lo, hi)
+
+    def _column(self, ticker: str) -> int:
+        key = str(ticker)
+        if key not in self._positions:
+            key = key.strip().upper()
+        if key not in self._positions:
+            raise InvalidInputError(f"Ticker {ticker!r} is not in the store.")
+        return self._positions[key]
+
+    def frame(
+        self,
+        start: Optional[object] = None,
+        end: Optional[object] = None,
+        tickers: Optional[Iterable[str]] = None,
+    ) -> pd.DataFrame:
+        """
+        Prices between `start` and `end` (both inclusive, like `.loc`). The
+        result is a view of the mapping unless `tickers` selects columns that
+        are not adjacent in the store, which needs a copy.
+        """
+        rows = self._rows(start, end)
+        if tickers is None:
+            cols = slice(None)
+            columns = self.tickers
+        else:
+            pos = [self._column(t) for t in ([tickers] if isinstance(tickers, str) else tickers)]
+            if not pos:
+                raise InvalidInputError("tickers must not be empty.")
+            contiguous = pos == list(range(pos[0], pos[0] + len(pos)))
+            cols = slice(pos[0], pos[-1] + 1) if contiguous else pos
+            columns = [self.tickers[i] for i in pos]
+        block = self._values[rows, cols]
+        return pd.DataFrame(np.asarray(block), index=self.index[rows], columns=columns, copy=False)
+
+    def ticker(self, ticker: str, start: Optional[object] = None, end: Optional[object] = None) -> pd.Series:
+        """One ticker's prices as a (strided) view of the mapping."""
+        j = self._column(ticker)
+        rows = self._rows(start, end)
+        return pd.Series(np.asarray(self._values[rows, j]), index=self.index[rows], name=self.tickers[j], copy=False)
+
+    def to_price_frame(self, **kwargs) -> PriceFrame:
+        return PriceFrame(self.frame(), **kwargs)
+
+    def append(self, rows: pd.DataFrame) -> None:
+        """
+        Append bars dated after the last stored one. Missing tickers are
+        stored as NaN; tickers not in the store are rejected (the row width
+        is fixed). Only one process should append at a time.
+        """
+        rows = PriceFrame._validate(rows, self.dtype)
+        tz = self._meta["tz"]
+        if (rows.index.tz is None) != (tz is None):
+            raise InvalidInputError("Appended rows must use the same timezone handling as the store.")
+        if len(self) and rows.index[0] <= self.index[-1]:
+            raise InvalidInputError("Appended rows must be dated after the last stored bar.")
+        unknown = [c for c in rows.columns if c not in self._positions]
+        if unknown:
+            raise InvalidInputError(f"Appended rows have unknown tickers: {unknown}")
+        values = rows.reindex(columns=self.tickers).to_numpy(dtype=self.dtype)
+
+        # Data first, metadata last: a reader never maps rows that are not fully written
+        n = len(self)
+        with open(os.path.join(self.path, _INDEX), "r+b") as f:
+            f.seek(n * 8)
+            f.write(_index_ints(rows.index, self._meta["unit"]).tobytes())
+            f.truncate()
+        with open(os.path.join(self.path, _VALUES[self.dtype.name]), "r+b") as f:
+            f.seek(n * self.dtype.itemsize * len(self.tickers))
+            f.write(np.ascontiguousarray(values).tobytes())
+            f.truncate()
+        _write_meta(self.path, dict(self._meta, rows=n + len(rows)))
+        self.refresh()
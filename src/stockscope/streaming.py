@@ -0,0 +1,452 @@
+from __future__ import annotations
+
+import copy
+import json
+import os
+import shutil
+import tempfile
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from .exceptions import EmptyDataError, InvalidInputError
+from .fetch import get_prices
+from .kernels import ewm_resume
+from .providers import PriceProvider
+from .utils import ensure_ticker_list
+
+
+Output = Union[pd.DataFrame, pd.Series]
+
+_MANIFEST = "_parts.json"
+
+
+# ---------------------------------------------------------------------------
+# Chunk sources
+# ---------------------------------------------------------------------------
+
+
+def ticker_chunks(
+    tickers: Union[str, Iterable[str]],
+    start: Optional[object] = None,
+    end: Optional[object] = None,
+    interval: str = "1d",
+    price_field: str = "Adj Close",
+    chunk_size: int = 500,
+    provider: Optional[PriceProvider] = None,
+    cache=None,
+    index: Optional[pd.DatetimeIndex] = None,
+) -> Iterator[pd.DataFrame]:
+    """
+    Yield `get_prices` output for `chunk_size` tickers at a time (full date
+    range). A chunk only has the rows where its own tickers have data; pass
+    `index` (e.g. the exchange calendar) to align every chunk to the same rows.
+    Chunks with no data at all are skipped.
+    """
+    tickers_list = ensure_ticker_list(tickers)
+    if not isinstance(chunk_size, int) or chunk_size <= 0:
+        raise InvalidInputError("chunk_size must be a positive integer.")
+    for i in range(0, len(tickers_list), chunk_size):
+        try:
+            chunk = get_prices(tickers_list[i : i + chunk_size], start, end, interval, price_field, cache=cache, provider=provider)
+        except EmptyDataError:
+            continue
+        yield chunk if index is None else chunk.reindex(index)
+
+
+def time_chunks(
+    tickers: Union[str, Iterable[str]],
+    start: object,
+    end: object,
+    interval: str = "1d",
+    price_field: str = "Adj Close",
+    freq: str = "MS",
+    provider: Optional[PriceProvider] = None,
+    cache=None,
+) -> Iterator[pd.DataFrame]:
+    """
+    Yield `get_prices` output for all tickers one date window at a time
+    (window edges from `pd.date_range(start, end, freq=freq)`), in order and
+    without overlapping bars. Every chunk has one column per ticker.
+    """
+    tickers_list = ensure_ticker_list(tickers)
+    start_ts, end_ts = pd.Timestamp(start), pd.Timestamp(end)
+    if start_ts >= end_ts:
+        raise InvalidInputError("start date must be < end date.")
+    edges = [start_ts] + [e for e in pd.date_range(start_ts, end_ts, freq=freq) if start_ts < e < end_ts] + [end_ts]
+    last = None
+    for lo, hi in zip(edges[:-1], edges[1:]):
+        try:
+            chunk = get_prices(tickers_list, lo, hi, interval, price_field, cache=cache, provider=provider)
+        except EmptyDataError:
+            continue
+        if last is not None:
+            chunk = chunk[chunk.index > last]
+        if chunk.empty:
+            continue
+        last = chunk.index[-1]
+        yield chunk.reindex(columns=tickers_list)
+
+
+def split_frame(prices: pd.DataFrame, by: str = "time", size: int = 10_000) -> Iterator[pd.DataFrame]:
+    """Yield an existing frame in chunks of `size` rows (by="time") or columns (by="tickers")."""
+    if by not in ("time", "tickers"):
+        raise InvalidInputError("by must be 'time' or 'tickers'.")
+    if not isinstance(size, int) or size <= 0:
+        raise InvalidInputError("size must be a positive integer.")
+    n = prices.shape[0] if by == "time" else prices.shape[1]
+    for i in range(0, n, size):
+        yield prices.iloc[i : i + size] if by == "time" else prices.iloc[:, i : i + size]
+
+
+# ---------------------------------------------------------------------------
+# Stream operations
+# ---------------------------------------------------------------------------
+
+
+class StreamOp(ABC):
+    """
+    A computation fed with consecutive time chunks of prices. `step` returns
+    the output rows for the chunk (or None); `finish` returns an optional
+    per-ticker summary once the stream ends. State carried between chunks is
+    bounded by the number of tickers (times the lookback for `Overlap`).
+    """
+
+    @abstractmethod
+    def step(self, chunk: pd.DataFrame) -> Optional[pd.DataFrame]:
+        """Consume the next chunk and return its output rows (or None)."""
+
+    def finish(self) -> Optional[pd.Series]:
+        return None
+
+
+class Overlap(StreamOp):
+    """
+    Apply `func` (e.g. `lambda p: sma(p, 20)`) to each chunk prefixed with the
+    last `lookback` rows of the previous one. Exact for any function whose
+    value at a row depends on at most `lookback` earlier rows: returns (1),
+    sma / simple rsi / rolling risk measures (their window, +1 if they start from returns).
+    """
+
+    def __init__(self, func: Callable[[pd.DataFrame], Output], lookback: int) -> None:
+        if not callable(func):
+            raise InvalidInputError("func must be callable.")
+        if not isinstance(lookback, int) or lookback < 0:
+            raise InvalidInputError("lookback must be a non-negative integer.")
+        self.func = func
+        self.lookback = lookback
+        self._tail: Optional[pd.DataFrame] = None
+
+    def step(self, chunk: pd.DataFrame) -> Optional[pd.DataFrame]:
+        frame = chunk if self._tail is None else pd.concat([self._tail, chunk])
+        if self.lookback:
+            self._tail = frame.iloc[-self.lookback :]
+        out = self.func(frame)
+        if isinstance(out, pd.Series):
+            out = out.to_frame()
+        return out.loc[out.index >= chunk.index[0]]
+
+
+class EMA(StreamOp):
+    """Exponential moving average (same values as `indicators.ema`), resumed from the previous chunk's state."""
+
+    def __init__(self, span: int) -> None:
+        if not isinstance(span, int) or span <= 0:
+            raise InvalidInputError("span must be a positive integer.")
+        self.alpha = 2.0 / (span + 1.0)
+        self._state: list = []
+
+    def step(self, chunk: pd.DataFrame) -> pd.DataFrame:
+        out = ewm_resume(chunk.to_numpy(dtype=float), self.alpha, self._state)
+        return pd.DataFrame(out, index=chunk.index, columns=chunk.columns)
+
+
+class Drawdown(StreamOp):
+    """
+    Drawdown from the running peak (same values as `risk.max_drawdown`);
+    the summary is the worst drawdown per ticker.
+    """
+
+    def __init__(self) -> None:
+        self._peak: Optional[np.ndarray] = None
+        self._worst: Optional[np.ndarray] = None
+        self._columns = None
+
+    def step(self, chunk: pd.DataFrame) -> pd.DataFrame:
+        values = chunk.to_numpy(dtype=float)
+        if self._peak is not None:
+            values = np.vstack([self._peak, values])
+        with np.errstate(invalid="ignore"):
+            peak = np.fmax.accumulate(values, axis=0)
+            dd = (values / peak - 1.0)[len(values) - len(chunk) :]
+        self._peak = peak[-1:]
+        worst = np.fmin.reduce(dd, axis=0)
+        self._worst = worst if self._worst is None else np.fmin(self._worst, worst)
+        self._columns = chunk.columns
+        return pd.DataFrame(dd, index=chunk.index, columns=chunk.columns)
+
+    def finish(self) -> Optional[pd.Series]:
+        if self._worst is None:
+            return None
+        return pd.Series(self._worst, index=self._columns, name="max_drawdown")
+
+
+class Volatility(StreamOp):
+    """
+    Volatility of daily returns per ticker (same value as
+    `risk.volatility(daily_returns(prices))`), merged across chunks with the
+    parallel mean/variance update; only the summary is produced.
+    """
+
+    def __init__(self, annualize: bool = True, periods_per_year: int = 252) -> None:
+        if not isinstance(periods_per_year, int) or periods_per_year <= 0:
+            raise InvalidInputError("periods_per_year must be a positive integer.")
+        self.annualize = annualize
+        self.periods_per_year = periods_per_year
+        self._last: Optional[np.ndarray] = None
+        self._n = self._mean = self._m2 = None
+        self._columns = None
+
+    def step(self, chunk: pd.DataFrame) -> None:
+        values = chunk.to_numpy(dtype=float)
+        if self._last is not None:
+            values = np.vstack([self._last, values])
+        self._last = values[-1:]
+        self._columns = chunk.columns
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rets = values[1:] / values[:-1] - 1.0
+        ok = ~np.isnan(rets)
+        n = ok.sum(axis=0).astype(float)
+        mean = np.divide(np.where(ok, rets, 0.0).sum(axis=0), n, out=np.zeros(len(n)), where=n > 0)
+        m2 = np.where(ok, (rets - mean) ** 2, 0.0).sum(axis=0)
+        if self._n is None:
+            self._n, self._mean, self._m2 = n, mean, m2
+            return None
+        total = self._n + n
+        delta = mean - self._mean
+        with np.errstate(divide="ignore", invalid="ignore"):
+            self._mean = np.where(total > 0, self._mean + delta * n / total, 0.0)
+            self._m2 = self._m2 + m2 + np.where(total > 0, delta**2 * self._n * n / total, 0.0)
+        self._n = total
+        return None
+
+    def finish(self) -> Optional[pd.Series]:
+        if self._n is None:
+            return None
+        with np.errstate(divide="ignore", invalid="ignore"):
+            vol = np.where(self._n >= 2, np.sqrt(self._m2 / (self._n - 1)), np.nan)
+        if self.annualize:
+            vol = vol * np.sqrt(self.periods_per_year)
+        return pd.Series(vol, index=self._columns, name="volatility")
+
+
+# ---------------------------------------------------------------------------
+# Part files
+# ---------------------------------------------------------------------------
+
+
+def _index_arrays(index: pd.Index, prefix: str) -> Dict[str, np.ndarray]:
+    if isinstance(index, pd.MultiIndex):
+        return {
+            f"{prefix}_levels": np.array([[str(v) for v in level] for level in zip(*index)], dtype=str),
+            f"{prefix}_names": np.array([str(n) for n in index.names], dtype=str),
+        }
+    if isinstance(index, pd.DatetimeIndex):
+        tz = "" if index.tz is None else str(index.tz)
+        naive = index if index.tz is None else index.tz_convert("UTC").tz_localize(None)
+        return {f"{prefix}_dates": naive.to_numpy(), f"{prefix}_tz": np.array(tz)}
+    return {f"{prefix}_labels": np.array([str(v) for v in index], dtype=str), f"{prefix}_name": np.array(str(index.name or ""))}
+
+
+def _read_index(z, prefix: str) -> pd.Index:
+    if f"{prefix}_levels" in z:
+        return pd.MultiIndex.from_arrays([list(level) for level in z[f"{prefix}_levels"]], names=list(z[f"{prefix}_names"]))
+    if f"{prefix}_dates" in z:
+        index = pd.DatetimeIndex(z[f"{prefix}_dates"])
+        tz = str(z[f"{prefix}_tz"])
+        return index.tz_localize("UTC").tz_convert(tz) if tz else index
+    name = str(z[f"{prefix}_name"])
+    return pd.Index(list(z[f"{prefix}_labels"]), name=name or None)
+
+
+class PartWriter:
+    """
+    Writes one output as numbered part files (Parquet or NPZ) in `directory`,
+    plus a manifest recording how the parts join: along rows (time chunks,
+    summaries) or along columns (ticker chunks).
+    """
+
+    def __init__(self, directory: str, fmt: str = "parquet", axis: str = "rows") -> None:
+        if fmt not in ("parquet", "npz"):
+            raise InvalidInputError("fmt must be 'parquet' or 'npz'.")
+        if axis not in ("rows", "columns"):
+            raise InvalidInputError("axis must be 'rows' or 'columns'.")
+        self.directory = directory
+        self.fmt = fmt
+        self.axis = axis
+        self.parts: List[str] = []
+        os.makedirs(directory, exist_ok=True)
+
+    def write(self, frame: Output) -> None:
+        frame = frame.to_frame() if isinstance(frame, pd.Series) else frame
+        name = f"part-{len(self.parts):05d}.{self.fmt}"
+        path = os.path.join(self.directory, name)
+        if self.fmt == "parquet":
+            out = frame if isinstance(frame.columns, pd.MultiIndex) else frame.set_axis([str(c) for c in frame.columns], axis=1)
+            out.to_parquet(path)
+        else:
+            np.savez(path, values=frame.to_numpy(dtype=float), **_index_arrays(frame.index, "index"), **_index_arrays(frame.columns, "columns"))
+        self.parts.append(name)
+
+    def close(self) -> None:
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump({"format": self.fmt, "axis": self.axis, "parts": self.parts}, f)
+        os.replace(tmp, os.path.join(self.directory, _MANIFEST))
+
+
+def read_output(directory: str) -> pd.DataFrame:
+    """Load an output written by `run_stream` (all parts joined) back into one DataFrame."""
+    manifest = os.path.join(directory, _MANIFEST)
+    if not os.path.exists(manifest):
+        raise InvalidInputError(f"No stream output at {directory}.")
+    with open(manifest) as f:
+        meta = json.load(f)
+    frames = []
+    for name in meta["parts"]:
+        path = os.path.join(directory, name)
+        if meta["format"] == "parquet":
+            frames.append(pd.read_parquet(path))
+        else:
+            with np.load(path, allow_pickle=False) as z:
+                frames.append(pd.DataFrame(z["values"], index=_read_index(z, "index"), columns=_read_index(z, "columns")))
+    if not frames:
+        return pd.DataFrame()
+    return pd.concat(frames, axis=0 if meta["axis"] == "rows" else 1)
+
+
+# ---------------------------------------------------------------------------
+# Driver
+# ---------------------------------------------------------------------------
+
+
+def _remove_output(path: str) -> None:
+    if os.path.isdir(path):
+        shutil.rmtree(path)
+    elif os.path.exists(path):
+        os.remove(path)
+
+
+def _swap_in(tmp: str, target: str) -> None:
+    """Replace `target` with the finished directory `tmp`, never leaving parts of an old run behind."""
+    old = None
+    if os.path.lexists(target):
+        old = tempfile.mkdtemp(dir=os.path.dirname(target), prefix=".old-")
+        os.rmdir(old)
+        os.replace(target, old)
+    os.replace(tmp, target)
+    if old is not None:
+        _remove_output(old)
+
+
+def _whole(op: Union[StreamOp, Callable], frame: pd.DataFrame):
+    if isinstance(op, StreamOp):
+        fresh = copy.deepcopy(op)
+        return fresh.step(frame), fresh.finish()
+    out = op(frame)
+    if isinstance(out, pd.Series):
+        return None, out
+    return out, None
+
+
+def run_stream(
+    chunks: Iterable[pd.DataFrame],
+    ops: Dict[str, Union[StreamOp, Callable[[pd.DataFrame], Output]]],
+    out_dir: str,
+    by: str = "time",
+    fmt: str = "parquet",
+) -> Dict[str, str]:
+    """
+    Push chunks of prices through `ops` and write every result as it is
+    produced, so memory is bounded by the chunk size, not the universe.
+
+    by="time": chunks are consecutive date ranges of the same tickers and
+      every op must be a StreamOp (state carries across chunks).
+    by="tickers": chunks are groups of tickers over the full date range; ops
+      can also be plain functions of a price frame (e.g.
+      `lambda p: rsi(p, 14)`), since results are independent per ticker.
+
+    Row outputs go to out_dir/<name>; per-ticker summaries (StreamOp.finish,
+    or Series results in ticker mode) to out_dir/<name>_summary (just
+    out_dir/<name> when there are no row outputs). Outputs of an earlier run
+    into the same `out_dir` are replaced, not appended to. Returns name ->
+    directory; read them back with `read_output`.
+    """
+    if by not in ("time", "tickers"):
+        raise InvalidInputError("by must be 'time' or 'tickers'.")
+    if not isinstance(ops, dict) or not ops:
+        raise InvalidInputError("ops must be a non-empty dict of name -> operation.")
+    for name, op in ops.items():
+        if by == "time" and not isinstance(op, StreamOp):
+            raise InvalidInputError(f"Op '{name}' must be a StreamOp (e.g. Overlap) in time mode.")
+        if not callable(op) and not isinstance(op, StreamOp):
+            raise InvalidInputError(f"Op '{name}' must be a StreamOp or a callable.")
+
+    row_axis = "rows" if by == "time" else "columns"
+    rows: Dict[str, PartWriter] = {}
+    summaries: Dict[str, PartWriter] = {}
+    os.makedirs(out_dir, exist_ok=True)
+
+    def writer(store: Dict[str, PartWriter], key: str, axis: str) -> PartWriter:
+        if key not in store:
+            # Parts go to a fresh hidden directory, swapped in once the stream is done
+            store[key] = PartWriter(tempfile.mkdtemp(dir=out_dir, prefix=f".{key}-"), fmt, axis)
+        return store[key]
+
+    try:
+        n_chunks = 0
+        for chunk in chunks:
+            if chunk is None or chunk.empty:
+                continue
+            n_chunks += 1
+            for name, op in ops.items():
+                if by == "time":
+                    out, summary = op.step(chunk), None
+                else:
+                    out, summary = _whole(op, chunk)
+                if out is not None and not out.empty:
+                    writer(rows, name, row_axis).write(out)
+                if summary is not None:
+                    writer(summaries, name, "rows").write(summary)
+
+        if by == "time":
+            for name, op in ops.items():
+                summary = op.finish()
+                if summary is not None:
+                    writer(summaries, name, "rows").write(summary)
+        if n_chunks == 0:
+            raise EmptyDataError("The stream did not yield any price data.")
+    except BaseException:
+        for w in list(rows.values()) + list(summaries.values()):
+            shutil.rmtree(w.directory, ignore_errors=True)
+        raise
+
+    paths = {}
+    for name in ops:
+        outputs = []
+        if name in rows:
+            outputs.append((name, rows[name]))
+        if name in summaries:
+            # A summary-only op's summary is its output
+            outputs.append((f"{name}_summary" if name in rows else name, summaries[name]))
+        if name in summaries and name not in rows:
+            _remove_output(os.path.join(out_dir, f"{name}_summary"))
+        for key, w in outputs:
+            w.close()
+            target = os.path.join(out_dir, key)
+            _swap_in(w.directory, target)
+            w.directory = target
+            paths[key] = target
+    return paths
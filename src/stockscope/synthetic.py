@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import zlib
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .exceptions import InvalidInputError
+
+
+OHLCV_FIELDS = ("Open", "High", "Low", "Close", "Adj Close", "Volume")
+
+_INTERVAL_FREQ = {
+    "1m": "1min",
+    "2m": "2min",
+    "5m": "5min",
+    "15m": "15min",
+    "30m": "30min",
+    "60m": "60min",
+    "90m": "90min",
+    "1h": "60min",
+    "1d": "B",
+    "5d": "5B",
+    "1wk": "W-FRI",
+    "1mo": "MS",
+    "3mo": "QS",
+}
+
+_SESSION_OPEN = "09:30"
+_SESSION_CLOSE = "15:59"
+
+
+def synthetic_index(
+    start: Optional[pd.Timestamp],
+    end: Optional[pd.Timestamp],
+    interval: str = "1d",
+) -> pd.DatetimeIndex:
+    """
+    Bar timestamps in `[start, end)` for `interval`. Intraday bars only fall
+    inside a 09:30-16:00 weekday session.
+    """
+    if interval not in _INTERVAL_FREQ:
+        raise InvalidInputError(f"Unsupported interval '{interval}'. Allowed: {sorted(_INTERVAL_FREQ)}")
+    intraday = interval.endswith("m") or interval == "1h"
+    end = pd.Timestamp.now().floor("min") if end is None else pd.Timestamp(end)
+    if start is None:
+        start = end - (pd.Timedelta(days=5) if intraday else pd.Timedelta(days=365))
+    start = pd.Timestamp(start)
+
+    idx = pd.date_range(start, end, freq=_INTERVAL_FREQ[interval], inclusive="left")
+    if intraday:
+        idx = idx[idx.dayofweek < 5]
+        idx = idx[idx.indexer_between_time(_SESSION_OPEN, _SESSION_CLOSE)]
+    return idx
+
+
+def _ticker_seed(seed: int, ticker: str) -> np.random.Generator:
+    return np.random.default_rng([seed, zlib.crc32(ticker.encode("utf-8"))])
+
+
+def _gap_mask(seed: int, ticker: str, n: int, density: float, max_gap: int) -> np.ndarray:
+    # Separate stream so gaps never change the price path itself
+    rng = np.random.default_rng([seed, zlib.crc32(ticker.encode("utf-8")), 1])
+    # Gaps start at rate density / mean length, so about `density` of the bars are missing
+    starts = np.flatnonzero(rng.random(n) < density / ((max_gap + 1) / 2))
+    lengths = rng.integers(1, max_gap + 1, size=len(starts))
+    mask = np.zeros(n + max_gap, dtype=bool)
+    for start, length in zip(starts, lengths):
+        mask[start : start + length] = True
+    # Every ticker has a first bar, so there is always a price to start from
+    mask[0] = False
+    return mask[:n]
+
+
+def synthetic_ohlcv(
+    tickers: Iterable[str],
+    index: pd.DatetimeIndex,
+    seed: int = 0,
+    start_price: float = 100.0,
+    mu: float = 0.0003,
+    sigma: float = 0.02,
+    fields: Optional[Iterable[str]] = None,
+    nan_density: float = 0.0,
+    max_gap: int = 1,
+) -> Dict[str, pd.DataFrame]:
+    """
+    Deterministic geometric-Brownian-motion OHLCV bars.
+
+    Returns a dict field -> DataFrame(index x tickers). Each ticker's path
+    depends only on (seed, ticker, len(index)), not on the other tickers.
+    `nan_density` is the approximate fraction of missing bars per ticker, in
+    gaps of 1 to `max_gap` consecutive bars (halts, late data); the prices
+    around a gap are the same as without it.
+    """
+    if not (0 <= nan_density < 1):
+        raise InvalidInputError("nan_density must be in [0, 1).")
+    if not isinstance(max_gap, int) or max_gap <= 0:
+        raise InvalidInputError("max_gap must be a positive integer.")
+    tickers = list(tickers)
+    wanted: List[str] = list(OHLCV_FIELDS if fields is None else fields)
+    n = len(index)
+
+    cols: Dict[str, Dict[str, np.ndarray]] = {f: {} for f in wanted}
+    for t in tickers:
+        rng = _ticker_seed(seed, t)
+        z = rng.standard_normal((4, n))
+        close = start_price * np.exp(np.cumsum((mu - 0.5 * sigma**2) + sigma * z[0]))
+        prev = np.concatenate(([start_price], close[:-1]))
+        open_ = prev * np.exp(0.25 * sigma * z[1])
+        high = np.maximum(open_, close) * (1 + 0.5 * sigma * np.abs(z[2]))
+        low = np.minimum(open_, close) * (1 - 0.5 * sigma * np.abs(z[3]))
+        volume = np.round(rng.lognormal(13.0, 0.5, n))
+        bars = {"Open": open_, "High": high, "Low": low, "Close": close, "Adj Close": close, "Volume": volume}
+        if nan_density > 0 and n:
+            missing = _gap_mask(seed, t, n, nan_density, max_gap)
+            bars = {f: np.where(missing, np.nan, v) for f, v in bars.items()}
+        for f in wanted:
+            if f in bars:
+                cols[f][t] = bars[f]
+
+    return {f: pd.DataFrame(cols[f], index=index, columns=tickers) for f in wanted if cols[f]}
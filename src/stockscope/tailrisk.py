@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from statistics import NormalDist
+from typing import Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from .exceptions import InvalidInputError
+from .portfolio import normalize_weights
+
+
+SeriesOrFrame = Union[pd.Series, pd.DataFrame]
+
+
+def _check_returns(returns: SeriesOrFrame) -> SeriesOrFrame:
+    if not isinstance(returns, (pd.Series, pd.DataFrame)):
+        raise InvalidInputError("returns must be a pandas Series or DataFrame.")
+    if returns.empty:
+        raise InvalidInputError("returns cannot be empty.")
+    return returns
+
+
+def _check_level(level: float) -> float:
+    try:
+        level = float(level)
+    except Exception:
+        raise InvalidInputError("level must be a float like 0.05.")
+    if not (0 < level < 1):
+        raise InvalidInputError("level must be between 0 and 1 (e.g., 0.05).")
+    return level
+
+
+def _scalar_or_series(x: pd.Series, returns: SeriesOrFrame):
+    return float(x.iloc[0]) if isinstance(returns, pd.Series) else x
+
+
+def parametric_var(returns: SeriesOrFrame, level: float = 0.05, method: str = "gaussian") -> Union[float, pd.Series]:
+    """
+    Parametric VaR as a return quantile (same sign convention as
+    `value_at_risk`: a loss is negative).
+
+    method="gaussian" uses mean + z * std; method="cornish-fisher" adjusts z
+    for the sample skewness and excess kurtosis.
+    """
+    returns = _check_returns(returns)
+    level = _check_level(level)
+    if method not in ("gaussian", "cornish-fisher"):
+        raise InvalidInputError("method must be 'gaussian' or 'cornish-fisher'.")
+
+    frame = returns.to_frame() if isinstance(returns, pd.Series) else returns
+    mu = frame.mean()
+    sigma = frame.std(ddof=1)
+    z = NormalDist().inv_cdf(level)
+    if method == "cornish-fisher":
+        s = frame.skew()
+        k = frame.kurt()
+        z = z + (z**2 - 1) * s / 6 + (z**3 - 3 * z) * k / 24 - (2 * z**3 - 5 * z) * s**2 / 36
+    return _scalar_or_series(mu + z * sigma, returns)
+
+
+def expected_shortfall(returns: SeriesOrFrame, level: float = 0.05, method: str = "historical") -> Union[float, pd.Series]:
+    """
+    Expected Shortfall / CVaR: the mean return in the worst `level` tail.
+
+    method="historical" averages returns at or below the historical VaR;
+    method="gaussian" uses mean - std * pdf(z) / level.
+    """
+    returns = _check_returns(returns)
+    level = _check_level(level)
+    if method not in ("historical", "gaussian"):
+        raise InvalidInputError("method must be 'historical' or 'gaussian'.")
+
+    frame = returns.to_frame() if isinstance(returns, pd.Series) else returns
+    if method == "gaussian":
+        z = NormalDist().inv_cdf(level)
+        es = frame.mean() - frame.std(ddof=1) * NormalDist().pdf(z) / level
+    else:
+        var = frame.quantile(level)
+        es = frame[frame.le(var, axis=1)].mean()
+    if es.isna().all():
+        raise InvalidInputError("returns contain only NaNs.")
+    return _scalar_or_series(es, returns)
+
+
+@dataclass
+class MonteCarloResult:
+    var: float
+    expected_shortfall: float
+    level: float
+    n_paths: int
+    horizon: int
+
+
+def _simulate_chunk(args) -> np.ndarray:
+    seed_seq, n, mean, chol, w, horizon = args
+    rng = np.random.default_rng(seed_seq)
+    # Project the factor loadings onto the weights once: r_p = w.mu + z . (L^T w)
+    loading = chol.T @ w
+    drift = float(mean @ w)
+    growth = np.ones(n)
+    for _ in range(horizon):
+        z = rng.standard_normal((n, len(w)))
+        growth *= 1.0 + drift + z @ loading
+    return growth - 1.0
+
+
+def _cov_matrix(cov: Union[pd.DataFrame, np.ndarray], tickers: List[str]) -> np.ndarray:
+    n = len(tickers)
+    if isinstance(cov, pd.DataFrame):
+        missing = [t for t in tickers if t not in cov.index or t not in cov.columns]
+        if missing:
+            raise InvalidInputError(f"Missing tickers in cov: {missing}")
+        return cov.loc[tickers, tickers].to_numpy(dtype=float)
+    if isinstance(cov, np.ndarray):
+        if cov.shape != (n, n):
+            raise InvalidInputError(f"cov must have shape ({n}, {n}) to match the weights, got {cov.shape}.")
+        return cov.astype(float)
+    raise InvalidInputError("cov must be a pandas DataFrame or a square numpy array.")
+
+
+def monte_carlo_var(
+    returns: pd.DataFrame,
+    weights: Dict[str, float],
+    level: float = 0.05,
+    n_paths: int = 100_000,
+    horizon: int = 1,
+    chunk_size: int = 50_000,
+    seed: Optional[int] = None,
+    n_jobs: int = 1,
+    cov: Optional[Union[pd.DataFrame, np.ndarray]] = None,
+) -> MonteCarloResult:
+    """
+    Monte Carlo VaR and Expected Shortfall of a portfolio over `horizon`
+    periods, with multivariate normal asset returns (mean and covariance
+    estimated from `returns`, e.g. `daily_returns` output, unless `cov` is
+    given) and daily rebalancing to `weights`. A `cov` ndarray is ordered like
+    `weights`; a DataFrame is matched by ticker.
+
+    Paths are generated in chunks of `chunk_size` so memory stays bounded.
+    Each chunk gets its own RNG stream spawned from `seed`, so results are
+    reproducible and, for a given `chunk_size`, identical for any `n_jobs`
+    (processes).
+    """
+    if not isinstance(returns, pd.DataFrame) or returns.empty:
+        raise InvalidInputError("returns must be a non-empty pandas DataFrame.")
+    level = _check_level(level)
+    for name, v in (("n_paths", n_paths), ("horizon", horizon), ("chunk_size", chunk_size), ("n_jobs", n_jobs)):
+        if not isinstance(v, int) or v <= 0:
+            raise InvalidInputError(f"{name} must be a positive integer.")
+    w = normalize_weights(weights)
+    missing = [t for t in w if t not in returns.columns]
+    if missing:
+        raise InvalidInputError(f"Missing tickers in returns data: {missing}")
+
+    tickers = list(w)
+    w_vec = np.array([w[t] for t in tickers], dtype=float)
+    mean = returns[tickers].mean().to_numpy(dtype=float)
+    sigma = returns[tickers].cov().to_numpy(dtype=float) if cov is None else _cov_matrix(cov, tickers)
+    if np.isnan(sigma).any() or np.isnan(mean).any():
+        raise InvalidInputError("Not enough overlapping returns to estimate the covariance matrix.")
+
+    # Cholesky factor; fall back to a clipped eigen-decomposition for semi-definite matrices
+    try:
+        chol = np.linalg.cholesky(sigma)
+    except np.linalg.LinAlgError:
+        vals, vecs = np.linalg.eigh(sigma)
+        chol = vecs * np.sqrt(np.clip(vals, 0.0, None))
+
+    sizes = [chunk_size] * (n_paths // chunk_size)
+    if n_paths % chunk_size:
+        sizes.append(n_paths % chunk_size)
+    streams = np.random.SeedSequence(seed).spawn(len(sizes))
+    tasks = [(s, n, mean, chol, w_vec, horizon) for s, n in zip(streams, sizes)]
+
+    if n_jobs == 1 or len(tasks) == 1:
+        sims = [_simulate_chunk(t) for t in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=n_jobs) as ex:
+            sims = list(ex.map(_simulate_chunk, tasks))
+
+    pnl = np.concatenate(sims)
+    var = float(np.quantile(pnl, level))
+    es = float(pnl[pnl <= var].mean())
+    return MonteCarloResult(var=var, expected_shortfall=es, level=level, n_paths=n_paths, horizon=horizon)
@@ -0,0 +1,87 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from stockscope.backtest import backtest
+from stockscope.exceptions import InvalidInputError
+from stockscope.portfolio import buy_and_hold_value
+
+
+def _loop_backtest(prices, weights, rows, cost, initial_value):
+    # Reference: rebalance bar by bar with explicit holdings
+    p = prices.to_numpy(dtype=float)
+    w = np.array([weights[t] for t in prices.columns])
+    value = initial_value
+    shares = np.zeros(len(w))
+    out = []
+    for t in range(len(p)):
+        if t in rows:
+            value = shares @ p[t] if t else value
+            traded = np.abs(value * w - shares * p[t]).sum()
+            value -= cost * traded
+            shares = value * w / p[t]
+        out.append(shares @ p[t])
+    return np.array(out)
+
+
+class TestBacktest(unittest.TestCase):
+    def setUp(self):
+        idx = pd.bdate_range("2024-01-01", periods=130)
+        rng = np.random.default_rng(0)
+        rets = rng.normal(0.0005, 0.02, size=(len(idx), 3))
+        self.prices = pd.DataFrame(100 * np.cumprod(1 + rets, axis=0), index=idx, columns=["AAPL", "MSFT", "SPY"])
+        self.weights = {"AAPL": 0.5, "MSFT": 0.3, "SPY": 0.2}
+
+    def test_no_rebalance_matches_buy_and_hold(self):
+        res = backtest(self.prices, self.weights, rebalance=None, initial_value=1000)
+        expected = buy_and_hold_value(self.prices, self.weights, initial_value=1000)
+        np.testing.assert_allclose(res.value.to_numpy(), expected.to_numpy())
+        self.assertEqual(len(res.turnover), 1)
+
+    def test_monthly_matches_loop(self):
+        res = backtest(self.prices, self.weights, rebalance="M", cost_bps=10, initial_value=1000)
+        rows = [0] + [i for i in range(1, len(self.prices)) if self.prices.index[i].month != self.prices.index[i - 1].month]
+        self.assertEqual(len(res.turnover), len(rows))
+        self.assertAlmostEqual(res.turnover.iloc[0], 1.0)
+        expected = _loop_backtest(self.prices, self.weights, set(rows), 10 / 10_000, 1000)
+        np.testing.assert_allclose(res.value.to_numpy(), expected)
+        np.testing.assert_allclose((res.holdings * self.prices).sum(axis=1).to_numpy(), res.value.to_numpy())
+
+    def test_costs_reduce_value(self):
+        free = backtest(self.prices, self.weights, rebalance="M")
+        costly = backtest(self.prices, self.weights, rebalance="M", cost_bps=25)
+        self.assertLess(costly.value.iloc[-1], free.value.iloc[-1])
+        self.assertGreater(costly.costs.sum(), 0)
+
+    def test_threshold_and_weight_frame(self):
+        res = backtest(self.prices, self.weights, rebalance="threshold", threshold=0.02)
+        w = np.array(list(self.weights.values()))
+        rows = [self.prices.index.get_loc(d) for d in res.turnover.index]
+        expected = _loop_backtest(self.prices, self.weights, set(rows), 0.0, 10_000.0)
+        np.testing.assert_allclose(res.value.to_numpy(), expected)
+        # Just before each rebalance the drift must exceed the threshold
+        for prev, cur in zip(rows[:-1], rows[1:]):
+            drift = w * self.prices.iloc[cur].to_numpy() / self.prices.iloc[prev].to_numpy()
+            self.assertGreater(np.abs(drift / drift.sum() - w).max(), 0.02)
+
+        schedule = pd.DataFrame(
+            [[1, 1, 0], [0, 1, 1]], index=pd.to_datetime(["2024-01-01", "2024-03-02"]), columns=["aapl", "msft", "spy"]
+        )
+        res = backtest(self.prices, schedule)
+        self.assertEqual(list(res.turnover.index), [self.prices.index[0], pd.Timestamp("2024-03-04")])
+        self.assertTrue((res.holdings.loc["2024-03-04":, "AAPL"] == 0).all())
+
+    def test_invalid_inputs(self):
+        with self.assertRaises(InvalidInputError):
+            backtest(self.prices, self.weights, rebalance="daily")
+        with self.assertRaises(InvalidInputError):
+            backtest(self.prices, {"TSLA": 1.0})
+        with self.assertRaises(InvalidInputError):
+            backtest(self.prices, self.weights, cost_bps=-5)
+        with self.assertRaises(InvalidInputError):
+            backtest(pd.DataFrame(), self.weights)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from stockscope.benchmark import BENCHMARKS, BenchmarkResult, compare, load_results, make_universe, run_benchmarks, save_results
+from stockscope.exceptions import InvalidInputError
+
+
+class TestBenchmark(unittest.TestCase):
+    def test_universe_is_deterministic_with_gaps(self):
+        a = make_universe(20, 500, nan_density=0.05, max_gap=4, seed=1)
+        b = make_universe(20, 500, nan_density=0.05, max_gap=4, seed=1)
+        self.assertEqual(a.shape, (500, 20))
+        np.testing.assert_array_equal(a.to_numpy(), b.to_numpy())
+        self.assertTrue(0.02 < a.isna().to_numpy().mean() < 0.08)
+        self.assertFalse(a.iloc[0].isna().any())
+
+    def test_run_save_and_load(self):
+        results = run_benchmarks(scales=[(5, 60)], repeat=1)
+        self.assertEqual([r.name for r in results], list(BENCHMARKS))
+        self.assertTrue(all(r.best_seconds > 0 and r.peak_memory_bytes > 0 for r in results))
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "bench.json")
+            save_results(results, path)
+            self.assertEqual(load_results(path), results)
+
+    def test_compare_flags_regressions(self):
+        base = [BenchmarkResult("sma", 10, 100, 3, 0.010, 0.011, 1000), BenchmarkResult("ema", 10, 100, 3, 0.010, 0.011, 1000)]
+        current = [
+            BenchmarkResult("sma", 10, 100, 3, 0.020, 0.021, 1000),
+            BenchmarkResult("ema", 10, 100, 3, 0.011, 0.012, 5000),
+            BenchmarkResult("rsi", 10, 100, 3, 0.500, 0.500, 1000),
+        ]
+        result = {c.key: c for c in compare(current, base, tolerance=0.25)}
+        self.assertEqual(set(result), {"sma[10x100]", "ema[10x100]"})
+        self.assertTrue(result["sma[10x100]"].regressed)
+        self.assertAlmostEqual(result["sma[10x100]"].time_ratio, 2.0)
+        self.assertTrue(result["ema[10x100]"].regressed)
+        self.assertFalse(compare(current, base, tolerance=1.5, memory_tolerance=5)[0].regressed)
+
+    def test_invalid_input(self):
+        with self.assertRaises(InvalidInputError):
+            run_benchmarks(scales=[(5, 60)], names=["nope"])
+        with self.assertRaises(InvalidInputError):
+            make_universe(0, 100)
+        with self.assertRaises(InvalidInputError):
+            load_results("/nonexistent/bench.json")
+
+
+if __name__ == "__main__":
+    unittest.main()
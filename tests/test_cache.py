@@ -0,0 +1,73 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from stockscope.cache import PriceCache
+from stockscope.exceptions import EmptyDataError, InvalidInputError
+
+
+class StubDownloader:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, tickers, start, end, interval, price_field):
+        self.calls.append((tuple(tickers), start, end))
+        idx = pd.date_range(start or "2024-01-01", end, freq="D", inclusive="left")
+        if len(idx) == 0:
+            raise EmptyDataError("No data returned.")
+        data = {t: np.arange(len(idx), dtype=float) + idx.day.to_numpy() for t in tickers}
+        return pd.DataFrame(data, index=idx)
+
+
+class TestPriceCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = PriceCache(self.tmp.name)
+        self.dl = StubDownloader()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def get(self, tickers, start, end):
+        return self.cache.get(tickers, pd.Timestamp(start), pd.Timestamp(end), "1d", "Adj Close", self.dl)
+
+    def test_miss_then_hit(self):
+        first = self.get(["AAPL", "MSFT"], "2024-01-01", "2024-01-11")
+        second = self.get(["AAPL", "MSFT"], "2024-01-01", "2024-01-11")
+        self.assertEqual(len(self.dl.calls), 1)
+        pd.testing.assert_frame_equal(first, second, check_freq=False)
+        self.assertEqual(self.cache.stats.misses, 2)
+        self.assertEqual(self.cache.stats.hits, 2)
+        self.assertTrue(os.path.exists(self.cache.path_for("AAPL", "1d", "Adj Close")))
+
+    def test_only_missing_ranges_downloaded(self):
+        self.get(["AAPL"], "2024-01-05", "2024-01-10")
+        out = self.get(["AAPL"], "2024-01-01", "2024-01-15")
+        self.assertEqual(len(out), 14)
+        ranges = [(c[1], c[2]) for c in self.dl.calls[1:]]
+        self.assertIn((pd.Timestamp("2024-01-01"), pd.Timestamp("2024-01-05")), ranges)
+        self.assertIn((pd.Timestamp("2024-01-10"), pd.Timestamp("2024-01-15")), ranges)
+        self.assertEqual(self.cache.stats.partial_hits, 1)
+
+    def test_shared_gap_single_download(self):
+        self.get(["AAPL", "MSFT", "GOOGL"], "2024-01-01", "2024-01-05")
+        self.assertEqual(self.dl.calls, [(("AAPL", "MSFT", "GOOGL"), pd.Timestamp("2024-01-01"), pd.Timestamp("2024-01-05"))])
+
+    def test_live_edge_expiry(self):
+        cache = PriceCache(self.tmp.name, ttl={"1d": 0})
+        cache.get(["AAPL"], pd.Timestamp("2024-01-01"), None, "1d", "Adj Close", self.dl)
+        cache.get(["AAPL"], pd.Timestamp("2024-01-01"), None, "1d", "Adj Close", self.dl)
+        self.assertEqual(len(self.dl.calls), 2)
+        # Stale edge is refreshed from the last stored bar, not from `start`
+        self.assertGreater(self.dl.calls[1][1], pd.Timestamp("2024-01-01"))
+
+    def test_invalid_ttl(self):
+        with self.assertRaises(InvalidInputError):
+            PriceCache(self.tmp.name, ttl={"1d": -1})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from stockscope.covariance import CovarianceTracker, correlation, covariance, ledoit_wolf
+from stockscope.exceptions import InvalidInputError
+from stockscope.portfolio import portfolio_returns, portfolio_volatility
+from stockscope.risk import volatility
+
+
+class TestCovariance(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        idx = pd.bdate_range("2024-01-01", periods=200)
+        self.rets = pd.DataFrame(rng.normal(0.001, 0.02, (200, 5)), index=idx, columns=["A", "B", "C", "D", "E"])
+        self.ragged = self.rets.copy()
+        self.ragged.iloc[:40, 1] = np.nan
+        self.ragged.iloc[90:120, 3] = np.nan
+        self.ragged[rng.random(self.ragged.shape) < 0.05] = np.nan
+
+    def test_matches_pandas_pairwise(self):
+        np.testing.assert_allclose(covariance(self.ragged, block_size=2), self.ragged.cov(), atol=1e-15)
+        np.testing.assert_allclose(correlation(self.ragged, block_size=3), self.ragged.corr(), atol=1e-12)
+        np.testing.assert_allclose(covariance(self.rets), self.rets.cov(), atol=1e-15)
+
+    def test_ewm_matches_pandas(self):
+        last = self.ragged.index[-1]
+        expected = self.ragged.ewm(span=30).cov().xs(last, level=0)
+        np.testing.assert_allclose(covariance(self.ragged, span=30, block_size=2), expected, atol=1e-15)
+
+    def test_ledoit_wolf(self):
+        wide = pd.DataFrame(np.random.default_rng(1).normal(0, 0.02, (30, 60)))
+        shrunk, delta = ledoit_wolf(wide, block_size=16)
+        self.assertTrue(0 < delta <= 1)
+        sample = np.cov(wide.to_numpy(), rowvar=False, bias=True)
+        self.assertAlmostEqual(np.trace(shrunk), np.trace(sample))
+        # The sample covariance is singular here (T < N); the shrunk one is not
+        self.assertGreater(np.linalg.eigvalsh(shrunk).min(), 0)
+        fixed, _ = ledoit_wolf(wide, shrinkage=0.0)
+        np.testing.assert_allclose(fixed, sample, atol=1e-15)
+
+    def test_tracker_updates(self):
+        for span in (None, 20):
+            tracker = CovarianceTracker.from_history(self.ragged.iloc[:150], span=span)
+            for _, row in self.ragged.iloc[150:].iterrows():
+                tracker.update(row)
+            self.assertEqual(tracker.count, len(self.ragged))
+            np.testing.assert_allclose(tracker.covariance(), covariance(self.ragged, span=span), atol=1e-15)
+        with self.assertRaises(InvalidInputError):
+            tracker.update([0.1, 0.2])
+
+    def test_portfolio_volatility(self):
+        w = {"A": 0.5, "C": 0.3, "E": 0.2}
+        expected = volatility(portfolio_returns(self.rets, w))
+        self.assertAlmostEqual(portfolio_volatility(covariance(self.rets), w), expected)
+        many = portfolio_volatility(covariance(self.rets), pd.DataFrame([w, {"B": 1.0}]))
+        self.assertEqual(len(many), 2)
+        self.assertAlmostEqual(many.iloc[0], expected)
+        with self.assertRaises(InvalidInputError):
+            portfolio_volatility(covariance(self.rets), {"TSLA": 1.0})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+import asyncio
+import threading
+import time
+import unittest
+
+from stockscope.fetch import AsyncPriceFetcher, get_prices_async, get_prices_batch
+from stockscope.providers import SyntheticProvider
+from stockscope.exceptions import DataDownloadError, InvalidInputError
+
+
+class TestFetchBatch(unittest.TestCase):
+    def setUp(self):
+        self.tickers = [f"T{i:02d}" for i in range(10)]
+
+    def test_partial_results_and_failure_report(self):
+        provider = SyntheticProvider(fail_tickers=["T03"])
+        res = get_prices_batch(self.tickers, "2024-01-01", "2024-03-01", chunk_size=4,
+                               retries=1, backoff_seconds=0, provider=provider)
+        self.assertEqual(list(res.prices.columns), [t for t in self.tickers if t != "T03"])
+        self.assertEqual(list(res.failures), ["T03"])
+        err = res.failures["T03"]
+        self.assertIsInstance(err, DataDownloadError)
+        self.assertEqual(err.retries, 1)
+        self.assertEqual(err.data_provider, "synthetic")
+
+    def test_transient_failures_are_retried(self):
+        provider = SyntheticProvider(failure_rate=0.3, seed=3)
+        res = get_prices_batch(self.tickers, "2024-01-01", "2024-02-01", chunk_size=3,
+                               max_workers=4, retries=5, backoff_seconds=0, provider=provider)
+        self.assertEqual(res.failures, {})
+        self.assertEqual(res.prices.shape[1], len(self.tickers))
+        self.assertGreaterEqual(provider.calls, 4)
+
+    def test_timeout_fills_error_fields(self):
+        provider = SyntheticProvider(latency=0.5)
+        with self.assertRaises(DataDownloadError) as ctx:
+            get_prices_batch(["AAPL", "MSFT"], "2024-01-01", "2024-02-01", retries=0,
+                             timeout_seconds=0.05, provider=provider)
+        self.assertEqual(ctx.exception.timeout_seconds, 0.05)
+        self.assertEqual(ctx.exception.retries, 0)
+        self.assertEqual(set(ctx.exception.meta["failures"]), {"AAPL", "MSFT"})
+
+    def test_timeout_bounds_call_when_workers_hang(self):
+        release = threading.Event()
+
+        class HangingProvider(SyntheticProvider):
+            def fetch(self, *args, **kwargs):
+                with self._lock:
+                    self.calls += 1
+                release.wait()
+                return super().fetch(*args, **kwargs)
+
+        provider = HangingProvider()
+        try:
+            t0 = time.monotonic()
+            with self.assertRaises(DataDownloadError) as ctx:
+                get_prices_batch(self.tickers[:4], "2024-01-01", "2024-02-01", chunk_size=2, max_workers=2,
+                                 retries=2, backoff_seconds=0.01, timeout_seconds=0.1, provider=provider)
+            # Two hung chunks, then the retries (which never get a thread) time out in turn
+            self.assertLess(time.monotonic() - t0, 2.0)
+            self.assertEqual(set(ctx.exception.meta["failures"]), set(self.tickers[:4]))
+            self.assertEqual(provider.calls, 2)
+        finally:
+            release.set()
+
+    def test_invalid_chunk_size(self):
+        with self.assertRaises(InvalidInputError):
+            get_prices_batch(self.tickers, chunk_size=0, provider=SyntheticProvider())
+
+
+class CountingProvider(SyntheticProvider):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.active = 0
+        self.max_active = 0
+
+    def fetch(self, *args, **kwargs):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            return super().fetch(*args, **kwargs)
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+class TestFetchAsync(unittest.IsolatedAsyncioTestCase):
+    async def test_identical_requests_share_download(self):
+        provider = CountingProvider(latency=0.05)
+        fetcher = AsyncPriceFetcher(provider=provider)
+        a, b = await asyncio.gather(
+            get_prices_async(["AAPL", "MSFT"], "2024-01-01", "2024-02-01", fetcher=fetcher),
+            get_prices_async(["aapl", "msft"], "2024-01-01", "2024-02-01", fetcher=fetcher),
+        )
+        self.assertEqual(provider.calls, 1)
+        self.assertTrue(a.equals(b))
+
+    async def test_concurrency_limit(self):
+        provider = CountingProvider(latency=0.02)
+        fetcher = AsyncPriceFetcher(provider=provider, max_concurrency=2, chunk_size=1)
+        out = await fetcher.get_prices([f"T{i}" for i in range(8)], "2024-01-01", "2024-02-01")
+        self.assertEqual(out.shape[1], 8)
+        self.assertEqual(provider.calls, 8)
+        self.assertLessEqual(provider.max_active, 2)
+
+    async def test_cancel_one_waiter_keeps_shared_download(self):
+        fetcher = AsyncPriceFetcher(provider=SyntheticProvider(latency=0.1))
+        first = asyncio.ensure_future(fetcher.get_prices("AAPL", "2024-01-01", "2024-02-01"))
+        second = asyncio.ensure_future(fetcher.get_prices("AAPL", "2024-01-01", "2024-02-01"))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        out = await second
+        self.assertTrue(first.cancelled())
+        self.assertEqual(list(out.columns), ["AAPL"])
+
+    async def test_shared_validation(self):
+        with self.assertRaises(InvalidInputError):
+            await get_prices_async("AAPL", interval="7m", fetcher=AsyncPriceFetcher())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from stockscope.exceptions import InvalidInputError
+from stockscope.frame import PriceFrame
+from stockscope.indicators import daily_returns, rsi, sma
+from stockscope.portfolio import buy_and_hold_value
+from stockscope.risk import drawdown_stats
+
+
+class TestPriceFrame(unittest.TestCase):
+    def setUp(self):
+        idx = pd.bdate_range("2024-01-01", periods=60)
+        values = 100 * np.cumprod(1 + np.random.default_rng(0).normal(0, 0.01, (60, 2)), axis=0)
+        self.prices = pd.DataFrame(values, index=idx, columns=["AAPL", "MSFT"])
+
+    def test_functions_accept_frame_and_memoize(self):
+        pf = PriceFrame(self.prices)
+        pd.testing.assert_frame_equal(daily_returns(pf), daily_returns(self.prices))
+        daily_returns(pf)
+        pf.returns()
+        self.assertEqual(pf.cache_info().misses, 1)
+        self.assertEqual(pf.cache_info().hits, 2)
+
+        # Positional and keyword calls share one entry; other parameters get their own
+        pd.testing.assert_frame_equal(sma(pf, 5), sma(self.prices, 5))
+        sma(pf, window=5)
+        rsi(pf, 14, method="wilder")
+        self.assertEqual(pf.cache_info().size, 3)
+
+        w = {"AAPL": 0.5, "MSFT": 0.5}
+        pd.testing.assert_series_equal(buy_and_hold_value(pf, w), buy_and_hold_value(self.prices, w))
+        pd.testing.assert_frame_equal(drawdown_stats(pf), drawdown_stats(self.prices))
+
+    def test_cached_results_are_protected(self):
+        pf = PriceFrame(self.prices)
+        rets = daily_returns(pf)
+        rets.iloc[0, 0] = 99.0
+        self.assertNotEqual(daily_returns(pf).iloc[0, 0], 99.0)
+        # Without copy-on-write (pandas < 3 by default) results are deep copies
+        with mock.patch("stockscope.frame._copy_on_write", return_value=False):
+            deep = daily_returns(pf)
+        self.assertFalse(np.shares_memory(deep.to_numpy(), daily_returns(pf).to_numpy()))
+
+    def test_lru_eviction(self):
+        pf = PriceFrame(self.prices, maxsize=2)
+        for w in (3, 4, 5):
+            sma(pf, w)
+        info = pf.cache_info()
+        self.assertEqual((info.size, info.evictions), (2, 1))
+        sma(pf, 3)
+        self.assertEqual(pf.cache_info().misses, 4)
+
+    def test_append_invalidates(self):
+        pf = PriceFrame(self.prices.iloc[:50])
+        before = daily_returns(pf)
+        pf.append(self.prices.iloc[50:])
+        self.assertEqual(pf.cache_info().size, 0)
+        self.assertEqual(len(daily_returns(pf)), len(before) + 10)
+        with self.assertRaises(InvalidInputError):
+            pf.append(self.prices.iloc[-1:])
+
+    def test_validation(self):
+        with self.assertRaises(InvalidInputError):
+            PriceFrame(pd.DataFrame())
+        with self.assertRaises(InvalidInputError):
+            PriceFrame(self.prices.iloc[::-1])
+        with self.assertRaises(InvalidInputError):
+            PriceFrame(self.prices.reset_index(drop=True))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+import stockscope
+
+SRC = os.path.dirname(os.path.dirname(os.path.abspath(stockscope.__file__)))
+
+
+def _run(code):
+    # A fresh interpreter: modules already imported by the test run must not hide a regression
+    env = dict(os.environ, PYTHONPATH=SRC + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+class TestImports(unittest.TestCase):
+    def test_package_import_is_lightweight(self):
+        loaded = _run("import sys, json, stockscope; print(json.dumps(sorted(sys.modules)))")
+        for heavy in ("pandas", "numpy", "yfinance", "matplotlib"):
+            self.assertNotIn(heavy, loaded)
+
+    def test_heavy_dependencies_load_on_use(self):
+        code = (
+            "import sys, json, stockscope\n"
+            "stockscope.get_prices, stockscope.volatility, stockscope.render_charts\n"
+            "after_lookup = ['yfinance' in sys.modules, 'matplotlib' in sys.modules]\n"
+            "stockscope.plot_price(stockscope.daily_returns(stockscope.get_prices('AAA', '2024-01-01', '2024-02-01',"
+            " provider=stockscope.SyntheticProvider())).iloc[:, 0], show=False)\n"
+            "print(json.dumps(after_lookup + ['yfinance' in sys.modules, 'matplotlib.pyplot' in sys.modules]))"
+        )
+        self.assertEqual(_run(code), [False, False, False, True])
+
+    def test_public_api(self):
+        for name in stockscope.__all__:
+            self.assertTrue(hasattr(stockscope, name), name)
+        self.assertIs(stockscope.get_prices, stockscope.fetch.get_prices)
+        with self.assertRaises(AttributeError):
+            stockscope.not_a_function
+
+
+if __name__ == "__main__":
+    unittest.main()
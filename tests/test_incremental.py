@@ -0,0 +1,69 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from stockscope.exceptions import InvalidInputError
+from stockscope.incremental import IncrementalMetrics
+from stockscope.indicators import daily_returns, ema
+from stockscope.portfolio import buy_and_hold_value
+from stockscope.risk import max_drawdown, volatility
+
+
+class TestIncrementalMetrics(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        idx = pd.bdate_range("2024-01-01", periods=120)
+        values = 100 * np.cumprod(1 + rng.normal(0.0005, 0.02, (120, 3)), axis=0)
+        self.prices = pd.DataFrame(values, index=idx, columns=["AAPL", "MSFT", "SPY"])
+        self.prices.iloc[30:33, 1] = np.nan
+        self.weights = {"AAPL": 0.6, "MSFT": 0.4}
+
+    def _check_against_batch(self, state):
+        snap = state.snapshot()
+        tickers = ["AAPL", "MSFT", "SPY"]
+        np.testing.assert_allclose(snap.loc[tickers, "volatility"], volatility(daily_returns(self.prices)))
+        np.testing.assert_allclose(snap.loc[tickers, "max_drawdown"], max_drawdown(self.prices).min())
+        np.testing.assert_allclose(snap.loc[tickers, "ema"], ema(self.prices, 10).iloc[-1])
+        value = buy_and_hold_value(self.prices.ffill(), self.weights, initial_value=1000)
+        self.assertAlmostEqual(snap.loc["PORTFOLIO", "price"], value.iloc[-1])
+        self.assertAlmostEqual(snap.loc["PORTFOLIO", "max_drawdown"], max_drawdown(value).min())
+        self.assertAlmostEqual(snap.loc["PORTFOLIO", "volatility"], volatility(daily_returns(value)))
+
+    def test_updates_match_batch(self):
+        state = IncrementalMetrics(self.prices.columns, self.weights, ema_span=10, initial_value=1000)
+        state.update(self.prices.iloc[:80])
+        for _, row in self.prices.iloc[80:].iterrows():
+            state.update(row)
+        self.assertEqual(state.count, len(self.prices))
+        self._check_against_batch(state)
+
+    def test_from_history_then_update(self):
+        state = IncrementalMetrics.from_history(self.prices.iloc[:100], self.weights, ema_span=10, initial_value=1000)
+        state.update(self.prices.iloc[100:])
+        self._check_against_batch(state)
+        self.assertEqual(state.last_date, self.prices.index[-1])
+
+    def test_save_and_load(self):
+        state = IncrementalMetrics.from_history(self.prices.iloc[:100], self.weights, ema_span=10, initial_value=1000)
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "state.npz")
+            state.save(path)
+            loaded = IncrementalMetrics.load(path)
+        loaded.update(self.prices.iloc[100:])
+        self._check_against_batch(loaded)
+
+    def test_rejects_bad_rows(self):
+        state = IncrementalMetrics.from_history(self.prices, self.weights)
+        with self.assertRaises(InvalidInputError):
+            state.update(self.prices.iloc[-1])
+        with self.assertRaises(InvalidInputError):
+            state.update(pd.Series({"AAPL": 1.0}, name=pd.Timestamp("2030-01-01")))
+        with self.assertRaises(InvalidInputError):
+            IncrementalMetrics(["AAPL"], {"TSLA": 1.0})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,7 +2,7 @@ import unittest
 import pandas as pd
 import numpy as np
 
-from stockscope.indicators import daily_returns, sma, ema, rsi
+from stockscope.indicators import daily_returns, sma, ema, rsi, compute_indicators
 from stockscope.exceptions import InvalidInputError
 
 
@@ -31,6 +31,38 @@ class TestIndicators(unittest.TestCase):
         with self.assertRaises(InvalidInputError):
             sma(self.s, window=0)
 
+    def test_rsi_frame(self):
+        df = pd.DataFrame({"A": self.s, "B": self.s[::-1].to_numpy()}, index=self.s.index)
+        out = rsi(df, window=2)
+        pd.testing.assert_series_equal(out["A"], rsi(self.s, window=2), check_names=False)
+
+
+class TestComputeIndicators(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(1)
+        idx = pd.date_range("2024-01-01", periods=300, freq="D")
+        self.prices = pd.DataFrame(100 + rng.standard_normal((300, 4)).cumsum(axis=0), index=idx, columns=list("ABCD"))
+        self.prices.iloc[50:55, 2] = np.nan
+
+    def test_matches_single_functions(self):
+        spec = {"sma": [20, 50, 200], "ema": [12, 26], "rsi": [14]}
+        out = compute_indicators(self.prices, spec)
+        for w in spec["sma"]:
+            pd.testing.assert_frame_equal(out[f"SMA_{w}"], sma(self.prices, w), check_names=False, check_freq=False)
+        for w in spec["ema"]:
+            pd.testing.assert_frame_equal(out[f"EMA_{w}"], ema(self.prices, w), check_names=False, check_freq=False)
+        pd.testing.assert_frame_equal(out["RSI_14"], rsi(self.prices, 14), check_names=False, check_freq=False)
+
+    def test_float32_and_series(self):
+        out = compute_indicators(self.prices, dtype="float32")
+        self.assertTrue((out.dtypes == np.float32).all())
+        s_out = compute_indicators(self.prices["A"])
+        self.assertEqual(list(s_out.columns), ["SMA_20", "EMA_12", "RSI_14"])
+
+    def test_invalid_spec(self):
+        with self.assertRaises(InvalidInputError):
+            compute_indicators(self.prices, {"macd": [12]})
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,79 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from stockscope.indicators import rsi
+from stockscope.kernels import ewm_resume, ewm_smooth, smooth, wilder_smooth
+from stockscope.online import OnlineRSI
+from stockscope.exceptions import InvalidInputError
+
+
+def wilder_reference(x, window):
+    out = np.full(len(x), np.nan)
+    seen, total, avg = 0, 0.0, np.nan
+    for i, v in enumerate(x):
+        if not np.isnan(v):
+            if seen < window:
+                total += v
+                seen += 1
+                if seen == window:
+                    avg = total / window
+            else:
+                avg = (avg * (window - 1) + v) / window
+        out[i] = avg
+    return out
+
+
+class TestKernels(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(5)
+        self.values = 100 + rng.standard_normal((200, 64)).cumsum(axis=0)
+        self.values[:3, 5] = np.nan
+        self.values[40:45, 7] = np.nan
+
+    def test_ewm_matches_pandas(self):
+        for ignore_na in (False, True):
+            expected = pd.DataFrame(self.values).ewm(alpha=0.2, adjust=False, ignore_na=ignore_na).mean().to_numpy()
+            np.testing.assert_allclose(ewm_smooth(self.values, 0.2, ignore_na=ignore_na), expected, rtol=1e-12)
+            np.testing.assert_allclose(ewm_smooth(self.values[:, :3], 0.2, ignore_na=ignore_na), expected[:, :3], rtol=1e-12)
+
+    def test_ewm_resumed_in_pieces(self):
+        values = self.values.copy()
+        values[30:120, 9] = np.nan  # gap spanning several pieces
+        values[:150, 11] = np.nan  # starts late
+        for alpha in (0.2, 0.5, 0.01, 1.0):
+            for ignore_na in (False, True):
+                expected = ewm_smooth(values, alpha, ignore_na=ignore_na)
+                state = []
+                pieces = [ewm_resume(values[lo : lo + 25], alpha, state, ignore_na=ignore_na) for lo in range(0, 200, 25)]
+                np.testing.assert_allclose(np.vstack(pieces), expected, rtol=1e-12)
+
+    def test_wilder_matches_reference(self):
+        out = wilder_smooth(self.values, 14)
+        for j in (0, 5, 7):
+            np.testing.assert_allclose(out[:, j], wilder_reference(self.values[:, j], 14), rtol=1e-12)
+        narrow = wilder_smooth(self.values[:, 7], 14)[:, 0]
+        np.testing.assert_allclose(narrow, out[:, 7], rtol=1e-12)
+
+    def test_simple_matches_pandas_rolling(self):
+        expected = pd.DataFrame(self.values).rolling(10).mean().to_numpy()
+        np.testing.assert_allclose(smooth(self.values, 10, "simple"), expected, rtol=1e-9)
+
+    def test_rsi_wilder(self):
+        frame = pd.DataFrame(self.values)
+        out = rsi(frame, 14, method="wilder")
+        valid = out.to_numpy()[~np.isnan(out.to_numpy())]
+        self.assertTrue(((valid >= 0) & (valid <= 100)).all())
+        pd.testing.assert_series_equal(out[3], rsi(frame[3], 14, method="wilder"), check_names=False)
+        online = OnlineRSI.from_history(frame.iloc[:150], 14, method="wilder")
+        live = np.array([online.update(row) for row in self.values[150:]])
+        np.testing.assert_allclose(live, out.iloc[150:].to_numpy(), rtol=1e-10)
+
+    def test_invalid_method(self):
+        with self.assertRaises(InvalidInputError):
+            smooth(self.values, 10, "hull")
+
+
+if __name__ == "__main__":
+    unittest.main()
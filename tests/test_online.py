@@ -0,0 +1,58 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from stockscope.indicators import sma, ema, rsi
+from stockscope.online import OnlineSMA, OnlineEMA, OnlineRSI, _OnlineIndicator
+from stockscope.exceptions import InvalidInputError
+
+
+class TestOnline(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        idx = pd.date_range("2024-01-01", periods=60, freq="D")
+        self.prices = pd.DataFrame(100 + rng.standard_normal((60, 3)).cumsum(axis=0), index=idx, columns=["A", "B", "C"])
+        self.prices.iloc[10:13, 1] = np.nan
+
+    def replay(self, ind, frame):
+        return pd.DataFrame([ind.update(row) for _, row in frame.iterrows()], index=frame.index)
+
+    def test_sma_matches_batch(self):
+        out = self.replay(OnlineSMA(5), self.prices)
+        pd.testing.assert_frame_equal(out, sma(self.prices, 5), check_freq=False)
+
+    def test_ema_matches_batch_with_gaps(self):
+        out = self.replay(OnlineEMA(10), self.prices)
+        pd.testing.assert_frame_equal(out, ema(self.prices, 10), check_freq=False)
+
+    def test_rsi_matches_batch(self):
+        ind = OnlineRSI(14)
+        out = pd.Series([ind.update(v) for v in self.prices["A"]], index=self.prices.index)
+        pd.testing.assert_series_equal(out, rsi(self.prices["A"], 14), check_names=False, check_freq=False)
+
+    def test_seeded_from_history(self):
+        hist, live = self.prices.iloc[:40], self.prices.iloc[40:]
+        for cls, batch, w in [(OnlineSMA, sma, 5), (OnlineEMA, ema, 10), (OnlineRSI, None, 14)]:
+            ind = cls.from_history(hist, w)
+            out = self.replay(ind, live)
+            if batch is None:
+                expected = pd.DataFrame({c: rsi(self.prices[c], w) for c in self.prices}).iloc[40:]
+            else:
+                expected = batch(self.prices, w).iloc[40:]
+            np.testing.assert_allclose(out.to_numpy(), expected.to_numpy(), rtol=1e-10)
+
+    def test_scalar_and_shape_checks(self):
+        ind = OnlineSMA(2)
+        self.assertTrue(np.isnan(ind.update(1.0)))
+        self.assertEqual(ind.update(3.0), 2.0)
+        with self.assertRaises(InvalidInputError):
+            ind.update([1.0, 2.0])
+        with self.assertRaises(InvalidInputError):
+            OnlineEMA(0)
+        with self.assertRaises(TypeError):
+            type("NoStep", (_OnlineIndicator,), {"_init_state": lambda self, n: None})()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from stockscope.exceptions import InvalidInputError
+from stockscope.optimize import efficient_frontier, max_sharpe, min_variance, risk_parity
+from stockscope.portfolio import buy_and_hold_value, portfolio_returns
+
+
+class TestOptimize(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        tickers = ["AAPL", "MSFT", "SPY", "TLT", "GLD"]
+        n = len(tickers)
+        c = 0.0004 * (0.5 * np.eye(n) + 0.5 * np.ones((n, n))) + np.diag(rng.uniform(1e-5, 5e-5, n))
+        self.c = c
+        self.cov = pd.DataFrame(c, index=tickers, columns=tickers)
+        self.mu = pd.Series([0.0005, 0.0006, 0.0004, 0.0007, 0.0005], index=tickers)
+        idx = pd.bdate_range("2024-01-01", periods=250)
+        self.rets = pd.DataFrame(rng.multivariate_normal(self.mu, c, 250), index=idx, columns=tickers)
+
+    def test_min_variance_matches_closed_form(self):
+        w = min_variance(cov=self.cov)
+        inv = np.linalg.solve(self.c, np.ones(len(self.c)))
+        np.testing.assert_allclose(list(w.values()), inv / inv.sum(), atol=1e-10)
+
+    def test_max_sharpe_is_long_only_optimum(self):
+        w = max_sharpe(cov=self.cov, expected_returns=self.mu)
+        wv = np.array(list(w.values()))
+        self.assertTrue((wv >= 0).all())
+        self.assertAlmostEqual(wv.sum(), 1.0)
+        best = wv @ self.mu.to_numpy() / np.sqrt(wv @ self.c @ wv)
+        # No random long-only portfolio does better
+        samples = np.random.default_rng(1).dirichlet(np.full(len(wv), 0.5), 20_000)
+        sharpe = samples @ self.mu.to_numpy() / np.sqrt(np.einsum("kn,kn->k", samples @ self.c, samples))
+        self.assertGreaterEqual(best, sharpe.max())
+
+    def test_risk_parity_equalizes_contributions(self):
+        w = risk_parity(cov=self.cov)
+        wv = np.array(list(w.values()))
+        contrib = wv * (self.c @ wv)
+        np.testing.assert_allclose(contrib / contrib.sum(), 0.2, atol=1e-10)
+        budgets = {"AAPL": 2, "MSFT": 1, "SPY": 1, "TLT": 1, "GLD": 1}
+        wv = np.array(list(risk_parity(cov=self.cov, budgets=budgets).values()))
+        contrib = wv * (self.c @ wv)
+        self.assertAlmostEqual(contrib[0] / contrib.sum(), 2 / 6)
+
+    def test_frontier_is_monotone(self):
+        f = efficient_frontier(cov=self.cov, expected_returns=self.mu, n_points=10)
+        self.assertEqual(f.weights.shape, (10, 5))
+        self.assertTrue((np.diff(f.expected_return) >= -1e-15).all())
+        self.assertTrue((np.diff(f.volatility) >= -1e-15).all())
+        mv = min_variance(cov=self.cov)
+        np.testing.assert_allclose(f.weights.iloc[0], list(mv.values()), atol=1e-10)
+        self.assertAlmostEqual(f.expected_return.iloc[-1], self.mu.max())
+
+    def test_output_feeds_portfolio_functions(self):
+        w = min_variance(self.rets)
+        self.assertEqual(len(portfolio_returns(self.rets, w)), len(self.rets))
+        prices = 100 * (1 + self.rets).cumprod()
+        self.assertEqual(len(buy_and_hold_value(prices, max_sharpe(self.rets))), len(prices))
+        with self.assertRaises(InvalidInputError):
+            min_variance()
+        with self.assertRaises(InvalidInputError):
+            max_sharpe(cov=self.cov)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from stockscope.exceptions import InvalidInputError
+from stockscope.fetch import get_prices
+from stockscope.frame import PriceFrame
+from stockscope.indicators import daily_returns, ema, rsi, sma
+from stockscope.options import get_option, option_context, reset_option, set_option
+from stockscope.portfolio import buy_and_hold_value, portfolio_returns
+from stockscope.providers import SyntheticProvider
+from stockscope.risk import max_drawdown, volatility
+
+
+class TestOptions(unittest.TestCase):
+    def setUp(self):
+        self.provider = SyntheticProvider(seed=4)
+        self.weights = {"AAA": 0.5, "BBB": 0.3, "CCC": 0.2}
+
+    def _prices(self):
+        return get_prices(list(self.weights), "2023-01-01", "2024-01-01", provider=self.provider)
+
+    def test_float32_mode_matches_float64(self):
+        prices64 = self._prices()
+        with option_context(dtype="float32"):
+            prices = self._prices()
+            rets = daily_returns(prices)
+            results = {
+                "sma": (sma(prices, 20), sma(prices64, 20), 1e-6, 0),
+                "ema": (ema(prices, 12), ema(prices64, 12), 1e-6, 0),
+                "rsi": (rsi(prices, 14), rsi(prices64, 14), 0, 1e-3),
+                "returns": (rets, daily_returns(prices64), 0, 1e-6),
+                "drawdown": (max_drawdown(prices), max_drawdown(prices64), 0, 1e-6),
+                "port": (portfolio_returns(rets, self.weights), portfolio_returns(daily_returns(prices64), self.weights), 0, 1e-6),
+                "value": (buy_and_hold_value(prices, self.weights), buy_and_hold_value(prices64, self.weights), 1e-6, 0),
+            }
+            vol = volatility(rets)
+        self.assertEqual(prices.dtypes.unique().tolist(), [np.float32])
+        for name, (low, full, rtol, atol) in results.items():
+            self.assertEqual(np.asarray(low).dtype, np.float32, name)
+            np.testing.assert_allclose(np.asarray(low, dtype=float), np.asarray(full), rtol=rtol, atol=atol, err_msg=name)
+        self.assertEqual(vol.dtype, np.float64)
+        np.testing.assert_allclose(vol, volatility(daily_returns(prices64)), rtol=1e-5)
+        self.assertEqual(get_option("dtype"), "float64")
+
+    def test_price_frame_cache_follows_dtype(self):
+        frame = PriceFrame(self._prices())
+        self.assertEqual(daily_returns(frame).dtypes.iloc[0], np.float64)
+        with option_context(dtype="float32"):
+            self.assertEqual(daily_returns(frame).dtypes.iloc[0], np.float32)
+
+    def test_set_and_reset(self):
+        set_option("dtype", np.float32)
+        try:
+            self.assertEqual(get_option("dtype"), "float32")
+        finally:
+            reset_option("dtype")
+        self.assertEqual(get_option("dtype"), "float64")
+        with self.assertRaises(InvalidInputError):
+            set_option("dtype", "int64")
+        with self.assertRaises(InvalidInputError):
+            get_option("precision")
+
+    def test_inputs_not_modified(self):
+        prices = self._prices()
+        before = prices.copy()
+        buy_and_hold_value(prices, self.weights)
+        rets = daily_returns(prices)
+        portfolio_returns(rets, self.weights)
+        pd.testing.assert_frame_equal(prices, before)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,44 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from stockscope.fetch import get_ohlcv, get_prices
+from stockscope.panel import OHLCVPanel
+from stockscope.providers import SyntheticProvider
+from stockscope.exceptions import InvalidInputError
+
+
+class TestPanel(unittest.TestCase):
+    def setUp(self):
+        self.provider = SyntheticProvider(seed=1)
+        self.panel = get_ohlcv(["AAPL", "MSFT"], "2024-01-01", "2024-02-01", provider=self.provider)
+
+    def test_single_download(self):
+        self.assertEqual(self.provider.calls, 1)
+        self.assertEqual(self.panel.shape, (6, len(self.panel.index), 2))
+        self.assertTrue(self.panel.values.flags["C_CONTIGUOUS"])
+
+    def test_field_views_are_zero_copy(self):
+        close = self.panel.field("Close")
+        self.assertTrue(np.shares_memory(close.to_numpy(), self.panel.values))
+        self.assertEqual(list(close.columns), ["AAPL", "MSFT"])
+
+    def test_prices_match_get_prices(self):
+        expected = get_prices(["AAPL", "MSFT"], "2024-01-01", "2024-02-01", price_field="Volume", provider=self.provider)
+        pd.testing.assert_frame_equal(self.panel.prices("Volume"), expected, check_freq=False)
+
+    def test_from_frames_aligns_indexes(self):
+        a = pd.DataFrame({"X": [1.0, 2.0]}, index=pd.to_datetime(["2024-01-01", "2024-01-02"]))
+        b = pd.DataFrame({"X": [5.0]}, index=pd.to_datetime(["2024-01-03"]))
+        panel = OHLCVPanel.from_frames({"Close": a, "Volume": b})
+        self.assertEqual(len(panel.index), 3)
+        self.assertTrue(np.isnan(panel.field("Volume").iloc[0, 0]))
+
+    def test_unknown_field(self):
+        with self.assertRaises(InvalidInputError):
+            self.panel.field("Bid")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import time
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from stockscope.exceptions import InvalidInputError
+from stockscope.indicators import daily_returns
+from stockscope.pipeline import Pipeline
+from stockscope.portfolio import portfolio_returns
+from stockscope.risk import max_drawdown, value_at_risk, volatility
+
+
+CALLS = []
+
+
+def load_prices(tickers, periods=80):
+    CALLS.append(tuple(tickers))
+    idx = pd.bdate_range("2024-01-01", periods=periods)
+    values = 100 * np.cumprod(1 + np.random.default_rng(0).normal(0, 0.01, (periods, len(tickers))), axis=0)
+    return pd.DataFrame(values, index=idx, columns=list(tickers))
+
+
+def slow(x, seconds):
+    time.sleep(seconds)
+    return x
+
+
+def fail(x):
+    raise InvalidInputError("boom")
+
+
+class TestPipeline(unittest.TestCase):
+    def setUp(self):
+        CALLS.clear()
+
+    def _report(self, p, weights):
+        prices = p.add(load_prices, ["AAPL", "MSFT"])
+        rets = p.add(daily_returns, prices)
+        return {
+            "vol": p.add(volatility, rets),
+            "var": p.add(value_at_risk, p.select(rets, "AAPL")),
+            "port": p.add(portfolio_returns, rets, weights),
+            "dd": p.add(max_drawdown, prices),
+        }
+
+    def test_shared_nodes_run_once(self):
+        p = Pipeline()
+        a = self._report(p, {"AAPL": 0.5, "MSFT": 0.5})
+        b = self._report(p, {"AAPL": 0.8, "MSFT": 0.2})
+        self.assertIs(a["vol"], b["vol"])
+        self.assertIsNot(a["port"], b["port"])
+        result = p.run(max_workers=4)
+        self.assertEqual(CALLS, [("AAPL", "MSFT")])
+        self.assertEqual(len(result.executed), len(p))
+        self.assertEqual(set(result.timings), set(result.values))
+
+        prices = load_prices(["AAPL", "MSFT"])
+        pd.testing.assert_series_equal(result[a["vol"]], volatility(daily_returns(prices)))
+        self.assertAlmostEqual(result[b["var"]], value_at_risk(daily_returns(prices)["AAPL"]))
+
+    def test_targets_run_only_ancestors(self):
+        p = Pipeline()
+        nodes = self._report(p, {"AAPL": 1.0})
+        result = p.run(targets=[nodes["dd"]], executor=None)
+        self.assertEqual(result.executed, ["load_prices", "max_drawdown"])
+
+    def test_independent_branches_run_in_parallel(self):
+        p = Pipeline()
+        src = p.source(1, "x")
+        nodes = [p.add(slow, src, 0.2 + i * 1e-3) for i in range(4)]
+        result = p.run(targets=nodes, max_workers=4)
+        self.assertLess(result.wall_time, 0.6)
+        self.assertEqual(result[nodes[0]], 1)
+
+    def test_errors(self):
+        p = Pipeline()
+        bad = p.add(fail, p.source(1, "x"))
+        with self.assertRaises(InvalidInputError):
+            p.run()
+        with self.assertRaises(InvalidInputError):
+            p.run(targets=["missing"])
+        with self.assertRaises(InvalidInputError):
+            Pipeline().add(volatility, bad)
+
+
+if __name__ == "__main__":
+    unittest.main()
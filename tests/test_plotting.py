@@ -0,0 +1,70 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from stockscope.exceptions import InvalidInputError
+from stockscope.plotting import downsample, render_charts
+
+
+class TestPlotting(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(2)
+        idx = pd.date_range("2024-01-02 09:30", periods=5000, freq="min")
+        values = 100 * np.cumprod(1 + rng.normal(0, 1e-3, (5000, 3)), axis=0)
+        self.prices = pd.DataFrame(values, index=idx, columns=["AAPL", "MSFT", "BRK/B"])
+        self.prices.iloc[100:200, 1] = np.nan
+
+    def test_downsample_keeps_shape(self):
+        s = self.prices["AAPL"]
+        thin = downsample(s, 400, method="minmax")
+        self.assertLessEqual(len(thin), 402)
+        self.assertEqual(thin.max(), s.max())
+        self.assertEqual(thin.min(), s.min())
+        self.assertEqual((thin.index[0], thin.index[-1]), (s.index[0], s.index[-1]))
+        lttb = downsample(s, 400, method="lttb")
+        self.assertEqual(len(lttb), 400)
+        self.assertTrue(lttb.index.is_monotonic_increasing)
+        self.assertEqual(len(downsample(s.iloc[:50], 400)), 50)
+        self.assertFalse(downsample(self.prices["MSFT"], 400).isna().any())
+
+    def test_render_charts_writes_files(self):
+        with tempfile.TemporaryDirectory() as d:
+            for kind in ("price", "sma", "drawdown"):
+                paths = render_charts(self.prices, d, kind=kind, figsize=(4, 2), dpi=50)
+                self.assertEqual(list(paths), list(self.prices.columns))
+                for path in paths.values():
+                    self.assertTrue(os.path.getsize(path) > 0)
+            self.assertTrue(paths["BRK/B"].endswith("BRK_B_drawdown.png"))
+            self.assertEqual(len(os.listdir(d)), 9)
+
+    def test_render_charts_unique_file_names(self):
+        prices = pd.concat([self.prices["BRK/B"].rename("BRK:B"), self.prices, self.prices["AAPL"].rename("BRK_B")], axis=1)
+        with tempfile.TemporaryDirectory() as d:
+            paths = render_charts(prices, d, figsize=(4, 2), dpi=50)
+            self.assertEqual(len(set(paths.values())), 5)
+            self.assertEqual(len(os.listdir(d)), 5)
+            self.assertTrue(paths["BRK_B"].endswith("BRK_B_price.png"))
+            self.assertRegex(paths["BRK/B"], r"BRK_B_[0-9a-f]{8}_price\.png$")
+
+    def test_render_charts_process_pool(self):
+        with tempfile.TemporaryDirectory() as d:
+            paths = render_charts(self.prices, d, kind="sma", n_jobs=2, downsample="lttb", figsize=(4, 2), dpi=50)
+            self.assertTrue(all(os.path.exists(p) for p in paths.values()))
+
+    def test_invalid_input(self):
+        with tempfile.TemporaryDirectory() as d:
+            with self.assertRaises(InvalidInputError):
+                render_charts(self.prices, d, kind="candles")
+            with self.assertRaises(InvalidInputError):
+                render_charts(self.prices, d, tickers=["TSLA"])
+            with self.assertRaises(InvalidInputError):
+                render_charts(self.prices, d, downsample="mean")
+        with self.assertRaises(InvalidInputError):
+            downsample(self.prices["AAPL"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,15 @@
 import unittest
+import numpy as np
 import pandas as pd
 
-from stockscope.portfolio import normalize_weights, buy_and_hold_value, portfolio_returns
+from stockscope.portfolio import (
+    normalize_weights,
+    buy_and_hold_value,
+    portfolio_returns,
+    normalize_weight_matrix,
+    evaluate_portfolios,
+)
+from stockscope.risk import value_at_risk, volatility
 from stockscope.exceptions import InvalidInputError
 
 
@@ -34,5 +42,50 @@ class TestPortfolio(unittest.TestCase):
             buy_and_hold_value(self.prices, w, 1000)
 
 
+class TestEvaluatePortfolios(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(1)
+        idx = pd.bdate_range("2024-01-01", periods=60)
+        self.rets = pd.DataFrame(rng.normal(0, 0.01, (60, 3)), index=idx, columns=["AAPL", "MSFT", "SPY"])
+        self.rets.iloc[0] = np.nan
+
+    def test_normalize_weight_matrix(self):
+        w = normalize_weight_matrix([{"aapl": 2, "msft": 2}, {"SPY": 1}])
+        self.assertEqual(list(w.columns), ["AAPL", "MSFT", "SPY"])
+        np.testing.assert_allclose(w.sum(axis=1), 1.0)
+        self.assertEqual(w.loc[1, "AAPL"], 0.0)
+        with self.assertRaises(InvalidInputError):
+            normalize_weight_matrix(np.array([[1.0, -1.0]]), tickers=["A", "B"])
+        with self.assertRaises(InvalidInputError):
+            normalize_weight_matrix(np.array([[0.0, 0.0]]), tickers=["A", "B"])
+        merged = normalize_weight_matrix(pd.DataFrame({"aapl": [1.0], "AAPL": [1.0], "msft": [2.0]}))
+        self.assertEqual(list(merged.columns), ["AAPL", "MSFT"])
+        np.testing.assert_allclose(merged.iloc[0], [0.5, 0.5])
+
+    def test_matches_single_portfolio_functions(self):
+        weights = np.random.default_rng(2).random((10, 3))
+        stats = evaluate_portfolios(self.rets, weights, initial_value=1000, chunk_size=3)
+        self.assertEqual(len(stats), 10)
+        for k, row in enumerate(weights):
+            pr = portfolio_returns(self.rets, dict(zip(self.rets.columns, row)))
+            self.assertAlmostEqual(stats["volatility"].iloc[k], volatility(pr))
+            self.assertAlmostEqual(stats["var"].iloc[k], value_at_risk(pr))
+            self.assertAlmostEqual(stats["final_value"].iloc[k], 1000 * (1 + pr.dropna()).prod())
+
+    def test_gaps_only_drop_rows_for_holders(self):
+        rets = self.rets.copy()
+        rets.iloc[10:20, 2] = np.nan
+        stats = evaluate_portfolios(rets, [{"AAPL": 0.5, "MSFT": 0.5}, {"AAPL": 0.5, "SPY": 0.5}])
+        for k, w in enumerate([{"AAPL": 0.5, "MSFT": 0.5}, {"AAPL": 0.5, "SPY": 0.5}]):
+            pr = portfolio_returns(rets, w).dropna()
+            self.assertEqual(len(pr), 59 if k == 0 else 49)
+            self.assertAlmostEqual(stats["volatility"].iloc[k], volatility(pr))
+            self.assertAlmostEqual(stats["final_value"].iloc[k], 10_000 * (1 + pr).prod())
+
+    def test_missing_ticker(self):
+        with self.assertRaises(InvalidInputError):
+            evaluate_portfolios(self.rets, pd.DataFrame({"TSLA": [1.0]}))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,82 @@
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from stockscope.fetch import get_prices
+from stockscope.providers import LocalFileProvider, PriceProvider, SyntheticProvider, YFinanceProvider, write_local_mirror
+from stockscope.exceptions import EmptyDataError, InvalidInputError
+
+
+class TestProviders(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.synthetic = SyntheticProvider(seed=7)
+        self.frames = self.synthetic.fetch(
+            ["AAPL", "MSFT"], pd.Timestamp("2024-01-01"), pd.Timestamp("2024-03-01"), "1d",
+            ["Close", "Adj Close", "Volume"],
+        )
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_synthetic_deterministic(self):
+        a = get_prices(["AAPL", "MSFT"], "2024-01-01", "2024-02-01", provider=self.synthetic)
+        b = get_prices(["MSFT"], "2024-01-01", "2024-02-01", provider=self.synthetic)
+        self.assertEqual(list(a.columns), ["AAPL", "MSFT"])
+        pd.testing.assert_series_equal(a["MSFT"], b["MSFT"])
+
+    def test_local_csv_and_parquet(self):
+        for fmt in ("csv", "parquet"):
+            root = f"{self.tmp.name}/{fmt}"
+            write_local_mirror(self.frames, root, fmt=fmt)
+            provider = LocalFileProvider(root)
+            out = get_prices(["AAPL", "MSFT"], "2024-01-10", "2024-02-01", price_field="Close", provider=provider)
+            expected = self.frames["Close"].loc["2024-01-10":"2024-01-31"]
+            np.testing.assert_allclose(out.to_numpy(), expected.to_numpy())
+            self.assertGreaterEqual(out.index.min(), pd.Timestamp("2024-01-10"))
+
+    def test_local_parquet_with_date_column(self):
+        df = pd.DataFrame({f: self.frames[f]["AAPL"] for f in self.frames}).rename_axis("Date").reset_index()
+        df.to_parquet(f"{self.tmp.name}/AAPL.parquet", index=False)
+        out = get_prices("AAPL", "2024-01-10", "2024-02-01", price_field="Close", provider=LocalFileProvider(self.tmp.name))
+        pd.testing.assert_series_equal(
+            out["AAPL"], self.frames["Close"]["AAPL"].loc["2024-01-10":"2024-01-31"], check_names=False, check_freq=False
+        )
+
+    def test_local_projection(self):
+        write_local_mirror(self.frames, self.tmp.name, fmt="csv")
+        frames = LocalFileProvider(self.tmp.name).fetch(["AAPL"], None, None, "1d", ["Volume"])
+        self.assertEqual(list(frames), ["Volume"])
+
+    def test_local_missing_files(self):
+        with self.assertRaises(EmptyDataError):
+            get_prices("ZZZZ", provider=LocalFileProvider(self.tmp.name))
+
+    def test_yfinance_multiindex_layout(self):
+        idx = pd.date_range("2024-01-01", periods=3)
+        raw = pd.concat({t: self.frames["Close"][[t]].iloc[:3].set_axis(["Adj Close"], axis=1).set_axis(idx)
+                         for t in ["AAPL", "MSFT"]}, axis=1)
+        with mock.patch("stockscope.providers.yf.download", return_value=raw):
+            out = get_prices(["AAPL", "MSFT"], provider=YFinanceProvider())
+        self.assertEqual(out.shape, (3, 2))
+
+    def test_yfinance_module_can_be_patched(self):
+        raw = self.frames["Close"][["AAPL"]].iloc[:3].set_axis(["Adj Close"], axis=1)
+        with mock.patch("stockscope.providers.yf") as yf:
+            yf.download.return_value = raw
+            out = get_prices("AAPL", provider=YFinanceProvider())
+        yf.download.assert_called_once()
+        self.assertEqual(out.shape, (3, 1))
+
+    def test_invalid_fmt(self):
+        with self.assertRaises(InvalidInputError):
+            LocalFileProvider(self.tmp.name, fmt="xlsx")
+        with self.assertRaises(TypeError):
+            type("NoFetch", (PriceProvider,), {})()
+
+
+if __name__ == "__main__":
+    unittest.main()
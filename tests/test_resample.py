@@ -0,0 +1,68 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from stockscope.fetch import get_ohlcv, get_prices
+from stockscope.providers import SyntheticProvider
+from stockscope.resample import resample_ohlcv
+from stockscope.exceptions import InvalidInputError
+
+
+class WindowedProvider(SyntheticProvider):
+    max_request_span = {"1m": pd.Timedelta(days=1)}
+
+
+class TestResample(unittest.TestCase):
+    def setUp(self):
+        self.panel = get_ohlcv(["AAPL", "MSFT"], "2024-01-02", "2024-01-04", interval="1m",
+                               provider=SyntheticProvider(seed=2))
+        close = self.panel.values[self.panel.fields.index("Close")]
+        close[5:9, 0] = np.nan
+
+    def test_matches_pandas_resample(self):
+        out = resample_ohlcv(self.panel, "15m", session=("09:30", "16:00"))
+        for f, how in [("Open", "first"), ("High", "max"), ("Low", "min"), ("Close", "last"), ("Volume", "sum")]:
+            src = self.panel.field(f)
+            expected = src.resample("15min", origin="start_day", offset="30min").agg(how)
+            expected = expected.loc[out.index]
+            np.testing.assert_allclose(out.field(f).to_numpy(), expected.to_numpy())
+
+    def test_daily_bars(self):
+        out = resample_ohlcv(self.panel, "1d")
+        self.assertEqual(len(out.index), 2)
+        close = self.panel.field("Close")
+        self.assertEqual(out.field("Close").iloc[0, 0], close.loc["2024-01-02"].iloc[-1, 0])
+        self.assertEqual(out.field("Volume").iloc[1, 1], self.panel.field("Volume").loc["2024-01-03", "MSFT"].sum())
+
+    def test_timezone_and_dict_input(self):
+        frames = {f: self.panel.field(f) for f in ("Close", "Volume")}
+        out = resample_ohlcv(frames, "1h", tz="America/New_York")
+        self.assertEqual(str(out["Close"].index.tz), "America/New_York")
+
+    def test_session_follows_local_clock_on_dst_days(self):
+        for day in ("2024-03-10", "2024-11-03"):
+            idx = pd.date_range(f"{day} 08:00", f"{day} 17:00", freq="1min", tz="America/New_York", inclusive="left")
+            close = pd.DataFrame({"AAPL": np.arange(len(idx), dtype=float)}, index=idx)
+            out = resample_ohlcv({"Close": close, "Volume": close * 0 + 1}, "1h", session=("09:30", "16:00"))
+            expected = pd.date_range(f"{day} 09:30", f"{day} 15:30", freq="1h", tz="America/New_York")
+            pd.testing.assert_index_equal(out["Close"].index, expected, check_exact=True, exact=False)
+            self.assertEqual(out["Volume"]["AAPL"].tolist(), [60.0] * 6 + [30.0])
+            self.assertEqual(out["Close"]["AAPL"].iloc[0], close.loc[f"{day} 10:29", "AAPL"])
+
+    def test_invalid_rule(self):
+        with self.assertRaises(InvalidInputError):
+            resample_ohlcv(self.panel, "fortnight")
+
+
+class TestWindowedFetch(unittest.TestCase):
+    def test_long_intraday_range_is_split_and_stitched(self):
+        provider = WindowedProvider(seed=2)
+        out = get_prices("AAPL", "2024-01-02", "2024-01-06", interval="1m", provider=provider)
+        self.assertEqual(provider.calls, 4)
+        self.assertTrue(out.index.is_unique and out.index.is_monotonic_increasing)
+        self.assertEqual(len(out), 4 * 390)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,7 +2,7 @@ import unittest
 import pandas as pd
 import numpy as np
 
-from stockscope.risk import volatility, max_drawdown, value_at_risk
+from stockscope.risk import volatility, max_drawdown, value_at_risk, drawdown_stats, drawdown_episodes
 from stockscope.exceptions import InvalidInputError
 
 
@@ -29,6 +29,28 @@ class TestRisk(unittest.TestCase):
         with self.assertRaises(InvalidInputError):
             value_at_risk(self.rets, level=1.5)
 
+    def test_drawdown_frame(self):
+        frame = pd.DataFrame({"A": self.prices, "B": self.prices[::-1].to_numpy()}, index=self.prices.index)
+        dd = max_drawdown(frame)
+        pd.testing.assert_series_equal(dd["A"], max_drawdown(self.prices), check_names=False)
+
+    def test_drawdown_stats(self):
+        frame = pd.DataFrame({"A": self.prices, "FLAT": 100.0}, index=self.prices.index)
+        stats = drawdown_stats(frame)
+        self.assertAlmostEqual(stats.loc["A", "max_drawdown"], 90 / 120 - 1)
+        self.assertEqual(stats.loc["A", "peak"], self.prices.index[3])
+        self.assertEqual(stats.loc["A", "trough"], self.prices.index[4])
+        self.assertTrue(pd.isna(stats.loc["A", "recovery"]))
+        self.assertEqual(stats.loc["FLAT", "max_drawdown"], 0.0)
+
+    def test_drawdown_episodes(self):
+        prices = pd.Series([100, 90, 101, 80, 102, 99], index=self.prices.index, name="X")
+        ep = drawdown_episodes(prices, top_n=2)
+        self.assertEqual(list(ep["rank"]), [1, 2])
+        self.assertAlmostEqual(ep.loc[0, "depth"], 80 / 101 - 1)
+        self.assertEqual(ep.loc[0, "recovery"], prices.index[4])
+        self.assertEqual(ep.loc[0, "duration"], pd.Timedelta(days=2))
+
 
 if __name__ == "__main__":
     unittest.main()
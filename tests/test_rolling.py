@@ -0,0 +1,52 @@
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from stockscope.risk import volatility, value_at_risk, drawdown_stats
+from stockscope.rolling import rolling_volatility, rolling_value_at_risk, rolling_drawdown, rolling_max_drawdown
+from stockscope.exceptions import InvalidInputError
+
+
+class TestRolling(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(11)
+        idx = pd.date_range("2024-01-01", periods=120, freq="D")
+        self.prices = pd.DataFrame(100 * np.exp(0.02 * rng.standard_normal((120, 3)).cumsum(axis=0)),
+                                   index=idx, columns=["A", "B", "C"])
+        self.rets = self.prices.pct_change()
+
+    def test_rolling_volatility_matches_full_sample(self):
+        out = rolling_volatility(self.rets, window=30)
+        self.assertTrue(out.index.equals(self.rets.index))
+        window = self.rets.iloc[60:90]
+        np.testing.assert_allclose(out.iloc[89].to_numpy(), volatility(window).to_numpy(), rtol=1e-9)
+
+    def test_rolling_var_matches_value_at_risk(self):
+        out = rolling_value_at_risk(self.rets["A"], window=40, level=0.05)
+        self.assertTrue(np.isnan(out.iloc[39]))
+        for t in (40, 77, 119):
+            self.assertAlmostEqual(out.iloc[t], value_at_risk(self.rets["A"].iloc[t - 39 : t + 1], 0.05), places=12)
+
+    def test_rolling_drawdowns(self):
+        dd = rolling_drawdown(self.prices, window=20)
+        self.assertTrue((dd.dropna() <= 0).all().all())
+        mdd = rolling_max_drawdown(self.prices, window=20)
+        for t in (19, 55, 119):
+            expected = drawdown_stats(self.prices.iloc[t - 19 : t + 1])["max_drawdown"]
+            np.testing.assert_allclose(mdd.iloc[t].to_numpy(), expected.to_numpy(), rtol=1e-12)
+        self.assertTrue(mdd.iloc[:19].isna().all().all())
+        # Tiny blocks (split over rows and columns) give the same result
+        with mock.patch("stockscope.rolling._MDD_BLOCK_ELEMENTS", 50):
+            pd.testing.assert_frame_equal(rolling_max_drawdown(self.prices, window=20), mdd)
+
+    def test_invalid_window(self):
+        with self.assertRaises(InvalidInputError):
+            rolling_volatility(self.rets, window=1)
+        with self.assertRaises(InvalidInputError):
+            rolling_value_at_risk(self.rets, window=10, min_periods=20)
+
+
+if __name__ == "__main__":
+    unittest.main()
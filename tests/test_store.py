@@ -0,0 +1,84 @@
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from stockscope.exceptions import InvalidInputError
+from stockscope.options import option_context
+from stockscope.store import PriceStore
+
+
+class TestPriceStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = f"{self.tmp.name}/prices"
+        idx = pd.bdate_range("2024-01-01", periods=60)
+        values = np.random.default_rng(0).uniform(50, 150, (60, 4))
+        self.prices = pd.DataFrame(values, index=idx, columns=["AAPL", "MSFT", "NVDA", "SPY"])
+        self.prices.iloc[5, 2] = np.nan
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_round_trip_and_views(self):
+        store = PriceStore.create(self.path, self.prices)
+        reopened = PriceStore(self.path)
+        pd.testing.assert_frame_equal(reopened.frame(), self.prices, check_freq=False)
+
+        window = reopened.frame("2024-01-10", "2024-01-31", tickers=["MSFT", "NVDA"])
+        pd.testing.assert_frame_equal(window, self.prices.loc["2024-01-10":"2024-01-31", ["MSFT", "NVDA"]], check_freq=False)
+        self.assertTrue(np.shares_memory(window.to_numpy(), reopened.values))
+        self.assertTrue(np.shares_memory(reopened.ticker("spy").to_numpy(), reopened.values))
+        self.assertFalse(reopened.values.flags.writeable)
+        self.assertEqual(store.shape, (60, 4))
+
+    def test_append_and_refresh(self):
+        writer = PriceStore.create(self.path, self.prices.iloc[:40])
+        reader = PriceStore(self.path)
+        writer.append(self.prices.iloc[40:].drop(columns="SPY"))
+        self.assertEqual(len(reader), 40)
+        reader.refresh()
+        expected = self.prices.copy()
+        expected.iloc[40:, 3] = np.nan
+        pd.testing.assert_frame_equal(reader.frame(), expected, check_freq=False)
+
+    def test_float32_round_trip_is_exact(self):
+        prices32 = self.prices.astype(np.float32)
+        with option_context(dtype="float32"):
+            store = PriceStore.create(self.path, prices32)
+            store.append(prices32.iloc[-5:].set_axis(prices32.index[-5:] + pd.Timedelta(days=30), axis=0))
+        reopened = PriceStore(self.path)
+        self.assertEqual(reopened.dtype, np.float32)
+        frame = reopened.frame(end=prices32.index[-1])
+        pd.testing.assert_frame_equal(frame, prices32, check_freq=False, check_exact=True)
+        self.assertTrue(np.shares_memory(frame.to_numpy(), reopened.values))
+        np.testing.assert_array_equal(reopened.values[-5:], prices32.to_numpy()[-5:])
+        # A float64 store keeps full precision whatever the option says
+        with option_context(dtype="float32"):
+            full = PriceStore.create(f"{self.tmp.name}/full", self.prices, dtype="float64")
+        pd.testing.assert_frame_equal(full.frame(), self.prices, check_freq=False, check_exact=True)
+
+    def test_timezone_preserved(self):
+        prices = self.prices.tz_localize("America/New_York")
+        store = PriceStore.create(self.path, prices)
+        pd.testing.assert_frame_equal(store.frame(), prices, check_freq=False)
+        self.assertEqual(len(store.frame("2024-01-02", "2024-01-03")), 2)
+
+    def test_invalid_input(self):
+        with self.assertRaises(InvalidInputError):
+            PriceStore(self.path)
+        store = PriceStore.create(self.path, self.prices)
+        with self.assertRaises(InvalidInputError):
+            PriceStore.create(self.path, self.prices)
+        with self.assertRaises(InvalidInputError):
+            store.append(self.prices.iloc[-5:])
+        with self.assertRaises(InvalidInputError):
+            store.ticker("TSLA")
+        later = pd.DataFrame({"TSLA": [1.0]}, index=[pd.Timestamp("2025-01-01")])
+        with self.assertRaises(InvalidInputError):
+            store.append(later)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from stockscope.exceptions import InvalidInputError
+from stockscope.fetch import get_prices
+from stockscope.indicators import daily_returns, ema, sma
+from stockscope.providers import LocalFileProvider, write_local_mirror
+from stockscope.risk import max_drawdown, volatility
+from stockscope.streaming import EMA, Drawdown, Overlap, StreamOp, Volatility, read_output, run_stream, split_frame, ticker_chunks, time_chunks
+
+
+class TestStreaming(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(1)
+        idx = pd.bdate_range("2023-01-02", periods=300)
+        values = 100 * np.cumprod(1 + rng.normal(0.0003, 0.02, (300, 40)), axis=0)
+        self.prices = pd.DataFrame(values, index=idx, columns=[f"T{i:02d}" for i in range(40)])
+        self.prices.iloc[50:55, 3] = np.nan
+        self.prices.iloc[:20, 7] = np.nan
+
+    def _ops(self):
+        return {
+            "returns": Overlap(daily_returns, 1),
+            "sma": Overlap(lambda p: sma(p, 20), 19),
+            "ema": EMA(10),
+            "drawdown": Drawdown(),
+            "vol": Volatility(),
+        }
+
+    def _check(self, paths):
+        pd.testing.assert_frame_equal(read_output(paths["returns"]), daily_returns(self.prices), check_freq=False)
+        pd.testing.assert_frame_equal(read_output(paths["sma"]), sma(self.prices, 20), check_freq=False)
+        np.testing.assert_allclose(read_output(paths["ema"]), ema(self.prices, 10), rtol=1e-10)
+        np.testing.assert_allclose(read_output(paths["drawdown"]), max_drawdown(self.prices))
+        np.testing.assert_allclose(read_output(paths["drawdown_summary"]).iloc[:, 0], max_drawdown(self.prices).min())
+        np.testing.assert_allclose(read_output(paths["vol"]).iloc[:, 0], volatility(daily_returns(self.prices)))
+
+    def test_time_chunks_match_in_memory(self):
+        for fmt in ("parquet", "npz"):
+            with tempfile.TemporaryDirectory() as d:
+                paths = run_stream(split_frame(self.prices, "time", 37), self._ops(), d, by="time", fmt=fmt)
+                self._check(paths)
+
+    def test_ticker_chunks_match_in_memory(self):
+        with tempfile.TemporaryDirectory() as d:
+            ops = dict(self._ops(), sma_last=lambda p: sma(p, 5).iloc[-1])
+            paths = run_stream(split_frame(self.prices, "tickers", 7), ops, d, by="tickers", fmt="npz")
+            self._check(paths)
+            pd.testing.assert_series_equal(read_output(paths["sma_last"]).iloc[:, 0], sma(self.prices, 5).iloc[-1], check_names=False)
+
+    def test_chunk_sources_from_provider(self):
+        tickers = list(self.prices.columns[:5])
+        with tempfile.TemporaryDirectory() as d:
+            write_local_mirror({"Close": self.prices[tickers]}, d, fmt="parquet")
+            provider = LocalFileProvider(d)
+            full = get_prices(tickers, "2023-01-01", "2024-01-01", price_field="Close", provider=provider)
+            by_time = list(time_chunks(tickers, "2023-01-01", "2024-01-01", price_field="Close", freq="MS", provider=provider))
+            by_ticker = list(ticker_chunks(tickers, "2023-01-01", "2024-01-01", price_field="Close", chunk_size=2, provider=provider))
+        self.assertEqual(len(by_time), 12)
+        self.assertEqual(len(by_ticker), 3)
+        pd.testing.assert_frame_equal(pd.concat(by_time), full, check_freq=False)
+        pd.testing.assert_frame_equal(pd.concat(by_ticker, axis=1), full, check_freq=False)
+
+    def test_rerun_replaces_previous_output(self):
+        with tempfile.TemporaryDirectory() as d:
+            run_stream(split_frame(self.prices, "time", 20), self._ops(), d, by="time")
+            short = self.prices.iloc[:100]
+            ops = {"vol": Volatility(), "dd": Drawdown(), "sma": Overlap(lambda p: sma(p, 20), 19)}
+            paths = run_stream(split_frame(short, "time", 50), ops, d)
+            self.assertEqual(sorted(os.listdir(d)), ["dd", "dd_summary", "drawdown", "drawdown_summary", "ema", "returns", "sma", "vol"])
+            self.assertEqual(sorted(os.listdir(paths["sma"])), ["_parts.json", "part-00000.parquet", "part-00001.parquet"])
+            pd.testing.assert_frame_equal(read_output(paths["sma"]), sma(short, 20), check_freq=False)
+            np.testing.assert_allclose(read_output(paths["vol"]).iloc[:, 0], volatility(daily_returns(short)))
+
+    def test_invalid_input(self):
+        with tempfile.TemporaryDirectory() as d:
+            with self.assertRaises(InvalidInputError):
+                run_stream(split_frame(self.prices), {"f": daily_returns}, d, by="time")
+            with self.assertRaises(InvalidInputError):
+                run_stream(split_frame(self.prices), {"ema": EMA(5)}, d, by="rows")
+            with self.assertRaises(InvalidInputError):
+                read_output(d)
+        with self.assertRaises(InvalidInputError):
+            Overlap(daily_returns, -1)
+        with self.assertRaises(TypeError):
+            type("NoStep", (StreamOp,), {})()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+from statistics import NormalDist
+
+import numpy as np
+import pandas as pd
+
+from stockscope.risk import value_at_risk
+from stockscope.tailrisk import parametric_var, expected_shortfall, monte_carlo_var
+from stockscope.exceptions import InvalidInputError
+
+
+class TestTailRisk(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(3)
+        idx = pd.date_range("2020-01-01", periods=1000, freq="D")
+        cov = np.array([[1.0, 0.5, 0.2], [0.5, 1.0, 0.3], [0.2, 0.3, 1.0]]) * 1e-4
+        self.rets = pd.DataFrame(rng.multivariate_normal([0.0005] * 3, cov, 1000), index=idx, columns=["A", "B", "C"])
+
+    def test_parametric_var(self):
+        r = self.rets["A"]
+        expected = r.mean() + NormalDist().inv_cdf(0.05) * r.std()
+        self.assertAlmostEqual(parametric_var(r, 0.05), expected, places=12)
+        cf = parametric_var(self.rets, 0.05, method="cornish-fisher")
+        self.assertEqual(list(cf.index), ["A", "B", "C"])
+        self.assertAlmostEqual(cf["A"], expected, places=3)
+
+    def test_expected_shortfall(self):
+        r = self.rets["B"]
+        es = expected_shortfall(r, 0.05)
+        self.assertLess(es, value_at_risk(r, 0.05))
+        self.assertAlmostEqual(es, expected_shortfall(r, 0.05, method="gaussian"), places=3)
+
+    def test_monte_carlo_reproducible_across_chunking_and_jobs(self):
+        w = {"A": 0.5, "B": 0.3, "C": 0.2}
+        a = monte_carlo_var(self.rets, w, n_paths=20_000, chunk_size=5_000, seed=42)
+        b = monte_carlo_var(self.rets, w, n_paths=20_000, chunk_size=5_000, seed=42, n_jobs=2)
+        self.assertEqual(a.var, b.var)
+        self.assertEqual(a.expected_shortfall, b.expected_shortfall)
+        # Other chunkings draw other streams but must estimate the same quantity (one chunk is ragged)
+        for chunk_size in (3_000, 20_000):
+            c = monte_carlo_var(self.rets, w, n_paths=20_000, chunk_size=chunk_size, seed=42, n_jobs=2)
+            self.assertEqual(c.var, monte_carlo_var(self.rets, w, n_paths=20_000, chunk_size=chunk_size, seed=42).var)
+            self.assertAlmostEqual(c.var, a.var, places=3)
+        self.assertLess(a.expected_shortfall, a.var)
+        port = self.rets @ pd.Series(w)
+        self.assertAlmostEqual(a.var, parametric_var(port, 0.05), places=3)
+
+    def test_monte_carlo_covariance_inputs(self):
+        w = {"C": 0.2, "A": 0.5, "B": 0.3}
+        cov = self.rets.cov()
+        a = monte_carlo_var(self.rets, w, n_paths=5_000, seed=1, cov=cov)
+        b = monte_carlo_var(self.rets, w, n_paths=5_000, seed=1, cov=cov.loc[list(w), list(w)].to_numpy())
+        self.assertEqual(a.var, b.var)
+        with self.assertRaises(InvalidInputError):
+            monte_carlo_var(self.rets, w, cov=cov.to_numpy()[:2, :2])
+        with self.assertRaises(InvalidInputError):
+            monte_carlo_var(self.rets, w, cov=cov.drop(index="C", columns="C"))
+        with self.assertRaises(InvalidInputError):
+            monte_carlo_var(self.rets, w, cov=cov.to_numpy().tolist())
+
+    def test_invalid_inputs(self):
+        with self.assertRaises(InvalidInputError):
+            parametric_var(self.rets["A"], method="t")
+        with self.assertRaises(InvalidInputError):
+            monte_carlo_var(self.rets, {"ZZZ": 1.0})
+
+
+if __name__ == "__main__":
+    unittest.main()